@@ -19,6 +19,7 @@ from app.models.project import Project
 from app.models.project_member import ProjectMember
 from app.models.issue import Issue
 from app.models.comment import Comment
+from app.models.project_issue_stats import ProjectIssueStats
 
 # Alembic Config object
 config = context.config
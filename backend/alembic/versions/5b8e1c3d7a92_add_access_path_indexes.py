@@ -0,0 +1,42 @@
+"""add access path indexes
+
+Revision ID: 5b8e1c3d7a92
+Revises: 2a4c6d8e9f10
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e1c3d7a92"
+down_revision: Union[str, Sequence[str], None] = "2a4c6d8e9f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_issues_project_id_status_created_at",
+        "issues",
+        ["project_id", "status", "created_at"],
+        unique=False,
+    )
+    op.create_index("ix_issues_project_id_priority", "issues", ["project_id", "priority"], unique=False)
+    op.create_index("ix_issues_project_id_created_at", "issues", ["project_id", "created_at"], unique=False)
+    op.create_index("ix_issues_project_id_assignee_id", "issues", ["project_id", "assignee_id"], unique=False)
+    op.create_index("ix_comments_issue_id_created_at", "comments", ["issue_id", "created_at"], unique=False)
+    op.create_index("ix_project_members_user_id", "project_members", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_project_members_user_id", table_name="project_members")
+    op.drop_index("ix_comments_issue_id_created_at", table_name="comments")
+    op.drop_index("ix_issues_project_id_assignee_id", table_name="issues")
+    op.drop_index("ix_issues_project_id_created_at", table_name="issues")
+    op.drop_index("ix_issues_project_id_priority", table_name="issues")
+    op.drop_index("ix_issues_project_id_status_created_at", table_name="issues")
@@ -0,0 +1,72 @@
+"""add issue search vector
+
+Revision ID: 9c2f4a6b8d13
+Revises: 5b8e1c3d7a92
+Create Date: 2026-10-18 00:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c2f4a6b8d13"
+down_revision: Union[str, Sequence[str], None] = "5b8e1c3d7a92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({row}description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "issues",
+        sa.Column("search_vector", sa.Text().with_variant(postgresql.TSVECTOR(), "postgresql"), nullable=True),
+    )
+    op.create_index(
+        "ix_issues_search_vector",
+        "issues",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    # Other dialects fall back to LIKE matching in issues_dao and leave the column empty.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(f"UPDATE issues SET search_vector = {SEARCH_DOCUMENT.format(row='')}")
+    op.execute(
+        f"""
+        CREATE FUNCTION issues_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_DOCUMENT.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, description ON issues
+        FOR EACH ROW EXECUTE FUNCTION issues_search_vector_update()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS issues_search_vector_update ON issues")
+        op.execute("DROP FUNCTION IF EXISTS issues_search_vector_update()")
+    op.drop_index("ix_issues_search_vector", table_name="issues")
+    op.drop_column("issues", "search_vector")
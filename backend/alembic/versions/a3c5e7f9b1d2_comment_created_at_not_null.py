@@ -0,0 +1,48 @@
+"""make comments.created_at not null
+
+Revision ID: a3c5e7f9b1d2
+Revises: e6f1b2c4d8a0
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c5e7f9b1d2"
+down_revision: Union[str, Sequence[str], None] = "e6f1b2c4d8a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The comment thread keyset compares created_at, so every row needs one.
+    # A comment cannot predate its issue, which makes the issue's timestamp the
+    # closest safe stand-in.
+    op.execute(
+        "UPDATE comments SET created_at = COALESCE("
+        "(SELECT issues.created_at FROM issues WHERE issues.id = comments.issue_id), CURRENT_TIMESTAMP"
+        ") WHERE created_at IS NULL"
+    )
+    with op.batch_alter_table("comments") as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("comments") as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            nullable=True,
+            server_default=None,
+        )
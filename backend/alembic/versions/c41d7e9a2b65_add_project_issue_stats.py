@@ -0,0 +1,46 @@
+"""add project issue stats
+
+Revision ID: c41d7e9a2b65
+Revises: 9c2f4a6b8d13
+Create Date: 2026-10-18 00:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d7e9a2b65"
+down_revision: Union[str, Sequence[str], None] = "9c2f4a6b8d13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    issue_status_enum = postgresql.ENUM(
+        "open", "in_progress", "resolved", "closed", name="issue_status_enum", create_type=False
+    )
+
+    op.create_table(
+        "project_issue_stats",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("status", issue_status_enum, nullable=False),
+        sa.Column("issue_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "status"),
+    )
+    op.execute(
+        """
+        INSERT INTO project_issue_stats (project_id, status, issue_count)
+        SELECT project_id, status, COUNT(*) FROM issues GROUP BY project_id, status
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("project_issue_stats")
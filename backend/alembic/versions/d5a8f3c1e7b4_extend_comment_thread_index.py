@@ -0,0 +1,34 @@
+"""extend comment thread index
+
+Revision ID: d5a8f3c1e7b4
+Revises: c41d7e9a2b65
+Create Date: 2026-10-18 00:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a8f3c1e7b4"
+down_revision: Union[str, Sequence[str], None] = "c41d7e9a2b65"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_comments_issue_id_created_at_id",
+        "comments",
+        ["issue_id", "created_at", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_comments_issue_id_created_at", table_name="comments")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_comments_issue_id_created_at", "comments", ["issue_id", "created_at"], unique=False)
+    op.drop_index("ix_comments_issue_id_created_at_id", table_name="comments")
@@ -0,0 +1,42 @@
+"""make issues.created_at not null
+
+Revision ID: e6f1b2c4d8a0
+Revises: d5a8f3c1e7b4
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f1b2c4d8a0"
+down_revision: Union[str, Sequence[str], None] = "d5a8f3c1e7b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset cursors for sort=created_at need a value on every row.
+    op.execute("UPDATE issues SET created_at = COALESCE(updated_at, CURRENT_TIMESTAMP) WHERE created_at IS NULL")
+    op.alter_column(
+        "issues",
+        "created_at",
+        existing_type=sa.DateTime(),
+        nullable=False,
+        server_default=sa.text("CURRENT_TIMESTAMP"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "issues",
+        "created_at",
+        existing_type=sa.DateTime(),
+        nullable=True,
+        server_default=None,
+    )
@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends, status, HTTPException, Request
-from sqlalchemy.orm import Session
 
-from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin
-from app.core.dependencies import get_current_user, get_db
+from app.core.dependencies import CurrentUser, get_current_user, get_db
+from app.db.session import Database
 from app.services import auth_service
 
 router = APIRouter()
@@ -13,15 +12,15 @@ router = APIRouter()
 # SIGNUP
 # ------------------------
 @router.post("/signup", status_code=status.HTTP_201_CREATED)
-def signup(user: UserCreate, db: Session = Depends(get_db)):
-    return auth_service.signup(db, user.name, user.email, user.password)
+async def signup(user: UserCreate, db: Database = Depends(get_db)):
+    return await auth_service.signup(db, user.name, user.email, user.password)
 
 
 # ------------------------
 # LOGIN
 # ------------------------
 @router.post("/login")
-async def login(request: Request, db: Session = Depends(get_db)):
+async def login(request: Request, db: Database = Depends(get_db)):
     content_type = request.headers.get("content-type", "")
 
     # Supports assignment example contract: JSON {email,password}
@@ -31,7 +30,7 @@ async def login(request: Request, db: Session = Depends(get_db)):
             model = UserLogin(**payload)
         except Exception:
             raise HTTPException(status_code=422, detail="Invalid login payload")
-        return auth_service.login(db, model.email, model.password)
+        return await auth_service.login(db, model.email, model.password)
 
     # Also supports OAuth2 form (username/password)
     form = await request.form()
@@ -39,10 +38,10 @@ async def login(request: Request, db: Session = Depends(get_db)):
     password = form.get("password")
     if not username or not password:
         raise HTTPException(status_code=422, detail="Invalid login payload")
-    return auth_service.login(db, username, password)
+    return await auth_service.login(db, username, password)
 
 
 @router.post("/logout")
-def logout(current_user: User = Depends(get_current_user)):
+async def logout(current_user: CurrentUser = Depends(get_current_user)):
     # JWT is stateless; client should delete token after successful call.
     return {"message": "Logged out successfully"}
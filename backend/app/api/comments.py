@@ -1,28 +1,50 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request, Response
+from datetime import datetime
+from typing import Optional
 
-from app.core.dependencies import get_current_user, get_db
-from app.models.user import User
-from app.schemas.comment import CommentCreate
+from app.core.conditional import conditional_get
+from app.core.dependencies import CurrentUser, get_current_user, get_db
+from app.db.session import Database
+from app.schemas.comment import CommentCreate, CommentCreated, CommentOut
 from app.services import comments_service
 
 router = APIRouter()
 
 
-@router.post("/issues/{issue_id}/comments")
-def add_comment(
+@router.post("/issues/{issue_id}/comments", response_model=CommentCreated)
+async def add_comment(
     issue_id: int,
     comment: CommentCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    return comments_service.add_comment(db, issue_id, comment.body, current_user.id)
+    return await db.run(comments_service.add_comment, issue_id, comment.body, current_user.id)
 
 
-@router.get("/issues/{issue_id}/comments")
-def list_comments(
+@router.get("/issues/{issue_id}/comments", response_model=list[CommentOut])
+async def list_comments(
     issue_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    after_id: Optional[int] = Query(None),
+    since: Optional[datetime] = Query(None),
+    limit: int = Query(100, ge=1, le=500),
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    return comments_service.list_comments(db, issue_id, current_user.id)
+    page_args = {"after_id": after_id, "since": since, "limit": limit}
+    page = await conditional_get(
+        request,
+        response,
+        db,
+        version=lambda session: comments_service.get_comments_version(
+            session, issue_id, current_user.id, **page_args
+        ),
+        build=lambda session: comments_service.list_comments(session, issue_id, current_user.id, **page_args),
+    )
+    if isinstance(page, Response):
+        return page
+    # The body stays a plain list; the next page starts after the id in this header.
+    if page["next_after_id"] is not None:
+        response.headers["X-Next-After-Id"] = str(page["next_after_id"])
+    return page["data"]
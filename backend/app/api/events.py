@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from app.core import events
+from app.core.config import EVENTS_HEARTBEAT_SECONDS, EVENTS_TICKET_TTL_SECONDS
+from app.core.dependencies import CurrentUser, get_current_user, get_db, get_stream_user
+from app.core.security import create_stream_ticket
+from app.db.session import Database
+from app.services import projects_service
+
+router = APIRouter()
+
+
+async def _event_stream(request: Request, project_id: int):
+    with events.get_broker().subscribe(project_id) as subscription:
+        # Tells EventSource how long to wait before reconnecting after a dropped connection.
+        yield b"retry: 3000\n\n"
+        while not await request.is_disconnected():
+            event = await subscription.get(timeout=EVENTS_HEARTBEAT_SECONDS)
+            if subscription.overflowed:
+                # The client fell behind and missed events; it has to refetch instead of patching.
+                subscription.drain()
+                yield b"event: resync\ndata: {}\n\n"
+            elif event is not None:
+                yield events.format_sse(event)
+            else:
+                yield b": keep-alive\n\n"
+
+
+# ---------------------------------------
+# Project Change Feed (Server-Sent Events)
+# ---------------------------------------
+
+@router.post("/projects/{project_id}/events/ticket")
+async def project_events_ticket(
+    project_id: int,
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    await db.run(projects_service.authorize_project_stream, project_id, current_user.id)
+    return {
+        "ticket": create_stream_ticket(current_user.email, project_id),
+        "expires_in": EVENTS_TICKET_TTL_SECONDS,
+    }
+
+
+@router.get("/projects/{project_id}/events")
+async def project_events(
+    project_id: int,
+    request: Request,
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_stream_user)
+):
+    await db.run(projects_service.authorize_project_stream, project_id, current_user.id)
+    return StreamingResponse(
+        _event_stream(request, project_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
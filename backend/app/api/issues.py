@@ -1,11 +1,22 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from typing import Optional
-
-from app.core.dependencies import get_current_user, get_db
-from app.models.user import User
-from app.schemas.issue import IssueCreate, IssueUpdate
-from app.services import issues_service
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
+from typing import Literal, Optional
+
+from app.core.conditional import conditional_get
+from app.core.dependencies import CurrentUser, get_current_user, get_db
+from app.db.session import Database
+from app.schemas.issue import (
+    IssueBatchCreate,
+    IssueBatchDelete,
+    IssueBatchUpdate,
+    IssueCreate,
+    IssueCursorPage,
+    IssueDetailBundle,
+    IssueListPage,
+    IssueOut,
+    IssueUpdate,
+)
+from app.services import import_service, issues_service, projects_service
 
 router = APIRouter()
 
@@ -14,22 +25,54 @@ router = APIRouter()
 # Create Issue
 # ---------------------------------------
 
-@router.post("/projects/{project_id}/issues")
-def create_issue(
+@router.post("/projects/{project_id}/issues", response_model=IssueOut)
+async def create_issue(
     project_id: int,
     issue: IssueCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    return issues_service.create_issue(db, project_id, issue, current_user.id)
+    return await db.run(issues_service.create_issue, project_id, issue, current_user.id)
+
+
+# ---------------------------------------
+# Batch Create / Update / Delete
+# ---------------------------------------
+
+@router.post("/projects/{project_id}/issues:batch")
+async def create_issues(
+    project_id: int,
+    batch: IssueBatchCreate,
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    return await db.run(issues_service.create_issues, project_id, batch.items, current_user.id)
+
+
+@router.patch("/issues:batch")
+async def update_issues(
+    batch: IssueBatchUpdate,
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    return await db.run(issues_service.update_issues, batch.items, current_user.id)
+
+
+@router.post("/issues:batchDelete")
+async def delete_issues(
+    batch: IssueBatchDelete,
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    return await db.run(issues_service.delete_issues, batch.ids, current_user.id)
 
 
 # ---------------------------------------
 # List Issues (with filters + pagination)
 # ---------------------------------------
 
-@router.get("/projects/{project_id}/issues")
-def list_issues(
+@router.get("/projects/{project_id}/issues", response_model=IssueListPage | IssueCursorPage)
+async def list_issues(
     project_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
@@ -39,11 +82,28 @@ def list_issues(
     assignee_id: Optional[int] = Query(None),
     q: Optional[str] = Query(None),
     sort: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    pagination: Literal["offset", "cursor"] = Query("offset"),
+    cursor: Optional[str] = Query(None),
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    return issues_service.list_issues(
-        db=db,
+    # Cursor mode skips the total count and pages by (sort key, id) instead of OFFSET.
+    if pagination == "cursor" or cursor is not None:
+        return await db.run(
+            issues_service.list_issues_by_cursor,
+            project_id=project_id,
+            cursor=cursor,
+            page_size=page_size,
+            status=status,
+            priority=priority,
+            assignee=assignee if assignee is not None else assignee_id,
+            q=q,
+            sort=sort,
+            current_user_id=current_user.id,
+        )
+
+    return await db.run(
+        issues_service.list_issues,
         project_id=project_id,
         page=page,
         page_size=page_size,
@@ -56,18 +116,64 @@ def list_issues(
     )
 
 
+# ---------------------------------------
+# Export Issues (streamed CSV / NDJSON)
+# ---------------------------------------
+
+EXPORT_MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+@router.get("/projects/{project_id}/issues/export")
+async def export_issues(
+    project_id: int,
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    await db.run(projects_service.authorize_project_stream, project_id, current_user.id)
+    # A sync iterator: Starlette pulls each chunk in the threadpool, keeping DB reads off the event loop.
+    return StreamingResponse(
+        issues_service.stream_issue_export(project_id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}-issues.{format}"'},
+    )
+
+
+# ---------------------------------------
+# Import Issues + Comments (CSV / NDJSON)
+# ---------------------------------------
+
+@router.post("/projects/{project_id}/import")
+async def import_issues(
+    project_id: int,
+    issues: UploadFile = File(...),
+    comments: Optional[UploadFile] = File(None),
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    return await import_service.import_into_project(
+        db,
+        project_id,
+        current_user.id,
+        issues.file,
+        comments.file if comments is not None else None,
+        format,
+    )
+
+
 # ---------------------------------------
 # Update Issue (DOCUMENT-ALIGNED ROLES)
 # ---------------------------------------
 
-@router.patch("/issues/{issue_id}")
-def update_issue(
+@router.patch("/issues/{issue_id}", response_model=IssueOut)
+async def update_issue(
     issue_id: int,
     issue_update: IssueUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    return issues_service.update_issue(db, issue_id, issue_update, current_user.id)
+    return await db.run(issues_service.update_issue, issue_id, issue_update, current_user.id)
 
 
 # ---------------------------------------
@@ -75,22 +181,46 @@ def update_issue(
 # ---------------------------------------
 
 @router.delete("/issues/{issue_id}")
-def delete_issue(
+async def delete_issue(
     issue_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    return issues_service.delete_issue(db, issue_id, current_user.id)
+    return await db.run(issues_service.delete_issue, issue_id, current_user.id)
 
 
 # ---------------------------------------
 # Issue Detail
 # ---------------------------------------
 
-@router.get("/issues/{issue_id}")
-def get_issue_detail(
+@router.get("/issues/{issue_id}", response_model=IssueDetailBundle, response_model_exclude_unset=True)
+async def get_issue_detail(
     issue_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    include: Optional[str] = Query(None, description="Comma-separated: comments, members, viewer"),
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    return issues_service.get_issue_detail(db, issue_id, current_user.id)
+    includes = issues_service.parse_issue_includes(include)
+    if not includes:
+        return await conditional_get(
+            request,
+            response,
+            db,
+            version=lambda session: issues_service.get_issue_version(session, issue_id, current_user.id),
+            build=lambda session: issues_service.get_issue_detail(session, issue_id, current_user.id),
+        )
+
+    # Everything the issue page needs, behind a single auth, membership check and DB session.
+    return await conditional_get(
+        request,
+        response,
+        db,
+        version=lambda session: issues_service.get_issue_bundle_version(
+            session, issue_id, current_user.id, includes
+        ),
+        build=lambda session: issues_service.get_issue_bundle(
+            session, issue_id, current_user.id, current_user.name, current_user.email, includes
+        ),
+    )
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends
+
+from app.core.dependencies import CurrentUser, get_current_user
+from app.core.events import get_broker
+from app.core.tokens import token_cache_stats
+from app.core.user_cache import user_cache_stats
+from app.db.session import pool_stats
+from app.services.membership_service import membership_cache_stats, role_summary_cache_stats
+
+router = APIRouter()
+
+
+# ------------------------
+# In-process counters
+# ------------------------
+@router.get("")
+def metrics(current_user: CurrentUser = Depends(get_current_user)):
+    return {
+        "token_cache": token_cache_stats(),
+        "user_cache": user_cache_stats(),
+        "membership_cache": membership_cache_stats(),
+        "role_summary_cache": role_summary_cache_stats(),
+        "db_pool": pool_stats(),
+        "events": get_broker().stats(),
+    }
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from typing import cast
+from fastapi import APIRouter, Depends, Query, Request, Response
+from typing import Literal, Optional, cast
 
-from app.core.dependencies import get_current_user, get_db
-from app.models.user import User
-from app.schemas.project import ProjectCreate, AddMemberRequest
+from app.core.conditional import conditional_get
+from app.core.dependencies import CurrentUser, get_current_user, get_db
+from app.db.session import Database
+from app.schemas.project import (
+    AddMemberRequest,
+    ProjectCreate,
+    ProjectIssueStatsOut,
+    ProjectListItem,
+    ProjectMemberOut,
+    ProjectOut,
+)
 from app.services import projects_service
 
 router = APIRouter()
@@ -13,15 +20,15 @@ router = APIRouter()
 # -----------------------------
 # Create Project
 # -----------------------------
-@router.post("/")
-def create_project(
+@router.post("/", response_model=ProjectOut)
+async def create_project(
     project: ProjectCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     current_user_id = cast(int, current_user.id)
-    return projects_service.create_project(
-        db=db,
+    return await db.run(
+        projects_service.create_project,
         name=project.name,
         key=project.key,
         description=project.description,
@@ -33,28 +40,57 @@ def create_project(
 # -----------------------------
 # List Projects (only joined)
 # -----------------------------
-@router.get("/")
-def list_projects(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+@router.get("/", response_model=list[ProjectListItem])
+async def list_projects(
+    request: Request,
+    response: Response,
+    sort: Literal["name", "key", "created_at", "open_issues", "total_issues"] = Query("name"),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     current_user_id = cast(int, current_user.id)
-    return projects_service.list_projects(db, current_user_id)
+    page_args = {"sort": sort, "limit": limit, "offset": offset}
+    page = await conditional_get(
+        request,
+        response,
+        db,
+        version=lambda session: projects_service.get_projects_version(session, current_user_id, **page_args),
+        build=lambda session: projects_service.list_projects(session, current_user_id, **page_args),
+    )
+    if isinstance(page, Response):
+        return page
+    if page["next_offset"] is not None:
+        response.headers["X-Next-Offset"] = str(page["next_offset"])
+    return page["data"]
+
+
+# -----------------------------
+# Issue Counts per Project/Status
+# -----------------------------
+@router.get("/stats", response_model=list[ProjectIssueStatsOut])
+async def list_project_issue_stats(
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    current_user_id = cast(int, current_user.id)
+    return await db.run(projects_service.list_project_issue_stats, current_user_id)
 
 
 # -----------------------------
 # Invite / Add Member by Email
 # -----------------------------
 @router.post("/{project_id}/members")
-def add_member_to_project(
+async def add_member_to_project(
     project_id: int,
     payload: AddMemberRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     current_user_id = cast(int, current_user.id)
-    return projects_service.add_member_to_project(
-        db=db,
+    return await db.run(
+        projects_service.add_member_to_project,
         project_id=project_id,
         request_user_id=current_user_id,
         email=payload.email,
@@ -65,24 +101,45 @@ def add_member_to_project(
 # -----------------------------
 # List Project Members
 # -----------------------------
-@router.get("/{project_id}/members")
-def list_project_members(
+@router.get("/{project_id}/members", response_model=list[ProjectMemberOut])
+async def list_project_members(
     project_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    q: Optional[str] = Query(None, description="Name or email prefix"),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     current_user_id = cast(int, current_user.id)
-    return projects_service.list_project_members(db, project_id, current_user_id)
+    page_args = {"q": q, "limit": limit, "offset": offset}
+    page = await conditional_get(
+        request,
+        response,
+        db,
+        version=lambda session: projects_service.get_members_version(
+            session, project_id, current_user_id, **page_args
+        ),
+        build=lambda session: projects_service.list_project_members(
+            session, project_id, current_user_id, **page_args
+        ),
+    )
+    if isinstance(page, Response):
+        return page
+    if page["next_offset"] is not None:
+        response.headers["X-Next-Offset"] = str(page["next_offset"])
+    return page["data"]
 
 
 # -----------------------------
 # Delete Project
 # -----------------------------
 @router.delete("/{project_id}")
-def delete_project(
+async def delete_project(
     project_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Database = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     current_user_id = cast(int, current_user.id)
-    return projects_service.delete_project(db, project_id, current_user_id)
+    return await db.run(projects_service.delete_project, project_id, current_user_id)
@@ -0,0 +1,92 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from app.db.session import Database
+
+
+@dataclass(frozen=True)
+class Version:
+    """Validators for one representation of a resource."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+
+def make_version(*parts: Any, last_modified: datetime | None = None) -> Version:
+    """Weak ETag over `parts`, which must identify everything the response body depends on."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return Version(etag=f'W/"{digest}"', last_modified=last_modified)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Timestamps are stored naive in UTC (datetime.utcnow defaults).
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_fresh(if_none_match: str | None, if_modified_since: str | None, version: Version) -> bool:
+    """Whether the client's cached copy still matches `version` (If-None-Match wins over If-Modified-Since)."""
+    if if_none_match:
+        if if_none_match.strip() == "*":
+            return True
+        candidates = {_opaque_tag(tag) for tag in if_none_match.split(",")}
+        return _opaque_tag(version.etag) in candidates
+
+    if if_modified_since and version.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # HTTP dates carry whole seconds only.
+        return _as_utc(version.last_modified).replace(microsecond=0) <= since
+
+    return False
+
+
+def validator_headers(version: Version) -> dict[str, str]:
+    headers = {"ETag": version.etag, "Cache-Control": "private, no-cache"}
+    if version.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(version.last_modified), usegmt=True)
+    return headers
+
+
+async def conditional_get(
+    request: Request,
+    response: Response,
+    db: Database,
+    version: Callable[[Session], Version],
+    build: Callable[[Session], Any],
+):
+    """
+    Run `version` and, unless the client's copy is still fresh, `build` in one database call.
+
+    `version` must do the endpoint's permission checks, so a 304 never leaks what a 403 would hide.
+    Returns a bare 304 response when fresh, otherwise the built payload with validators set on `response`.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+
+    def read(session: Session):
+        current = version(session)
+        if is_fresh(if_none_match, if_modified_since, current):
+            return current, True, None
+        return current, False, build(session)
+
+    current, fresh, payload = await db.run(read)
+    headers = validator_headers(current)
+    if fresh:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
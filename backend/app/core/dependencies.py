@@ -1,38 +1,78 @@
 from fastapi import Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from jose import JWTError, jwt
 from fastapi.security import OAuth2PasswordBearer
 
-from app.db.session import SessionLocal
-from app.models.user import User
+from app.dao import auth_dao
+from app.db.session import AsyncDatabase, AsyncSessionLocal, Database, SessionLocal, SyncDatabase
+from app.core.security import STREAM_TICKET_SCOPE
+from app.core.tokens import InvalidToken, verify_token
+from app.core.user_cache import CurrentUser, cache_user, get_cached_user
 
-from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.core.config import DB_MODE
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
 
-def get_db():
-    db = SessionLocal()
+async def get_db():
+    if DB_MODE == "async":
+        async with AsyncSessionLocal() as session:
+            yield AsyncDatabase(session)
+        return
+
+    session = SessionLocal()
     try:
-        yield db
+        yield SyncDatabase(session)
     finally:
-        db.close()
+        await run_in_threadpool(session.close)
+
+
+def _load_current_user(db: Session, email: str) -> CurrentUser | None:
+    user = auth_dao.get_user_by_email(db, email)
+    return cache_user(user) if user else None
 
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-):
+    db: Database = Depends(get_db)
+) -> CurrentUser:
+    return await _user_for_token(token, db)
+
+
+async def get_stream_user(
+    project_id: int,
+    ticket: str,
+    db: Database = Depends(get_db)
+) -> CurrentUser:
+    # Browsers' EventSource cannot send headers, so streams take a ticket from
+    # POST /projects/{id}/events/ticket in the query string instead of the access token.
+    return await _user_for_token(ticket, db, scope=STREAM_TICKET_SCOPE, project_id=project_id)
+
+
+async def _user_for_token(
+    token: str,
+    db: Database,
+    scope: str | None = None,
+    project_id: int | None = None
+) -> CurrentUser:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise HTTPException(status_code=401, detail="Invalid token")
-    except JWTError:
+        # Signature checked on first sight of a token; repeats are a hash lookup until it expires.
+        payload = verify_token(token)
+    except InvalidToken:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    email = payload.get("sub")
+    if email is None:
         raise HTTPException(status_code=401, detail="Invalid token")
+    # Access tokens carry no scope; a stream ticket only opens the stream it was issued for.
+    if payload.get("scope") != scope or (scope is not None and payload.get("project_id") != project_id):
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    cached = get_cached_user(email)
+    if cached is not None:
+        return cached
 
-    user = db.query(User).filter(User.email == email).first()
+    user = await db.run(_load_current_user, email)
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
 
@@ -0,0 +1,149 @@
+import asyncio
+import itertools
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+from app.core.config import EVENTS_QUEUE_SIZE
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    type: str
+    project_id: int
+    data: Any
+
+
+def format_sse(event: Event) -> bytes:
+    return (
+        f"id: {event.id}\nevent: {event.type}\ndata: ".encode()
+        + orjson.dumps(event.data)
+        + b"\n\n"
+    )
+
+
+class Subscription:
+    """One live listener on a project's events, consumed from the event loop it was created on."""
+
+    def __init__(self, broker: "EventBroker", project_id: int, queue_size: int):
+        self.broker = broker
+        self.project_id = project_id
+        self.loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=queue_size)
+        # Set when events were dropped because the client fell behind; it must refetch.
+        self.overflowed = False
+
+    def deliver(self, event: Event):
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.broker.dropped += 1
+
+    async def get(self, timeout: float) -> Event | None:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def drain(self):
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self.overflowed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.broker.unsubscribe(self)
+
+
+class EventBroker(ABC):
+    """Fans project events out to subscribers.
+
+    Services call `publish` after their transaction commits, from any thread. A broker that
+    spans workers (e.g. Postgres LISTEN/NOTIFY) implements `publish`, `subscribe` and
+    `unsubscribe`; install it with `set_broker`.
+    """
+
+    def __init__(self):
+        self.published = 0
+        self.dropped = 0
+
+    @abstractmethod
+    def publish(self, project_id: int, event_type: str, data: Any):
+        ...
+
+    @abstractmethod
+    def subscribe(self, project_id: int) -> Subscription:
+        ...
+
+    @abstractmethod
+    def unsubscribe(self, subscription: Subscription):
+        ...
+
+    def stats(self) -> dict:
+        return {"published": self.published, "dropped": self.dropped}
+
+
+class InProcessBroker(EventBroker):
+    """Delivers to subscribers of this process only."""
+
+    def __init__(self, queue_size: int = EVENTS_QUEUE_SIZE):
+        super().__init__()
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def publish(self, project_id: int, event_type: str, data: Any):
+        with self._lock:
+            event = Event(id=next(self._ids), type=event_type, project_id=project_id, data=data)
+            subscribers = list(self._subscribers.get(project_id, ()))
+            self.published += 1
+
+        for subscription in subscribers:
+            try:
+                # Publishers run in worker threads (sync DB mode) or on the loop itself (async mode).
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+
+    def subscribe(self, project_id: int) -> Subscription:
+        subscription = Subscription(self, project_id, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.project_id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscribers = sum(len(subscribers) for subscribers in self._subscribers.values())
+        return {"subscribers": subscribers, **super().stats()}
+
+
+_broker: EventBroker = InProcessBroker()
+
+
+def get_broker() -> EventBroker:
+    return _broker
+
+
+def set_broker(broker: EventBroker):
+    global _broker
+    _broker = broker
+
+
+def publish(project_id: int, event_type: str, data: Any):
+    _broker.publish(project_id, event_type, data)
@@ -0,0 +1,117 @@
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import orjson
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import SLOW_REQUEST_MAX_STATEMENTS, SLOW_REQUEST_MS
+
+logger = logging.getLogger("app.requests")
+
+
+@dataclass
+class RequestStats:
+    """SQL executed on behalf of one request."""
+
+    started: float = field(default_factory=time.perf_counter)
+    queries: int = 0
+    db_seconds: float = 0.0
+    statements: list[tuple[float, str]] = field(default_factory=list)
+
+    def record(self, statement: str, seconds: float):
+        self.queries += 1
+        self.db_seconds += seconds
+        if len(self.statements) < SLOW_REQUEST_MAX_STATEMENTS:
+            self.statements.append((seconds, statement))
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+
+# Copied into threadpool workers and AsyncSession.run_sync, so hooks on any thread find their request.
+_current_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _current_stats.get()
+
+
+def instrument_engine(sync_engine):
+    """Attribute every statement run on `sync_engine` to the request being served, if any."""
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_stats.get() is not None:
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        started = conn.info.get("query_started")
+        if stats is not None and started:
+            stats.record(statement, time.perf_counter() - started.pop())
+
+
+def server_timing(stats: RequestStats) -> str:
+    return (
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries", '
+        f"total;dur={stats.elapsed_ms():.1f}"
+    )
+
+
+class RequestTimingMiddleware:
+    """
+    Adds a `Server-Timing` header (DB time, query count, total time) to every HTTP response and
+    logs one structured line per request. Requests slower than SLOW_REQUEST_MS are logged as
+    warnings with the SQL they ran; event streams are exempt since they are open by design.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        response = {"status": 500, "stream": False}
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                headers = MutableHeaders(scope=message)
+                response["stream"] = headers.get("content-type", "").startswith("text/event-stream")
+                headers.append("Server-Timing", server_timing(stats))
+            await send(message)
+
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            self._log(scope, response["status"], response["stream"], stats)
+
+    @staticmethod
+    def _log(scope: Scope, status: int, stream: bool, stats: RequestStats):
+        total_ms = stats.elapsed_ms()
+        entry = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status,
+            "queries": stats.queries,
+            "db_ms": round(stats.db_seconds * 1000, 1),
+            "total_ms": round(total_ms, 1),
+        }
+        if SLOW_REQUEST_MS > 0 and total_ms >= SLOW_REQUEST_MS and not stream:
+            entry["sql"] = [
+                {"ms": round(seconds * 1000, 1), "statement": statement}
+                for seconds, statement in stats.statements
+            ]
+            logger.warning("slow request %s", orjson.dumps(entry).decode())
+        elif logger.isEnabledFor(logging.INFO):
+            logger.info("request %s", orjson.dumps(entry).decode())
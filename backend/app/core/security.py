@@ -1,10 +1,30 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from jose import jwt
-from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.core.tokens import encode_token
+from app.core.config import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    EVENTS_TICKET_TTL_SECONDS,
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_QUEUE_LIMIT,
+)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is deliberately slow, so it gets its own small pool instead of the event loop or
+# the shared request threadpool; the semaphore caps running + queued work.
+_password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+_password_slots = threading.BoundedSemaphore(PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_LIMIT)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing queue is full."""
+
 
 # Password Hashing
 
@@ -16,10 +36,41 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def _run_password_task(fn, *args):
+    if not _password_slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        future = _password_executor.submit(fn, *args)
+    except BaseException:
+        _password_slots.release()
+        raise
+    # Release on completion rather than on await, so cancelled requests still hold their slot.
+    future.add_done_callback(lambda _: _password_slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_password_task(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+
 # JWT Token Creation
 
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encode_token(to_encode)
+
+
+# Scope claim of stream tickets; bearer authentication refuses any token that carries a scope.
+STREAM_TICKET_SCOPE = "events"
+
+
+def create_stream_ticket(email: str, project_id: int) -> str:
+    """Short-lived token that opens one project's event stream and nothing else."""
+    expire = datetime.utcnow() + timedelta(seconds=EVENTS_TICKET_TTL_SECONDS)
+    return encode_token({"sub": email, "scope": STREAM_TICKET_SCOPE, "project_id": project_id, "exp": expire})
@@ -0,0 +1,78 @@
+import hashlib
+import time
+from typing import Any
+
+from app.core.cache import MISSING, TTLCache
+from app.core.config import ALGORITHM, JWT_BACKEND, SECRET_KEY, TOKEN_CACHE_MAX_SIZE, TOKEN_CACHE_TTL_SECONDS
+
+
+class InvalidToken(Exception):
+    """Raised for tokens that are malformed, badly signed or expired, whatever the JWT backend."""
+
+
+def _jose_backend():
+    from jose import JWTError, jwt
+
+    def encode(claims: dict) -> str:
+        return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+    def decode(token: str) -> dict:
+        try:
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError as exc:
+            raise InvalidToken(str(exc)) from exc
+
+    return encode, decode
+
+
+def _pyjwt_backend():
+    try:
+        import jwt
+    except ImportError as exc:
+        raise RuntimeError("JWT_BACKEND=pyjwt needs the PyJWT package (pip install PyJWT)") from exc
+
+    def encode(claims: dict) -> str:
+        return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+    def decode(token: str) -> dict:
+        try:
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except jwt.PyJWTError as exc:
+            raise InvalidToken(str(exc)) from exc
+
+    return encode, decode
+
+
+BACKENDS = {"jose": _jose_backend, "pyjwt": _pyjwt_backend}
+
+if JWT_BACKEND not in BACKENDS:
+    raise RuntimeError(f"Unknown JWT_BACKEND '{JWT_BACKEND}'; expected one of {', '.join(BACKENDS)}")
+
+encode_token, decode_token = BACKENDS[JWT_BACKEND]()
+
+# sha256(token) -> verified claims; entries never outlive the token's own `exp`.
+_verified_claims = TTLCache(max_size=TOKEN_CACHE_MAX_SIZE, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+
+def verify_token(token: str) -> dict[str, Any]:
+    """Claims of a valid token; the signature is checked once, then served from memory until expiry."""
+    key = hashlib.sha256(token.encode()).digest()
+    claims = _verified_claims.get(key)
+    if claims is not MISSING:
+        return claims
+
+    claims = decode_token(token)
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(TOKEN_CACHE_TTL_SECONDS, exp - time.time())
+        if ttl > 0:
+            _verified_claims.set(key, claims, ttl=ttl)
+    return claims
+
+
+def clear_token_cache() -> None:
+    _verified_claims.clear()
+
+
+def token_cache_stats() -> dict:
+    return _verified_claims.stats()
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+from sqlalchemy import event, inspect
+
+from app.core.cache import MISSING, TTLCache
+from app.core.config import USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """Detached identity of the authenticated user, safe to share across sessions and threads."""
+
+    id: int
+    name: str
+    email: str
+
+
+_users_by_email = TTLCache(max_size=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+
+def get_cached_user(email: str) -> CurrentUser | None:
+    user = _users_by_email.get(email)
+    return None if user is MISSING else user
+
+
+def cache_user(user: User) -> CurrentUser:
+    identity = CurrentUser(id=user.id, name=user.name, email=user.email)
+    _users_by_email.set(identity.email, identity)
+    return identity
+
+
+def invalidate_user(email: str) -> None:
+    _users_by_email.invalidate(email)
+
+
+def clear_user_cache() -> None:
+    _users_by_email.clear()
+
+
+def user_cache_stats() -> dict:
+    return _users_by_email.stats()
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_write(mapper, connection, target: User):
+    # Drop both the current and any previous email so a renamed subject never resolves to stale data.
+    invalidate_user(target.email)
+    for previous_email in inspect(target).attrs.email.history.deleted or ():
+        invalidate_user(previous_email)
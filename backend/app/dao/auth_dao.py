@@ -16,5 +16,7 @@ def create_user(db: Session, name: str, email: str, password_hash: str):
     return user
 
 
-def list_memberships_for_user(db: Session, user_id: int):
-    return db.query(ProjectMember).filter(ProjectMember.user_id == user_id).all()
+def list_project_roles_for_user(db: Session, user_id: int, limit: int, offset: int = 0):
+    return db.query(ProjectMember.project_id, ProjectMember.role).filter(
+        ProjectMember.user_id == user_id
+    ).order_by(ProjectMember.project_id).offset(offset).limit(limit).all()
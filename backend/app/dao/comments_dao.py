@@ -1,19 +1,14 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from app.models.comment import Comment
 from app.models.issue import Issue
-from app.models.project_member import ProjectMember
 
 
 def get_issue_by_id(db: Session, issue_id: int):
-    return db.query(Issue).filter(Issue.id == issue_id).first()
-
-
-def get_project_membership(db: Session, project_id: int, user_id: int):
-    return db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id
-    ).first()
+    return db.get(Issue, issue_id)
 
 
 def create_comment(db: Session, issue_id: int, author_id: int, body: str):
@@ -24,5 +19,44 @@ def create_comment(db: Session, issue_id: int, author_id: int, body: str):
     return comment
 
 
-def list_comments_by_issue(db: Session, issue_id: int):
-    return db.query(Comment).filter(Comment.issue_id == issue_id).all()
+def get_comment_in_issue(db: Session, issue_id: int, comment_id: int):
+    return db.query(Comment).filter(
+        Comment.issue_id == issue_id,
+        Comment.id == comment_id
+    ).first()
+
+
+def get_comment_thread_version(db: Session, issue_id: int):
+    """(count, max id, newest created_at) of an issue's comments; comments are append-only."""
+    return db.query(
+        func.count(Comment.id),
+        func.max(Comment.id),
+        func.max(Comment.created_at),
+    ).filter(Comment.issue_id == issue_id).one()
+
+
+def list_comments_by_issue(
+    db: Session,
+    issue_id: int,
+    after: Comment | None = None,
+    since: datetime | None = None,
+    limit: int | None = None
+):
+    """Comments of an issue in (created_at, id) order, optionally positioned after the comment `after`."""
+    query = db.query(Comment).filter(Comment.issue_id == issue_id)
+
+    if after is not None:
+        query = query.filter(or_(
+            Comment.created_at > after.created_at,
+            and_(Comment.created_at == after.created_at, Comment.id > after.id),
+        ))
+    if since is not None:
+        if since.tzinfo is not None:
+            # Stored naive in UTC, like datetime.utcnow() defaults.
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        query = query.filter(Comment.created_at > since)
+
+    query = query.order_by(Comment.created_at.asc(), Comment.id.asc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
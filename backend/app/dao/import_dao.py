@@ -0,0 +1,43 @@
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.comment import Comment
+from app.models.issue import Issue
+from app.models.project_member import ProjectMember
+from app.models.user import User
+
+
+def get_user_ids_by_emails(db: Session, emails: set[str]) -> dict[str, int]:
+    if not emails:
+        return {}
+    rows = db.query(User.email, User.id).filter(User.email.in_(emails)).all()
+    return {email: user_id for email, user_id in rows}
+
+
+def list_member_ids(db: Session, project_id: int) -> set[int]:
+    rows = db.query(ProjectMember.user_id).filter(ProjectMember.project_id == project_id).all()
+    return {user_id for (user_id,) in rows}
+
+
+def insert_members(db: Session, project_id: int, user_ids: list[int], role: str = "member"):
+    if user_ids:
+        db.execute(insert(ProjectMember), [
+            {"project_id": project_id, "user_id": user_id, "role": role} for user_id in user_ids
+        ])
+
+
+def insert_issues(db: Session, rows: list[dict]) -> list[int]:
+    """Multi-row INSERT ... RETURNING id; ids come back in input order. Does not commit."""
+    if not rows:
+        return []
+    result = db.execute(insert(Issue).returning(Issue.id, sort_by_parameter_order=True), rows)
+    return [issue_id for (issue_id,) in result]
+
+
+def insert_comments(db: Session, rows: list[dict]):
+    if rows:
+        db.execute(insert(Comment), rows)
+
+
+def commit(db: Session):
+    db.commit()
@@ -1,15 +1,67 @@
-from sqlalchemy.orm import Session
+import re
+from collections import Counter
 
-from app.models.issue import Issue
-from app.models.project_member import ProjectMember
+from sqlalchemy import and_, case, delete, func, insert, inspect, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, aliased
+
+from app.models.issue import Issue, IssueStatus
+from app.models.project_issue_stats import ProjectIssueStats
 from app.models.user import User
 
 
-def get_project_membership(db: Session, project_id: int, user_id: int):
-    return db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id
-    ).first()
+def adjust_issue_counts(db: Session, deltas: dict[tuple[int, IssueStatus], int]):
+    """Apply `(project_id, status) -> delta` changes to project_issue_stats in the current transaction."""
+    rows = [
+        {"project_id": project_id, "status": status, "issue_count": delta}
+        for (project_id, status), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+        stmt = dialect_insert(ProjectIssueStats)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProjectIssueStats.project_id, ProjectIssueStats.status],
+            set_={"issue_count": ProjectIssueStats.issue_count + stmt.excluded.issue_count},
+        )
+        db.execute(stmt, rows)
+        return
+
+    for row in rows:
+        updated = db.execute(
+            update(ProjectIssueStats)
+            .where(
+                ProjectIssueStats.project_id == row["project_id"],
+                ProjectIssueStats.status == row["status"],
+            )
+            .values(issue_count=ProjectIssueStats.issue_count + row["issue_count"])
+        )
+        if updated.rowcount == 0:
+            db.add(ProjectIssueStats(**row))
+
+
+def recompute_issue_counts(db: Session, project_ids: list[int] | None = None) -> int:
+    """Rebuild project_issue_stats from the issues table (all projects by default); returns rows written."""
+    counts = select(Issue.project_id, Issue.status, func.count(Issue.id)).group_by(Issue.project_id, Issue.status)
+    clear = delete(ProjectIssueStats)
+    if project_ids is not None:
+        counts = counts.where(Issue.project_id.in_(project_ids))
+        clear = clear.where(ProjectIssueStats.project_id.in_(project_ids))
+
+    db.execute(clear)
+    rows = [
+        {"project_id": project_id, "status": status, "issue_count": count}
+        for project_id, status, count in db.execute(counts)
+    ]
+    if rows:
+        db.execute(insert(ProjectIssueStats), rows)
+    db.commit()
+    return len(rows)
 
 
 def create_issue(
@@ -30,21 +82,75 @@ def create_issue(
         assignee_id=assignee_id
     )
     db.add(issue)
+    db.flush()
+    adjust_issue_counts(db, {(project_id, issue.status): 1})
     db.commit()
     db.refresh(issue)
     return issue
 
 
-def list_issues(
+def create_issues(db: Session, rows: list[dict]):
+    """Insert many issues in one statement and one transaction; returns their rows in input order."""
+    created = db.execute(
+        insert(Issue).returning(
+            Issue.id,
+            Issue.project_id,
+            Issue.title,
+            Issue.status,
+            Issue.priority,
+            Issue.reporter_id,
+            Issue.assignee_id,
+            sort_by_parameter_order=True,
+        ),
+        rows,
+    ).all()
+    adjust_issue_counts(db, Counter((row.project_id, row.status) for row in created))
+    db.commit()
+    return created
+
+
+# Keyset column and direction for each supported `sort`; `id` breaks ties.
+ISSUE_SORT_KEYS = {
+    None: (Issue.id, "asc"),
+    "created_at": (Issue.created_at, "desc"),
+    "priority": (Issue.priority, "asc"),
+    "status": (Issue.status, "asc"),
+}
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _issue_search(db: Session, q: str):
+    """Return `(filter, rank)` expressions matching every word of `q` as a prefix, or `(None, None)`."""
+    terms = re.findall(r"\w+", q)
+    if not terms:
+        return None, None
+
+    if db.get_bind().dialect.name == "postgresql":
+        tsquery = func.to_tsquery("english", " & ".join(f"{term}:*" for term in terms))
+        return Issue.search_vector.op("@@")(tsquery), func.ts_rank(Issue.search_vector, tsquery)
+
+    # Portable fallback (SQLite test runs): substring match on title or description, title hits rank higher.
+    matches = []
+    title_hits = []
+    for term in terms:
+        pattern = _like_pattern(term)
+        title_match = Issue.title.ilike(pattern, escape="\\")
+        matches.append(or_(title_match, Issue.description.ilike(pattern, escape="\\")))
+        title_hits.append(case((title_match, 1), else_=0))
+    return and_(*matches), sum(title_hits[1:], title_hits[0])
+
+
+def _filtered_issues_query(
     db: Session,
     project_id: int,
-    page: int,
-    page_size: int,
     status: str | None,
     priority: str | None,
     assignee_id: int | None,
     q: str | None,
-    sort: str | None
 ):
     query = db.query(Issue).filter(Issue.project_id == project_id)
 
@@ -54,8 +160,26 @@ def list_issues(
         query = query.filter(Issue.priority == priority)
     if assignee_id:
         query = query.filter(Issue.assignee_id == assignee_id)
+    rank = None
     if q:
-        query = query.filter(Issue.title.ilike(f"%{q}%"))
+        match, rank = _issue_search(db, q)
+        if match is not None:
+            query = query.filter(match)
+    return query, rank
+
+
+def list_issues(
+    db: Session,
+    project_id: int,
+    page: int,
+    page_size: int,
+    status: str | None,
+    priority: str | None,
+    assignee_id: int | None,
+    q: str | None,
+    sort: str | None
+):
+    query, rank = _filtered_issues_query(db, project_id, status, priority, assignee_id, q)
 
     if sort == "created_at":
         query = query.order_by(Issue.created_at.desc())
@@ -63,26 +187,208 @@ def list_issues(
         query = query.order_by(Issue.priority.asc())
     elif sort == "status":
         query = query.order_by(Issue.status.asc())
+    elif rank is not None:
+        query = query.order_by(rank.desc(), Issue.id.desc())
 
     total = query.count()
     issues = query.offset((page - 1) * page_size).limit(page_size).all()
     return issues, total
 
 
+def list_issues_keyset(
+    db: Session,
+    project_id: int,
+    page_size: int,
+    status: str | None,
+    priority: str | None,
+    assignee_id: int | None,
+    q: str | None,
+    sort: str | None,
+    after: tuple | None
+):
+    """Return up to `page_size + 1` issues positioned after the `(sort value, id)` pair `after`.
+
+    The extra row tells the caller whether another page exists without running a COUNT.
+    """
+    column, direction = ISSUE_SORT_KEYS[sort]
+    query, _ = _filtered_issues_query(db, project_id, status, priority, assignee_id, q)
+
+    if after is not None:
+        last_value, last_id = after
+        if column is Issue.id:
+            query = query.filter(Issue.id > last_id)
+        elif direction == "desc":
+            query = query.filter(or_(column < last_value, and_(column == last_value, Issue.id < last_id)))
+        else:
+            query = query.filter(or_(column > last_value, and_(column == last_value, Issue.id > last_id)))
+
+    if column is Issue.id:
+        query = query.order_by(Issue.id.asc())
+    elif direction == "desc":
+        query = query.order_by(column.desc(), Issue.id.desc())
+    else:
+        query = query.order_by(column.asc(), Issue.id.asc())
+
+    return query.limit(page_size + 1).all()
+
+
+# Column order of the export; names are resolved by joining users twice.
+EXPORT_COLUMNS = (
+    "id", "title", "description", "status", "priority",
+    "reporter_id", "reporter_name", "assignee_id", "assignee_name",
+    "created_at", "updated_at",
+)
+
+
+def iter_issue_export_rows(db: Session, project_id: int, batch_size: int = 1000):
+    """Every issue of a project in id order, fetched `batch_size` rows at a time from a server-side cursor."""
+    reporter = aliased(User)
+    assignee = aliased(User)
+    query = db.query(
+        Issue.id,
+        Issue.title,
+        Issue.description,
+        Issue.status,
+        Issue.priority,
+        Issue.reporter_id,
+        reporter.name,
+        Issue.assignee_id,
+        assignee.name,
+        Issue.created_at,
+        Issue.updated_at,
+    ).outerjoin(
+        reporter, reporter.id == Issue.reporter_id
+    ).outerjoin(
+        assignee, assignee.id == Issue.assignee_id
+    ).filter(
+        Issue.project_id == project_id
+    ).order_by(Issue.id)
+
+    # yield_per implies stream_results, i.e. a named cursor on PostgreSQL.
+    return query.yield_per(batch_size)
+
+
 def get_user_by_id(db: Session, user_id: int):
     return db.query(User).filter(User.id == user_id).first()
 
 
+def get_user_names_by_ids(db: Session, user_ids: set[int]):
+    if not user_ids:
+        return {}
+    rows = db.query(User.id, User.name).filter(User.id.in_(user_ids)).all()
+    return {user_id: name for user_id, name in rows}
+
+
 def get_issue_by_id(db: Session, issue_id: int):
-    return db.query(Issue).filter(Issue.id == issue_id).first()
+    # Identity-map aware: a second lookup in the same request costs no query.
+    return db.get(Issue, issue_id)
+
+
+def list_issues_by_ids(db: Session, issue_ids: list[int]):
+    if not issue_ids:
+        return []
+    return db.query(Issue).filter(Issue.id.in_(issue_ids)).all()
+
+
+def _move_statuses(db: Session, moves: list[tuple[int, IssueStatus, IssueStatus]]):
+    """Set issue statuses with UPDATEs guarded by the status the caller read.
+
+    `moves` holds `(issue_id, status read, new status)`. Only transitions a statement actually made
+    are counted, so two writers working from the same stale read cannot both apply a delta.
+    Returns the counter deltas and the ids of issues that no longer exist.
+    """
+    deltas = Counter()
+    missed = []
+    by_transition = {}
+    for issue_id, old_status, new_status in moves:
+        by_transition.setdefault((old_status, new_status), []).append(issue_id)
+
+    for (old_status, new_status), issue_ids in by_transition.items():
+        moved = db.execute(
+            update(Issue)
+            .where(Issue.id.in_(issue_ids), Issue.status == old_status)
+            .values(status=new_status)
+            .returning(Issue.id, Issue.project_id),
+            execution_options={"synchronize_session": False},
+        ).all()
+        for _, project_id in moved:
+            deltas[(project_id, old_status)] -= 1
+            deltas[(project_id, new_status)] += 1
+        moved_ids = {issue_id for issue_id, _ in moved}
+        missed += [(issue_id, new_status) for issue_id in issue_ids if issue_id not in moved_ids]
+
+    # Someone else changed (or deleted) these since they were read: lock the row, then move from its real status.
+    vanished = set()
+    for issue_id, new_status in missed:
+        current = db.execute(
+            select(Issue.project_id, Issue.status).where(Issue.id == issue_id).with_for_update()
+        ).first()
+        if current is None:
+            vanished.add(issue_id)
+            continue
+        db.execute(
+            update(Issue).where(Issue.id == issue_id).values(status=new_status),
+            execution_options={"synchronize_session": False},
+        )
+        deltas[(current.project_id, current.status)] -= 1
+        deltas[(current.project_id, new_status)] += 1
+    return deltas, vanished
 
 
 def commit_issue(db: Session, issue: Issue):
+    """Flush `issue`'s pending changes; returns None if the issue was deleted in the meantime."""
+    status_history = inspect(issue).attrs.status.history
+    if status_history.added:
+        # No previous value when the instance was expired; the guarded UPDATE then reads the real one.
+        old_status = status_history.deleted[0] if status_history.deleted else None
+        new_status = status_history.added[0]
+        if old_status != new_status:
+            with db.no_autoflush:
+                deltas, vanished = _move_statuses(db, [(issue.id, old_status, new_status)])
+            if vanished:
+                db.rollback()
+                return None
+            adjust_issue_counts(db, deltas)
     db.commit()
     db.refresh(issue)
     return issue
 
 
 def delete_issue(db: Session, issue: Issue):
-    db.delete(issue)
+    delete_issues(db, [issue])
+
+
+def update_issues(db: Session, changes: list[tuple[Issue, dict]]):
+    """Apply per-issue column changes as a bulk UPDATE by primary key in one transaction."""
+    if not any(values for _, values in changes):
+        return
+
+    moves = [(issue.id, issue.status, values["status"]) for issue, values in changes if "status" in values]
+    deltas, vanished = _move_statuses(db, moves)
+
+    rows = []
+    for issue, values in changes:
+        values = {column: value for column, value in values.items() if column != "status"}
+        if values and issue.id not in vanished:
+            rows.append({"id": issue.id, **values})
+    if rows:
+        db.execute(update(Issue), rows)
+    adjust_issue_counts(db, deltas)
+    db.commit()
+
+
+def delete_issues(db: Session, issues: list[Issue]):
+    if not issues:
+        return
+    # Count what the DELETE removed rather than what was loaded: a row deleted twice is only counted once.
+    deleted = db.execute(
+        delete(Issue)
+        .where(Issue.id.in_([issue.id for issue in issues]))
+        .returning(Issue.project_id, Issue.status),
+        execution_options={"synchronize_session": False},
+    ).all()
+    deltas = Counter()
+    for project_id, status in deleted:
+        deltas[(project_id, status)] -= 1
+    adjust_issue_counts(db, deltas)
     db.commit()
@@ -1,11 +1,12 @@
+from sqlalchemy import case, delete, func, or_, tuple_
 from sqlalchemy.orm import Session
 from datetime import date
 
+from app.models.issue import IssueStatus
 from app.models.project import Project
 from app.models.project_member import ProjectMember
 from app.models.user import User
-from app.models.issue import Issue
-from app.models.comment import Comment
+from app.models.project_issue_stats import ProjectIssueStats
 
 
 def get_project_by_key(db: Session, key: str):
@@ -49,45 +50,120 @@ def get_membership(db: Session, project_id: int, user_id: int):
     ).first()
 
 
-def list_memberships_for_user(db: Session, user_id: int):
-    return db.query(ProjectMember).filter(ProjectMember.user_id == user_id).all()
+def list_memberships_by_keys(db: Session, keys: list[tuple[int, int]]):
+    if not keys:
+        return []
+    return db.query(ProjectMember).filter(
+        tuple_(ProjectMember.project_id, ProjectMember.user_id).in_(keys)
+    ).all()
 
 
-def list_projects_by_ids(db: Session, project_ids: list[int]):
-    if not project_ids:
-        return []
-    return db.query(Project).filter(Project.id.in_(project_ids)).all()
+def list_issue_counts_for_user(db: Session, user_id: int):
+    """(project_id, my role, status, issue_count) for every project of the user; status is None without issues."""
+    return db.query(
+        ProjectMember.project_id,
+        ProjectMember.role,
+        ProjectIssueStats.status,
+        ProjectIssueStats.issue_count,
+    ).outerjoin(
+        ProjectIssueStats, ProjectIssueStats.project_id == ProjectMember.project_id
+    ).filter(ProjectMember.user_id == user_id).all()
 
 
-def get_user_by_email(db: Session, email: str):
-    return db.query(User).filter(User.email == email).first()
+def count_roles_for_user(db: Session, user_id: int):
+    """(role, project count) pairs for the user, aggregated in the database."""
+    return db.query(ProjectMember.role, func.count()).filter(
+        ProjectMember.user_id == user_id
+    ).group_by(ProjectMember.role).all()
 
 
-def list_project_members(db: Session, project_id: int):
-    return db.query(ProjectMember).filter(ProjectMember.project_id == project_id).all()
+OPEN_ISSUES = func.coalesce(func.sum(case(
+    (ProjectIssueStats.status == IssueStatus.open, ProjectIssueStats.issue_count), else_=0
+)), 0)
+TOTAL_ISSUES = func.coalesce(func.sum(ProjectIssueStats.issue_count), 0)
 
+PROJECT_SORTS = {
+    "name": (Project.name.asc(),),
+    "key": (Project.key.asc(),),
+    "created_at": (Project.created_at.desc(),),
+    "open_issues": (OPEN_ISSUES.desc(),),
+    "total_issues": (TOTAL_ISSUES.desc(),),
+}
 
-def get_user_by_id(db: Session, user_id: int):
-    return db.query(User).filter(User.id == user_id).first()
 
+def list_projects_for_user(
+    db: Session,
+    user_id: int,
+    sort: str = "name",
+    limit: int | None = None,
+    offset: int = 0
+):
+    """The user's projects with their role and open/total issue counts from project_issue_stats, in one query."""
+    query = db.query(
+        Project.id,
+        Project.name,
+        Project.key,
+        Project.description,
+        Project.start_date,
+        ProjectMember.role,
+        OPEN_ISSUES.label("open_issues"),
+        TOTAL_ISSUES.label("total_issues"),
+    ).join(
+        Project, Project.id == ProjectMember.project_id
+    ).outerjoin(
+        ProjectIssueStats, ProjectIssueStats.project_id == ProjectMember.project_id
+    ).filter(
+        ProjectMember.user_id == user_id
+    ).group_by(
+        Project.id, ProjectMember.role
+    ).order_by(*PROJECT_SORTS[sort], Project.id).offset(offset)
 
-def list_issue_ids_for_project(db: Session, project_id: int):
-    return [issue_id for (issue_id,) in db.query(Issue.id).filter(Issue.project_id == project_id).all()]
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
 
 
-def delete_comments_by_issue_ids(db: Session, issue_ids: list[int]):
-    if issue_ids:
-        db.query(Comment).filter(Comment.issue_id.in_(issue_ids)).delete(synchronize_session=False)
+def get_user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
 
 
-def delete_issues_by_project(db: Session, project_id: int):
-    db.query(Issue).filter(Issue.project_id == project_id).delete(synchronize_session=False)
+def list_member_roles(db: Session, project_id: int):
+    return db.query(ProjectMember.user_id, ProjectMember.role).filter(
+        ProjectMember.project_id == project_id
+    ).order_by(ProjectMember.user_id).all()
 
 
-def delete_memberships_by_project(db: Session, project_id: int):
-    db.query(ProjectMember).filter(ProjectMember.project_id == project_id).delete(synchronize_session=False)
+def _prefix_pattern(prefix: str) -> str:
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
 
 
-def delete_project(db: Session, project: Project):
-    db.delete(project)
+def list_project_members(
+    db: Session,
+    project_id: int,
+    q: str | None = None,
+    limit: int | None = None,
+    offset: int = 0
+):
+    """(id, name, email, role) rows of a project's members in one joined query, ordered by name."""
+    query = db.query(User.id, User.name, User.email, ProjectMember.role).join(
+        User, User.id == ProjectMember.user_id
+    ).filter(ProjectMember.project_id == project_id)
+
+    if q:
+        pattern = _prefix_pattern(q)
+        query = query.filter(or_(
+            User.name.ilike(pattern, escape="\\"),
+            User.email.ilike(pattern, escape="\\"),
+        ))
+
+    query = query.order_by(User.name, User.id).offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+def delete_project(db: Session, project_id: int):
+    # Issues, comments, memberships and issue stats go with it through ON DELETE CASCADE.
+    db.execute(delete(Project).where(Project.id == project_id))
     db.commit()
@@ -1,12 +1,106 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from abc import ABC, abstractmethod
+from typing import Any, Callable, TypeVar
 
-from app.core.config import DATABASE_URL
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
 
-engine = create_engine(DATABASE_URL)
+from app.core.config import (
+    ASYNC_DATABASE_URL,
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_MODE,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+from app.core.request_timing import instrument_engine
+from app.db.pool_metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool
+
+T = TypeVar("T")
+
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
+
+
+def enforce_sqlite_foreign_keys(sync_engine):
+    """SQLite ignores ON DELETE CASCADE unless foreign keys are switched on per connection."""
+    if sync_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+engine = create_engine(DATABASE_URL, poolclass=TimedQueuePool, **POOL_OPTIONS)
+TimedQueuePool.metrics.attach(engine)
+enforce_sqlite_foreign_keys(engine)
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine
 )
+
+async_engine = None
+AsyncSessionLocal = None
+if DB_MODE == "async":
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL, poolclass=TimedAsyncAdaptedQueuePool, **POOL_OPTIONS
+    )
+    TimedAsyncAdaptedQueuePool.metrics.attach(async_engine.sync_engine)
+    enforce_sqlite_foreign_keys(async_engine.sync_engine)
+    instrument_engine(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        autoflush=False,
+        bind=async_engine
+    )
+
+
+def pool_stats() -> dict:
+    stats = {"sync": TimedQueuePool.metrics.snapshot(engine.pool)}
+    if async_engine is not None:
+        stats["async"] = TimedAsyncAdaptedQueuePool.metrics.snapshot(async_engine.sync_engine.pool)
+    return stats
+
+
+class Database(ABC):
+    """Request-scoped handle that runs sync DAO/service code against the configured engine.
+
+    `run(fn, *args)` calls `fn(session, *args)` with a regular ORM `Session`, so the same
+    service functions serve both modes.
+    """
+
+    @abstractmethod
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        ...
+
+
+class SyncDatabase(Database):
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+
+
+class AsyncDatabase(Database):
+    """Runs the sync code inside `AsyncSession.run_sync`, so IO awaits asyncpg instead of blocking a thread."""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await self.session.run_sync(fn, *args, **kwargs)
@@ -1,5 +1,5 @@
-from fastapi import FastAPI, Request, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Response, HTTPException, Depends, Query
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from typing import cast
@@ -8,9 +8,13 @@ from app.api.auth import router as auth_router
 from app.api.projects import router as projects_router
 from app.api.issues import router as issues_router
 from app.api.comments import router as comments_router
-from app.core.dependencies import get_current_user, get_db
-from app.models.user import User
-from sqlalchemy.orm import Session
+from app.api.events import router as events_router
+from app.api.metrics import router as metrics_router
+from app.core.conditional import conditional_get
+from app.core.request_timing import RequestTimingMiddleware
+from app.core.dependencies import CurrentUser, get_current_user, get_db
+from app.db.session import Database
+from app.schemas.user import MeOut
 from app.services import auth_service
 
 
@@ -21,7 +25,9 @@ from app.services import auth_service
 app = FastAPI(
     title="IssueHub API",
     version="1.0.0",
-    description="Issue Tracking System - Powered by MediaMint"
+    description="Issue Tracking System - Powered by MediaMint",
+    # Routes declare response models, so pydantic-core builds the JSON-ready data and orjson encodes it.
+    default_response_class=ORJSONResponse,
 )
 
 # -------------------------
@@ -37,8 +43,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-After-Id", "X-Next-Offset"],
 )
 
+# Outermost, so Server-Timing and the request log cover everything below it.
+app.add_middleware(RequestTimingMiddleware)
+
 # -------------------------
 # Structured Error Handling
 # -------------------------
@@ -53,6 +63,7 @@ async def custom_http_exception_handler(request: Request, exc: HTTPException):
                 "message": exc.detail,
             }
         },
+        headers=exc.headers,
     )
 
 
@@ -92,17 +103,36 @@ app.include_router(auth_router, prefix="/api/auth", tags=["Auth"])
 app.include_router(projects_router, prefix="/api/projects", tags=["Projects"])
 app.include_router(issues_router, prefix="/api", tags=["Issues"])
 app.include_router(comments_router, prefix="/api", tags=["Comments"])
-
-
-@app.get("/api/me")
-def me_alias(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+app.include_router(events_router, prefix="/api", tags=["Events"])
+app.include_router(metrics_router, prefix="/api/metrics", tags=["Metrics"])
+
+
+@app.get("/api/me", response_model=MeOut, response_model_exclude_unset=True)
+async def me_alias(
+    request: Request,
+    response: Response,
+    projects: bool = Query(False, description="Include a page of {project_id, role}"),
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: Database = Depends(get_db)
 ):
     current_user_id = cast(int, current_user.id)
     current_user_name = cast(str, current_user.name)
     current_user_email = cast(str, current_user.email)
-    return auth_service.me(db, current_user_id, current_user_name, current_user_email)
+    me_args = (current_user_id, current_user_name, current_user_email, projects, limit, offset)
+    page = await conditional_get(
+        request,
+        response,
+        db,
+        version=lambda session: auth_service.get_me_version(session, *me_args),
+        build=lambda session: auth_service.me(session, *me_args),
+    )
+    if isinstance(page, Response):
+        return page
+    if page["next_offset"] is not None:
+        response.headers["X-Next-Offset"] = str(page["next_offset"])
+    return page["data"]
 
 
 # -------------------------
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
@@ -6,6 +6,9 @@ from app.db.base import Base
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_issue_id_created_at_id", "issue_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -19,7 +22,8 @@ class Comment(Base):
 
     body = Column(String, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # NOT NULL: the comment thread keyset compares it.
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=text("CURRENT_TIMESTAMP"))
 
     # Relationship back to Issue
     issue = relationship("Issue", back_populates="comments")
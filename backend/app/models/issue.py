@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 from app.db.base import Base
 import enum
@@ -21,6 +22,13 @@ class IssuePriority(str, enum.Enum):
 
 class Issue(Base):
     __tablename__ = "issues"
+    __table_args__ = (
+        Index("ix_issues_project_id_status_created_at", "project_id", "status", "created_at"),
+        Index("ix_issues_project_id_priority", "project_id", "priority"),
+        Index("ix_issues_project_id_created_at", "project_id", "created_at"),
+        Index("ix_issues_project_id_assignee_id", "project_id", "assignee_id"),
+        Index("ix_issues_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -35,9 +43,13 @@ class Issue(Base):
     reporter_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # NOT NULL: keyset cursors for sort=created_at encode it.
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(DateTime, default=datetime.utcnow,onupdate=datetime.utcnow)
 
+    # Maintained by the issues_search_vector_update trigger on PostgreSQL; never written by the app.
+    search_vector = deferred(Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True))
+
     comments = relationship(
         "Comment",
         back_populates="issue",
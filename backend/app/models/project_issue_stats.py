@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, ForeignKey, Enum
+from app.db.base import Base
+from app.models.issue import IssueStatus
+
+
+# Denormalized issue counts, updated by issues_dao in the same transaction as each issue write.
+class ProjectIssueStats(Base):
+    __tablename__ = "project_issue_stats"
+
+    project_id = Column(
+        Integer,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    status = Column(Enum(IssueStatus, name="issue_status_enum"), primary_key=True)
+
+    issue_count = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,15 @@
+from datetime import datetime
 from pydantic import BaseModel
 
 class CommentCreate(BaseModel):
     body: str
+
+
+class CommentCreated(BaseModel):
+    id: int
+    body: str
+    author_id: int
+
+
+class CommentOut(CommentCreated):
+    created_at: datetime | None = None
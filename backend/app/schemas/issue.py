@@ -1,5 +1,10 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Literal
+from pydantic import BaseModel, Field
+from app.core.config import ISSUE_BATCH_MAX_ITEMS
 from app.models.issue import IssueStatus, IssuePriority
+from app.schemas.comment import CommentOut
+from app.schemas.project import ProjectMemberOut
 
 
 class IssueCreate(BaseModel):
@@ -15,3 +20,67 @@ class IssueUpdate(BaseModel):
     status: IssueStatus | None = None
     priority: IssuePriority | None = None
     assignee_id: int | None = None
+
+
+class IssueBatchCreate(BaseModel):
+    items: list[IssueCreate] = Field(min_length=1, max_length=ISSUE_BATCH_MAX_ITEMS)
+
+
+class IssueBatchUpdateItem(IssueUpdate):
+    id: int
+
+
+class IssueBatchUpdate(BaseModel):
+    items: list[IssueBatchUpdateItem] = Field(min_length=1, max_length=ISSUE_BATCH_MAX_ITEMS)
+
+
+class IssueBatchDelete(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=ISSUE_BATCH_MAX_ITEMS)
+
+
+class IssueOut(BaseModel):
+    id: int
+    title: str
+    status: IssueStatus
+    priority: IssuePriority
+    reporter_id: int
+    assignee_id: int | None = None
+
+
+class IssueListItem(IssueOut):
+    reporter_name: str | None = None
+    assignee_name: str | None = None
+
+
+class IssueListPage(BaseModel):
+    total: int
+    page: int
+    page_size: int
+    data: list[IssueListItem]
+
+
+class IssueCursorPage(BaseModel):
+    page_size: int
+    next_cursor: str | None = None
+    data: list[IssueListItem]
+
+
+class IssueDetail(IssueListItem):
+    description: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class IssueViewer(BaseModel):
+    id: int
+    name: str
+    email: str
+    role: Literal["maintainer", "member"]
+
+
+class IssueDetailBundle(IssueDetail):
+    # Present only when requested through ?include=; unset fields are left out of the response.
+    comments: list[CommentOut] | None = None
+    comments_next_after_id: int | None = None
+    members: list[ProjectMemberOut] | None = None
+    viewer: IssueViewer | None = None
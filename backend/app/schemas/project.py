@@ -24,3 +24,33 @@ class ProjectCreate(BaseModel):
 class AddMemberRequest(BaseModel):
     email: EmailStr
     role: Literal["maintainer", "member"]
+
+
+class ProjectOut(BaseModel):
+    id: int
+    name: str
+    key: str
+    description: Optional[str] = None
+    start_date: Optional[date] = None
+
+
+class ProjectListItem(ProjectOut):
+    my_role: Optional[Literal["maintainer", "member"]] = None
+    open_issues: int = 0
+    total_issues: int = 0
+
+
+class ProjectIssueStatsOut(BaseModel):
+    project_id: int
+    open: int
+    in_progress: int
+    resolved: int
+    closed: int
+    total: int
+
+
+class ProjectMemberOut(BaseModel):
+    id: int
+    name: str
+    email: str
+    role: Literal["maintainer", "member"]
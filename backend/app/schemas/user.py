@@ -1,3 +1,4 @@
+from typing import Literal
 from pydantic import BaseModel, EmailStr
 
 class UserCreate(BaseModel):
@@ -8,3 +9,18 @@ class UserCreate(BaseModel):
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
+
+
+class ProjectRoleOut(BaseModel):
+    project_id: int
+    role: Literal["maintainer", "member"]
+
+
+class MeOut(BaseModel):
+    id: int
+    name: str
+    email: str
+    project_count: int
+    role_counts: dict[str, int]
+    # Only with ?projects=true; unset fields are left out of the response.
+    projects: list[ProjectRoleOut] | None = None
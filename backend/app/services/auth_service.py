@@ -1,41 +1,115 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core.conditional import Version, make_version
 from app.dao import auth_dao
-from app.core.security import get_password_hash, verify_password, create_access_token
-from app.services.common import role_value
+from app.db.session import Database
+from app.core.security import (
+    PasswordHasherBusy,
+    create_access_token,
+    get_password_hash_async,
+    verify_password_async,
+)
+from app.services import membership_service
+from app.services.common import fetch_limit, role_value, split_page
 
 
-def signup(db: Session, name: str, email: str, password: str):
+def _password_pool_busy():
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
+def _email_registered(db: Session, email: str) -> bool:
     existing = auth_dao.get_user_by_email(db, email)
-    if existing:
+    # End the read transaction so the connection goes back to the pool during hashing.
+    db.rollback()
+    return existing is not None
+
+
+def _credentials_for(db: Session, email: str) -> tuple[str, str] | None:
+    user = auth_dao.get_user_by_email(db, email)
+    credentials = (user.email, user.password_hash) if user else None
+    db.rollback()
+    return credentials
+
+
+async def signup(db: Database, name: str, email: str, password: str):
+    if await db.run(_email_registered, email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
-    auth_dao.create_user(db, name=name, email=email, password_hash=get_password_hash(password))
+    try:
+        password_hash = await get_password_hash_async(password)
+    except PasswordHasherBusy:
+        raise _password_pool_busy()
+
+    await db.run(auth_dao.create_user, name=name, email=email, password_hash=password_hash)
     return {"message": "User created successfully"}
 
 
-def login(db: Session, username: str, password: str):
-    user = auth_dao.get_user_by_email(db, username)
-    if not user or not verify_password(password, user.password_hash):
+async def login(db: Database, username: str, password: str):
+    credentials = await db.run(_credentials_for, username)
+    try:
+        valid = credentials is not None and await verify_password_async(password, credentials[1])
+    except PasswordHasherBusy:
+        raise _password_pool_busy()
+
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
         )
 
-    token = create_access_token(data={"sub": user.email})
+    token = create_access_token(data={"sub": credentials[0]})
     return {"access_token": token, "token_type": "bearer"}
 
 
-def me(db: Session, user_id: int, name: str, email: str):
-    memberships = auth_dao.list_memberships_for_user(db, user_id)
-    roles = [role_value(m.role) for m in memberships]
-    return {
+def _project_role_page(db: Session, user_id: int, limit: int, offset: int):
+    rows = auth_dao.list_project_roles_for_user(db, user_id, limit=fetch_limit(limit), offset=offset)
+    return [(project_id, role_value(role)) for project_id, role in rows]
+
+
+def get_me_version(
+    db: Session,
+    user_id: int,
+    name: str,
+    email: str,
+    include_projects: bool = False,
+    limit: int = 100,
+    offset: int = 0
+) -> Version:
+    parts = ["me", user_id, name, email, sorted(membership_service.get_role_summary(db, user_id).items())]
+    if include_projects:
+        parts += [limit, offset, _project_role_page(db, user_id, limit, offset)]
+    return make_version(*parts)
+
+
+def me(
+    db: Session,
+    user_id: int,
+    name: str,
+    email: str,
+    include_projects: bool = False,
+    limit: int = 100,
+    offset: int = 0
+):
+    """The caller plus per-role project counts; the per-project role map only when asked for, a page at a time."""
+    role_counts = membership_service.get_role_summary(db, user_id)
+    result = {
         "id": user_id,
         "name": name,
         "email": email,
-        "project_roles": roles
+        "project_count": sum(role_counts.values()),
+        "role_counts": role_counts,
     }
+    if not include_projects:
+        return {"data": result, "next_offset": None}
+
+    rows, has_more = split_page(_project_role_page(db, user_id, limit, offset), limit)
+    result["projects"] = [{"project_id": project_id, "role": role} for project_id, role in rows]
+    return {"data": result, "next_offset": offset + limit if has_more else None}
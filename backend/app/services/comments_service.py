@@ -1,7 +1,12 @@
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from datetime import datetime
 
+from app.core import events
+from app.core.conditional import Version, make_version
 from app.dao import comments_dao
+from app.services import membership_service
+from app.services.common import fetch_limit, split_page
 
 
 def add_comment(db: Session, issue_id: int, body: str, current_user_id: int):
@@ -9,27 +14,83 @@ def add_comment(db: Session, issue_id: int, body: str, current_user_id: int):
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    membership = comments_dao.get_project_membership(db, issue.project_id, current_user_id)
-    if not membership:
+    role = membership_service.get_role(db, issue.project_id, current_user_id)
+    if role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
 
+    project_id = issue.project_id
     comment = comments_dao.create_comment(
         db, issue_id=issue_id, author_id=current_user_id, body=body
     )
+    events.publish(project_id, "comment.created", {
+        "issue_id": issue_id,
+        "comment": {
+            "id": comment.id,
+            "body": comment.body,
+            "author_id": comment.author_id,
+            "created_at": comment.created_at
+        }
+    })
     return {"id": comment.id, "body": comment.body, "author_id": comment.author_id}
 
 
-def list_comments(db: Session, issue_id: int, current_user_id: int):
+def get_comments_version(
+    db: Session,
+    issue_id: int,
+    current_user_id: int,
+    after_id: int | None = None,
+    since: datetime | None = None,
+    limit: int = 100
+) -> Version:
     issue = comments_dao.get_issue_by_id(db, issue_id)
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    membership = comments_dao.get_project_membership(db, issue.project_id, current_user_id)
-    if not membership:
+    role = membership_service.get_role(db, issue.project_id, current_user_id)
+    if role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
 
-    comments = comments_dao.list_comments_by_issue(db, issue_id)
-    return [
+    count, last_id, last_created_at = comments_dao.get_comment_thread_version(db, issue_id)
+    return make_version(
+        "comments", issue_id, count, last_id, after_id, since, limit,
+        last_modified=last_created_at,
+    )
+
+
+def list_comments(
+    db: Session,
+    issue_id: int,
+    current_user_id: int,
+    after_id: int | None = None,
+    since: datetime | None = None,
+    limit: int = 100
+):
+    issue = comments_dao.get_issue_by_id(db, issue_id)
+    if not issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    role = membership_service.get_role(db, issue.project_id, current_user_id)
+    if role is None:
+        raise HTTPException(status_code=403, detail="Not a member of this project")
+
+    after = None
+    if after_id is not None:
+        after = comments_dao.get_comment_in_issue(db, issue_id, after_id)
+        if not after:
+            raise HTTPException(status_code=400, detail="after_id is not a comment of this issue")
+
+    return build_comment_page(db, issue_id, after=after, since=since, limit=limit)
+
+
+def build_comment_page(db: Session, issue_id: int, after=None, since: datetime | None = None, limit: int = 100):
+    """One page of an issue's thread; callers have already checked access to the issue."""
+    comments, has_more = split_page(
+        comments_dao.list_comments_by_issue(db, issue_id, after=after, since=since, limit=fetch_limit(limit)),
+        limit,
+    )
+    next_after_id = comments[-1].id if has_more else None
+
+    data = [
         {
             "id": c.id,
             "body": c.body,
@@ -38,3 +99,4 @@ def list_comments(db: Session, issue_id: int, current_user_id: int):
         }
         for c in comments
     ]
+    return {"data": data, "next_after_id": next_after_id}
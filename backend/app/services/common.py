@@ -1,2 +1,37 @@
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException
+
+
 def role_value(role):
     return role.value if hasattr(role, "value") else str(role)
+
+
+def fetch_limit(limit: int | None) -> int | None:
+    """Rows to fetch for a page of `limit`: one extra row tells whether another page follows."""
+    return limit + 1 if limit is not None else None
+
+
+def split_page(rows: list, limit: int | None) -> tuple[list, bool]:
+    """The page out of rows fetched with `fetch_limit(limit)`, and whether another page follows."""
+    if limit is None or len(rows) <= limit:
+        return rows, False
+    return rows[:limit], True
+
+
+def encode_cursor(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return payload
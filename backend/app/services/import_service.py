@@ -0,0 +1,361 @@
+import csv
+import io
+import itertools
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import BinaryIO, Iterable, Iterator
+
+import orjson
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.core.config import IMPORT_BATCH_SIZE
+from app.dao import import_dao, issues_dao
+from app.db.session import Database
+from app.models.issue import IssuePriority, IssueStatus
+from app.services import membership_service
+
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportRowError(ValueError):
+    pass
+
+
+@dataclass
+class ImportReport:
+    issues: int = 0
+    comments: int = 0
+    members_added: list[int] = field(default_factory=list)
+    skipped: int = 0
+    errors: list[dict] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def reject(self, source: str, line: int, message: str):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"file": source, "line": line, "error": message})
+
+    def as_dict(self) -> dict:
+        rows = self.issues + self.comments
+        return {
+            "issues": self.issues,
+            "comments": self.comments,
+            "members_added": len(self.members_added),
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(rows / self.seconds) if self.seconds else rows,
+        }
+
+
+def read_records(stream: BinaryIO, fmt: str) -> Iterator[tuple[int, dict | None]]:
+    """(line number, record) pairs from a CSV or NDJSON byte stream; unparsable NDJSON lines yield None."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(text)
+            for record in reader:
+                yield reader.line_num, record
+            return
+
+        for line_no, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, orjson.loads(line)
+            except orjson.JSONDecodeError:
+                yield line_no, None
+    finally:
+        # Leave the caller's stream open; TextIOWrapper would close it on collection.
+        text.detach()
+
+
+def _batches(records: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _clean(record: dict, key: str) -> str | None:
+    value = record.get(key)
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _parse_enum(value: str | None, enum_type, default):
+    if value is None:
+        return default
+    try:
+        return enum_type(value.lower())
+    except ValueError:
+        raise ImportRowError(f"Unknown {enum_type.__name__.removeprefix('Issue').lower()} '{value}'")
+
+
+def _parse_timestamp(value: str | None, default: datetime) -> datetime:
+    if value is None:
+        return default
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ImportRowError(f"Invalid created_at '{value}'")
+    # Stored naive in UTC, like datetime.utcnow() defaults.
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def _resolve_users(db: Session, user_ids: dict[str, int | None], emails: Iterable[str | None]):
+    """Fill `user_ids` (email -> id, or None when unknown) for emails not seen before, in one query."""
+    missing = {email for email in emails if email and email not in user_ids}
+    if missing:
+        found = import_dao.get_user_ids_by_emails(db, missing)
+        for email in missing:
+            user_ids[email] = found.get(email)
+
+
+def _user_id(user_ids: dict[str, int | None], email: str | None, column: str, required: bool) -> int | None:
+    if email is None:
+        if required:
+            raise ImportRowError(f"{column} is required")
+        return None
+    user_id = user_ids.get(email)
+    if user_id is None:
+        raise ImportRowError(f"Unknown user '{email}' in {column}")
+    return user_id
+
+
+def _parse_issue(project_id: int, record, now: datetime) -> dict:
+    """Validate an issue record without touching the database; users are still emails."""
+    if not isinstance(record, dict):
+        raise ImportRowError("Record is not an object")
+    title = _clean(record, "title")
+    if title is None:
+        raise ImportRowError("title is required")
+
+    created_at = _parse_timestamp(_clean(record, "created_at"), now)
+    return {
+        "external_id": _clean(record, "external_id"),
+        "reporter_email": _clean(record, "reporter_email"),
+        "assignee_email": _clean(record, "assignee_email"),
+        "row": {
+            "project_id": project_id,
+            "title": title,
+            "description": _clean(record, "description"),
+            "status": _parse_enum(_clean(record, "status"), IssueStatus, IssueStatus.open),
+            "priority": _parse_enum(_clean(record, "priority"), IssuePriority, IssuePriority.medium),
+            "created_at": created_at,
+            "updated_at": created_at,
+        },
+    }
+
+
+def _parse_comment(record, now: datetime) -> dict:
+    if not isinstance(record, dict):
+        raise ImportRowError("Record is not an object")
+    body = _clean(record, "body")
+    if body is None:
+        raise ImportRowError("body is required")
+
+    return {
+        "issue_external_id": _clean(record, "issue_external_id"),
+        "author_email": _clean(record, "author_email"),
+        "body": body,
+        "created_at": _parse_timestamp(_clean(record, "created_at"), now),
+    }
+
+
+def _parse_batch(batch: list, parse) -> list[tuple[int, dict | ImportRowError]]:
+    # Errors are kept in line order and reported by the write step, next to the rows it rejects.
+    parsed = []
+    for line, record in batch:
+        try:
+            parsed.append((line, parse(record)))
+        except ImportRowError as exc:
+            parsed.append((line, exc))
+    return parsed
+
+
+def _parse_next(batches: Iterator[list], parse) -> list | None:
+    batch = next(batches, None)
+    return None if batch is None else _parse_batch(batch, parse)
+
+
+def _ensure_members(db: Session, project_id: int, member_ids: set[int], user_ids: set[int], report: ImportReport):
+    # Reporters and assignees of imported issues must be project members, like everywhere else.
+    new_members = sorted(user_ids - member_ids)
+    import_dao.insert_members(db, project_id, new_members)
+    member_ids.update(new_members)
+    report.members_added.extend(new_members)
+
+
+class _ProjectImport:
+    """
+    One import into one project. `parse_*` steps are pure CPU work on raw records; `start`,
+    `write_*` and `finish` run on the session, and nothing is committed before `finish`.
+    """
+
+    def __init__(self, project_id: int):
+        self.project_id = project_id
+        self.started = time.perf_counter()
+        self.now = datetime.utcnow()
+        self.report = ImportReport()
+        self.user_ids: dict[str, int | None] = {}
+        self.member_ids: set[int] = set()
+        self.issue_ids: dict[str, int] = {}
+        self.status_counts = Counter()
+
+    def parse_issues(self, record) -> dict:
+        return _parse_issue(self.project_id, record, self.now)
+
+    def parse_comments(self, record) -> dict:
+        return _parse_comment(record, self.now)
+
+    def start(self, db: Session):
+        self.member_ids = import_dao.list_member_ids(db, self.project_id)
+
+    def write_issues(self, db: Session, parsed: list[tuple[int, dict | ImportRowError]]):
+        """Resolve the batch's users with one query and insert it with one multi-row INSERT."""
+        _resolve_users(db, self.user_ids, (
+            issue[column]
+            for _, issue in parsed if isinstance(issue, dict)
+            for column in ("reporter_email", "assignee_email")
+        ))
+
+        rows = []
+        external_ids = []
+        for line, issue in parsed:
+            try:
+                if isinstance(issue, ImportRowError):
+                    raise issue
+                external_id = issue["external_id"]
+                row = {
+                    **issue["row"],
+                    "reporter_id": _user_id(self.user_ids, issue["reporter_email"], "reporter_email", required=True),
+                    "assignee_id": _user_id(self.user_ids, issue["assignee_email"], "assignee_email", required=False),
+                }
+                if external_id is not None and external_id in self.issue_ids:
+                    raise ImportRowError(f"Duplicate external_id '{external_id}'")
+            except ImportRowError as exc:
+                self.report.reject("issues", line, str(exc))
+                continue
+            rows.append(row)
+            external_ids.append(external_id)
+            if external_id is not None:
+                self.issue_ids[external_id] = 0
+
+        _ensure_members(db, self.project_id, self.member_ids, {
+            user_id for row in rows for user_id in (row["reporter_id"], row["assignee_id"]) if user_id
+        }, self.report)
+        for external_id, issue_id in zip(external_ids, import_dao.insert_issues(db, rows)):
+            if external_id is not None:
+                self.issue_ids[external_id] = issue_id
+        self.status_counts.update((self.project_id, row["status"]) for row in rows)
+        self.report.issues += len(rows)
+
+    def write_comments(self, db: Session, parsed: list[tuple[int, dict | ImportRowError]]):
+        _resolve_users(db, self.user_ids, (
+            comment["author_email"] for _, comment in parsed if isinstance(comment, dict)
+        ))
+
+        rows = []
+        for line, comment in parsed:
+            try:
+                if isinstance(comment, ImportRowError):
+                    raise comment
+                external_id = comment["issue_external_id"]
+                if external_id not in self.issue_ids:
+                    raise ImportRowError(f"No imported issue with external_id '{external_id}'")
+                rows.append({
+                    "issue_id": self.issue_ids[external_id],
+                    "author_id": _user_id(self.user_ids, comment["author_email"], "author_email", required=True),
+                    "body": comment["body"],
+                    "created_at": comment["created_at"],
+                })
+            except ImportRowError as exc:
+                self.report.reject("comments", line, str(exc))
+        import_dao.insert_comments(db, rows)
+        self.report.comments += len(rows)
+
+    def finish(self, db: Session) -> dict:
+        issues_dao.adjust_issue_counts(db, self.status_counts)
+        import_dao.commit(db)
+        for user_id in self.report.members_added:
+            membership_service.invalidate_membership(db, self.project_id, user_id)
+        self.report.seconds = time.perf_counter() - self.started
+
+        result = self.report.as_dict()
+        events.publish(self.project_id, "issues.imported", {"issues": result["issues"], "comments": result["comments"]})
+        return result
+
+
+def import_project_data(
+    db: Session,
+    project_id: int,
+    issues_stream: BinaryIO,
+    comments_stream: BinaryIO | None = None,
+    fmt: str = "csv",
+    batch_size: int = IMPORT_BATCH_SIZE
+) -> dict:
+    """
+    Load issues (and comments that reference them by external_id) into a project in one transaction.
+
+    Input is read and inserted `batch_size` records at a time: each batch resolves its users with
+    one query and is written with one multi-row INSERT. Invalid records are skipped and reported.
+    """
+    job = _ProjectImport(project_id)
+    job.start(db)
+    for batch in _batches(read_records(issues_stream, fmt), batch_size):
+        job.write_issues(db, _parse_batch(batch, job.parse_issues))
+    if comments_stream is not None:
+        for batch in _batches(read_records(comments_stream, fmt), batch_size):
+            job.write_comments(db, _parse_batch(batch, job.parse_comments))
+    return job.finish(db)
+
+
+async def import_upload(
+    db: Database,
+    project_id: int,
+    issues_stream: BinaryIO,
+    comments_stream: BinaryIO | None = None,
+    fmt: str = "csv",
+    batch_size: int = IMPORT_BATCH_SIZE
+) -> dict:
+    """
+    `import_project_data` for request handlers: each batch is read and parsed in the threadpool
+    and only its writes go through `db.run`, so an async session never parses on the event loop.
+    """
+    job = _ProjectImport(project_id)
+    await db.run(job.start)
+    batches = _batches(read_records(issues_stream, fmt), batch_size)
+    while (parsed := await run_in_threadpool(_parse_next, batches, job.parse_issues)) is not None:
+        await db.run(job.write_issues, parsed)
+    if comments_stream is not None:
+        batches = _batches(read_records(comments_stream, fmt), batch_size)
+        while (parsed := await run_in_threadpool(_parse_next, batches, job.parse_comments)) is not None:
+            await db.run(job.write_comments, parsed)
+    return await db.run(job.finish)
+
+
+def _authorize_import(db: Session, project_id: int, request_user_id: int):
+    role = membership_service.get_role(db, project_id, request_user_id)
+    if role is None:
+        raise HTTPException(status_code=403, detail="Not a member of this project")
+    if role != "maintainer":
+        raise HTTPException(status_code=403, detail="Only maintainer can import issues")
+
+
+async def import_into_project(
+    db: Database,
+    project_id: int,
+    request_user_id: int,
+    issues_stream: BinaryIO,
+    comments_stream: BinaryIO | None,
+    fmt: str
+):
+    await db.run(_authorize_import, project_id, request_user_id)
+    return await import_upload(db, project_id, issues_stream, comments_stream, fmt)
@@ -1,24 +1,59 @@
+import csv
+import io
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterator
 
-from app.dao import issues_dao
-from app.schemas.issue import IssueCreate, IssueUpdate
-from app.services.common import role_value
+import orjson
 
+from app.core import events
+from app.core.conditional import Version, make_version
+from app.dao import comments_dao, issues_dao, projects_dao
+from app.db.session import SessionLocal
+from app.models.issue import IssuePriority, IssueStatus
+from app.schemas.issue import IssueBatchUpdateItem, IssueCreate, IssueUpdate
+from app.services import comments_service, membership_service, projects_service
+from app.services.common import decode_cursor, encode_cursor, role_value, split_page
 
-def _validate_assignee(db: Session, project_id: int, assignee_id: int):
-    assignee = issues_dao.get_user_by_id(db, assignee_id)
-    if not assignee:
+
+def _validate_assignee(db: Session, project_id: int, assignee_id: int, known_user_ids: set[int] | None = None):
+    # Batch callers pass the ids they already loaded so each assignee is looked up once.
+    if known_user_ids is not None:
+        assignee_exists = assignee_id in known_user_ids
+    else:
+        assignee_exists = issues_dao.get_user_by_id(db, assignee_id) is not None
+    if not assignee_exists:
         raise HTTPException(status_code=400, detail="Assignee user not found")
 
-    assignee_membership = issues_dao.get_project_membership(db, project_id, assignee_id)
-    if not assignee_membership:
+    if membership_service.get_role(db, project_id, assignee_id) is None:
         raise HTTPException(status_code=400, detail="Assignee must be a project member")
 
 
+def _issue_summary(issue):
+    return {
+        "id": issue.id,
+        "title": issue.title,
+        "status": issue.status,
+        "priority": issue.priority,
+        "reporter_id": issue.reporter_id,
+        "assignee_id": issue.assignee_id
+    }
+
+
+def _batch_error(index: int, exc: HTTPException):
+    return {"index": index, "ok": False, "error": {"code": f"HTTP_{exc.status_code}", "message": exc.detail}}
+
+
+def _batch_response(results: list[dict]):
+    results.sort(key=lambda result: result["index"])
+    failed = sum(1 for result in results if not result["ok"])
+    return {"succeeded": len(results) - failed, "failed": failed, "results": results}
+
+
 def create_issue(db: Session, project_id: int, payload: IssueCreate, current_user_id: int):
-    membership = issues_dao.get_project_membership(db, project_id, current_user_id)
-    if not membership:
+    role = membership_service.get_role(db, project_id, current_user_id)
+    if role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
 
     if payload.assignee_id is not None:
@@ -33,14 +68,93 @@ def create_issue(db: Session, project_id: int, payload: IssueCreate, current_use
         reporter_id=current_user_id,
         assignee_id=payload.assignee_id
     )
-    return {
-        "id": issue.id,
-        "title": issue.title,
-        "status": issue.status,
-        "priority": issue.priority,
-        "reporter_id": issue.reporter_id,
-        "assignee_id": issue.assignee_id
-    }
+    summary = _issue_summary(issue)
+    events.publish(project_id, "issue.created", summary)
+    return summary
+
+
+def create_issues(db: Session, project_id: int, items: list[IssueCreate], current_user_id: int):
+    role = membership_service.get_role(db, project_id, current_user_id)
+    if role is None:
+        raise HTTPException(status_code=403, detail="Not a member of this project")
+
+    assignee_ids = {item.assignee_id for item in items if item.assignee_id is not None}
+    known_user_ids = set(issues_dao.get_user_names_by_ids(db, assignee_ids))
+    membership_service.get_roles(db, [(project_id, assignee_id) for assignee_id in assignee_ids])
+
+    results = []
+    rows = []
+    row_indexes = []
+    for index, item in enumerate(items):
+        try:
+            if item.assignee_id is not None:
+                _validate_assignee(db, project_id, item.assignee_id, known_user_ids)
+        except HTTPException as exc:
+            results.append(_batch_error(index, exc))
+            continue
+        rows.append({
+            "project_id": project_id,
+            "title": item.title,
+            "description": item.description,
+            "priority": item.priority,
+            "reporter_id": current_user_id,
+            "assignee_id": item.assignee_id,
+        })
+        row_indexes.append(index)
+
+    if rows:
+        created = issues_dao.create_issues(db, rows)
+        for index, row in zip(row_indexes, created):
+            summary = _issue_summary(row)
+            events.publish(project_id, "issue.created", summary)
+            results.append({"index": index, "ok": True, "issue": summary})
+    return _batch_response(results)
+
+
+def _issue_list_rows(db: Session, issues):
+    user_ids = {issue.reporter_id for issue in issues}
+    user_ids.update(issue.assignee_id for issue in issues if issue.assignee_id)
+    names_by_id = issues_dao.get_user_names_by_ids(db, user_ids)
+
+    return [
+        {
+            "id": issue.id,
+            "title": issue.title,
+            "status": issue.status,
+            "priority": issue.priority,
+            "reporter_id": issue.reporter_id,
+            "reporter_name": names_by_id.get(issue.reporter_id),
+            "assignee_id": issue.assignee_id,
+            "assignee_name": names_by_id.get(issue.assignee_id) if issue.assignee_id else None
+        }
+        for issue in issues
+    ]
+
+
+def _keyset_value(sort: str | None, issue):
+    if sort == "created_at":
+        return issue.created_at.isoformat()
+    if sort in ("priority", "status"):
+        return role_value(getattr(issue, sort))
+    return None
+
+
+def _decode_issue_cursor(cursor: str, sort: str | None):
+    payload = decode_cursor(cursor)
+    if payload.get("sort") != sort or not isinstance(payload.get("id"), int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    value = payload.get("value")
+    try:
+        if sort == "created_at":
+            value = datetime.fromisoformat(value)
+        elif sort == "priority":
+            value = IssuePriority(value)
+        elif sort == "status":
+            value = IssueStatus(value)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return value, payload["id"]
 
 
 def list_issues(
@@ -55,8 +169,8 @@ def list_issues(
     sort: str | None,
     current_user_id: int
 ):
-    membership = issues_dao.get_project_membership(db, project_id, current_user_id)
-    if not membership:
+    role = membership_service.get_role(db, project_id, current_user_id)
+    if role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
 
     issues, total = issues_dao.list_issues(
@@ -71,64 +185,160 @@ def list_issues(
         sort=sort,
     )
 
-    result = []
-    for issue in issues:
-        reporter = issues_dao.get_user_by_id(db, issue.reporter_id)
-        assignee = issues_dao.get_user_by_id(db, issue.assignee_id) if issue.assignee_id else None
-        result.append({
-            "id": issue.id,
-            "title": issue.title,
-            "status": issue.status,
-            "priority": issue.priority,
-            "reporter_id": issue.reporter_id,
-            "reporter_name": reporter.name if reporter else None,
-            "assignee_id": issue.assignee_id,
-            "assignee_name": assignee.name if assignee else None
-        })
-
+    result = _issue_list_rows(db, issues)
     return {"total": total, "page": page, "page_size": page_size, "data": result}
 
 
-def update_issue(db: Session, issue_id: int, payload: IssueUpdate, current_user_id: int):
-    issue = issues_dao.get_issue_by_id(db, issue_id)
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
-
-    membership = issues_dao.get_project_membership(db, issue.project_id, current_user_id)
-    if not membership:
+def list_issues_by_cursor(
+    db: Session,
+    project_id: int,
+    cursor: str | None,
+    page_size: int,
+    status: str | None,
+    priority: str | None,
+    assignee: int | None,
+    q: str | None,
+    sort: str | None,
+    current_user_id: int
+):
+    role = membership_service.get_role(db, project_id, current_user_id)
+    if role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
 
-    is_maintainer = role_value(membership.role) == "maintainer"
+    if sort not in issues_dao.ISSUE_SORT_KEYS:
+        sort = None
+    after = _decode_issue_cursor(cursor, sort) if cursor else None
+
+    issues = issues_dao.list_issues_keyset(
+        db=db,
+        project_id=project_id,
+        page_size=page_size,
+        status=status,
+        priority=priority,
+        assignee_id=assignee,
+        q=q,
+        sort=sort,
+        after=after,
+    )
+
+    issues, has_more = split_page(issues, page_size)
+    next_cursor = None
+    if has_more:
+        last = issues[-1]
+        next_cursor = encode_cursor({"sort": sort, "value": _keyset_value(sort, last), "id": last.id})
+
+    result = _issue_list_rows(db, issues)
+    return {"page_size": page_size, "next_cursor": next_cursor, "data": result}
+
+
+def _issue_changes(
+    db: Session,
+    issue,
+    payload: IssueUpdate,
+    role: str,
+    current_user_id: int,
+    known_user_ids: set[int] | None = None
+):
+    """Column changes `payload` makes to `issue`, after checking the caller may make them."""
+    is_maintainer = role == "maintainer"
     is_reporter = issue.reporter_id == current_user_id
     if not is_maintainer and not is_reporter:
         raise HTTPException(status_code=403, detail="Not allowed to update this issue")
 
+    changes = {}
     if payload.title is not None:
-        issue.title = payload.title
+        changes["title"] = payload.title
     if payload.description is not None:
-        issue.description = payload.description
+        changes["description"] = payload.description
     if payload.priority is not None:
-        issue.priority = payload.priority
+        changes["priority"] = payload.priority
     if payload.status is not None:
         if not is_maintainer:
             raise HTTPException(status_code=403, detail="Only maintainer can change status")
-        issue.status = payload.status
+        changes["status"] = payload.status
     if "assignee_id" in payload.model_fields_set:
         if not is_maintainer:
             raise HTTPException(status_code=403, detail="Only maintainer can assign issues")
         if payload.assignee_id is not None:
-            _validate_assignee(db, issue.project_id, payload.assignee_id)
-        issue.assignee_id = payload.assignee_id
+            _validate_assignee(db, issue.project_id, payload.assignee_id, known_user_ids)
+        changes["assignee_id"] = payload.assignee_id
+    return changes
 
-    issues_dao.commit_issue(db, issue)
-    return {
-        "id": issue.id,
-        "title": issue.title,
-        "status": issue.status,
-        "priority": issue.priority,
-        "reporter_id": issue.reporter_id,
-        "assignee_id": issue.assignee_id
-    }
+
+def update_issue(db: Session, issue_id: int, payload: IssueUpdate, current_user_id: int):
+    issue = issues_dao.get_issue_by_id(db, issue_id)
+    if not issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    role = membership_service.get_role(db, issue.project_id, current_user_id)
+    if role is None:
+        raise HTTPException(status_code=403, detail="Not a member of this project")
+
+    for column, value in _issue_changes(db, issue, payload, role, current_user_id).items():
+        setattr(issue, column, value)
+
+    if issues_dao.commit_issue(db, issue) is None:
+        raise HTTPException(status_code=404, detail="Issue not found")
+    summary = _issue_summary(issue)
+    events.publish(issue.project_id, "issue.updated", summary)
+    return summary
+
+
+def _load_batch_issues(db: Session, issue_ids: list[int], current_user_id: int, assignees=()):
+    """Load the batch's issues and warm the membership memo for the caller and any assignees."""
+    issues_by_id = {issue.id: issue for issue in issues_dao.list_issues_by_ids(db, list(set(issue_ids)))}
+    keys = {(issue.project_id, current_user_id) for issue in issues_by_id.values()}
+    keys.update(
+        (issues_by_id[issue_id].project_id, assignee_id)
+        for issue_id, assignee_id in assignees
+        if issue_id in issues_by_id
+    )
+    membership_service.get_roles(db, keys)
+    return issues_by_id
+
+
+def _batch_issue_role(db: Session, issues_by_id: dict, issue_id: int, seen: set[int], current_user_id: int):
+    if issue_id in seen:
+        raise HTTPException(status_code=400, detail="Issue appears more than once in this batch")
+    seen.add(issue_id)
+
+    issue = issues_by_id.get(issue_id)
+    if not issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    role = membership_service.get_role(db, issue.project_id, current_user_id)
+    if role is None:
+        raise HTTPException(status_code=403, detail="Not a member of this project")
+    return issue, role
+
+
+def update_issues(db: Session, items: list[IssueBatchUpdateItem], current_user_id: int):
+    assignees = [(item.id, item.assignee_id) for item in items if item.assignee_id is not None]
+    issues_by_id = _load_batch_issues(db, [item.id for item in items], current_user_id, assignees)
+    known_user_ids = set(issues_dao.get_user_names_by_ids(db, {assignee_id for _, assignee_id in assignees}))
+
+    results = []
+    changes = []
+    updated = []
+    seen = set()
+    for index, item in enumerate(items):
+        try:
+            issue, role = _batch_issue_role(db, issues_by_id, item.id, seen, current_user_id)
+            values = _issue_changes(db, issue, item, role, current_user_id, known_user_ids)
+        except HTTPException as exc:
+            results.append(_batch_error(index, exc))
+            continue
+
+        summary = _issue_summary(issue)
+        summary.update((column, value) for column, value in values.items() if column in summary)
+        changes.append((issue, values))
+        updated.append((issue.project_id, summary))
+        results.append({"index": index, "ok": True, "issue": summary})
+
+    issues_dao.update_issues(db, changes)
+    for project_id, summary in updated:
+        events.publish(project_id, "issue.updated", summary)
+    return _batch_response(results)
 
 
 def delete_issue(db: Session, issue_id: int, current_user_id: int):
@@ -136,28 +346,63 @@ def delete_issue(db: Session, issue_id: int, current_user_id: int):
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    membership = issues_dao.get_project_membership(db, issue.project_id, current_user_id)
-    if not membership:
+    role = membership_service.get_role(db, issue.project_id, current_user_id)
+    if role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
 
-    is_maintainer = role_value(membership.role) == "maintainer"
+    is_maintainer = role == "maintainer"
     is_reporter = issue.reporter_id == current_user_id
     if not is_maintainer and not is_reporter:
         raise HTTPException(status_code=403, detail="Not allowed to delete this issue")
 
+    project_id = issue.project_id
     issues_dao.delete_issue(db, issue)
+    events.publish(project_id, "issue.deleted", {"id": issue_id})
     return {"message": "Issue deleted successfully"}
 
 
-def get_issue_detail(db: Session, issue_id: int, current_user_id: int):
+def delete_issues(db: Session, issue_ids: list[int], current_user_id: int):
+    issues_by_id = _load_batch_issues(db, issue_ids, current_user_id)
+
+    results = []
+    doomed = []
+    seen = set()
+    for index, issue_id in enumerate(issue_ids):
+        try:
+            issue, role = _batch_issue_role(db, issues_by_id, issue_id, seen, current_user_id)
+            if role != "maintainer" and issue.reporter_id != current_user_id:
+                raise HTTPException(status_code=403, detail="Not allowed to delete this issue")
+        except HTTPException as exc:
+            results.append(_batch_error(index, exc))
+            continue
+        doomed.append(issue)
+        results.append({"index": index, "ok": True, "id": issue_id})
+
+    deleted = [(issue.project_id, issue.id) for issue in doomed]
+    issues_dao.delete_issues(db, doomed)
+    for project_id, issue_id in deleted:
+        events.publish(project_id, "issue.deleted", {"id": issue_id})
+    return _batch_response(results)
+
+
+def _readable_issue(db: Session, issue_id: int, current_user_id: int):
     issue = issues_dao.get_issue_by_id(db, issue_id)
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    membership = issues_dao.get_project_membership(db, issue.project_id, current_user_id)
-    if not membership:
+    role = membership_service.get_role(db, issue.project_id, current_user_id)
+    if role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
+    return issue, role
+
+
+def get_issue_version(db: Session, issue_id: int, current_user_id: int) -> Version:
+    issue, _ = _readable_issue(db, issue_id, current_user_id)
+    # Every issue write bumps updated_at; reporter/assignee names never change.
+    return make_version("issue", issue.id, issue.updated_at, last_modified=issue.updated_at)
 
+
+def _issue_detail(db: Session, issue):
     reporter = issues_dao.get_user_by_id(db, issue.reporter_id)
     assignee = issues_dao.get_user_by_id(db, issue.assignee_id) if issue.assignee_id else None
     return {
@@ -173,3 +418,116 @@ def get_issue_detail(db: Session, issue_id: int, current_user_id: int):
         "created_at": issue.created_at,
         "updated_at": issue.updated_at
     }
+
+
+def get_issue_detail(db: Session, issue_id: int, current_user_id: int):
+    issue, _ = _readable_issue(db, issue_id, current_user_id)
+    return _issue_detail(db, issue)
+
+
+ISSUE_INCLUDES = ("comments", "members", "viewer")
+
+
+def parse_issue_includes(include: str | None) -> tuple[str, ...]:
+    requested = {part.strip() for part in (include or "").split(",") if part.strip()}
+    unknown = requested.difference(ISSUE_INCLUDES)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include '{sorted(unknown)[0]}'; expected any of {', '.join(ISSUE_INCLUDES)}",
+        )
+    return tuple(name for name in ISSUE_INCLUDES if name in requested)
+
+
+def get_issue_bundle_version(db: Session, issue_id: int, current_user_id: int, include: tuple[str, ...]) -> Version:
+    issue, role = _readable_issue(db, issue_id, current_user_id)
+    parts = ["issue", issue.id, issue.updated_at, include]
+    last_modified = issue.updated_at
+
+    if "comments" in include:
+        count, last_id, last_created_at = comments_dao.get_comment_thread_version(db, issue_id)
+        parts += [count, last_id]
+        if last_created_at is not None and (last_modified is None or last_created_at > last_modified):
+            last_modified = last_created_at
+    if "members" in include:
+        parts.append([
+            (user_id, role_value(member_role))
+            for user_id, member_role in projects_dao.list_member_roles(db, issue.project_id)
+        ])
+    if "viewer" in include:
+        parts += [current_user_id, role]
+    return make_version(*parts, last_modified=last_modified)
+
+
+def get_issue_bundle(
+    db: Session,
+    issue_id: int,
+    current_user_id: int,
+    current_user_name: str,
+    current_user_email: str,
+    include: tuple[str, ...]
+):
+    """Issue detail plus the first comment page, the member list and/or the viewer's role, behind one access check."""
+    issue, role = _readable_issue(db, issue_id, current_user_id)
+    bundle = _issue_detail(db, issue)
+
+    if "comments" in include:
+        page = comments_service.build_comment_page(db, issue_id)
+        bundle["comments"] = page["data"]
+        bundle["comments_next_after_id"] = page["next_after_id"]
+    if "members" in include:
+        bundle["members"] = projects_service.build_member_page(db, issue.project_id)["data"]
+    if "viewer" in include:
+        bundle["viewer"] = {
+            "id": current_user_id,
+            "name": current_user_name,
+            "email": current_user_email,
+            "role": role,
+        }
+    return bundle
+
+
+EXPORT_CHUNK_ROWS = 500
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return role_value(value) if hasattr(value, "value") else value
+
+
+def _csv_chunks(rows) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(issues_dao.EXPORT_COLUMNS)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(["" if value is None else _export_value(value) for value in row])
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def _ndjson_chunks(rows) -> Iterator[bytes]:
+    lines = []
+    for row in rows:
+        lines.append(orjson.dumps(dict(zip(issues_dao.EXPORT_COLUMNS, map(_export_value, row)))))
+        if len(lines) == EXPORT_CHUNK_ROWS:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def stream_issue_export(project_id: int, export_format: str) -> Iterator[bytes]:
+    """
+    Encoded export of every issue in a project, produced a chunk at a time.
+
+    Runs on its own session because it is consumed after the request handler returns;
+    callers must have checked access (projects_service.authorize_project_stream) first.
+    """
+    with SessionLocal() as db:
+        rows = issues_dao.iter_issue_export_rows(db, project_id)
+        chunks = _csv_chunks(rows) if export_format == "csv" else _ndjson_chunks(rows)
+        yield from chunks
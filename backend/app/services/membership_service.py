@@ -0,0 +1,90 @@
+from sqlalchemy.orm import Session
+
+from app.core.cache import MISSING, TTLCache
+from app.core.config import MEMBERSHIP_CACHE_MAX_SIZE, MEMBERSHIP_CACHE_TTL_SECONDS
+from app.dao import projects_dao
+from app.models.project_member import ProjectRole
+from app.services.common import role_value
+
+# Process-wide (project_id, user_id) -> role cache; `None` records a confirmed non-member.
+_roles = TTLCache(max_size=MEMBERSHIP_CACHE_MAX_SIZE, ttl=MEMBERSHIP_CACHE_TTL_SECONDS)
+
+# Process-wide user_id -> {role: project count} summary behind /api/me.
+_role_summaries = TTLCache(max_size=MEMBERSHIP_CACHE_MAX_SIZE, ttl=MEMBERSHIP_CACHE_TTL_SECONDS)
+
+# Key of the per-request memo kept in Session.info (one session per request).
+_MEMO_KEY = "membership_roles"
+
+
+def get_role(db: Session, project_id: int, user_id: int) -> str | None:
+    memo = db.info.setdefault(_MEMO_KEY, {})
+    key = (project_id, user_id)
+    if key in memo:
+        return memo[key]
+
+    role = _roles.get(key)
+    if role is MISSING:
+        membership = projects_dao.get_membership(db, project_id, user_id)
+        role = role_value(membership.role) if membership else None
+        _roles.set(key, role)
+
+    memo[key] = role
+    return role
+
+
+def get_roles(db: Session, keys) -> dict[tuple[int, int], str | None]:
+    """Bulk `get_role` for `(project_id, user_id)` pairs; cache misses are loaded in one query."""
+    memo = db.info.setdefault(_MEMO_KEY, {})
+    roles = {}
+    missing = []
+    for key in set(keys):
+        role = memo[key] if key in memo else _roles.get(key)
+        if role is MISSING:
+            missing.append(key)
+        else:
+            roles[key] = memo[key] = role
+
+    if missing:
+        found = {
+            (membership.project_id, membership.user_id): role_value(membership.role)
+            for membership in projects_dao.list_memberships_by_keys(db, missing)
+        }
+        for key in missing:
+            role = found.get(key)
+            _roles.set(key, role)
+            roles[key] = memo[key] = role
+    return roles
+
+
+def get_role_summary(db: Session, user_id: int) -> dict[str, int]:
+    """How many projects the user holds each role in; one GROUP BY query on a cache miss."""
+    summary = _role_summaries.get(user_id)
+    if summary is MISSING:
+        summary = {role.value: 0 for role in ProjectRole}
+        for role, count in projects_dao.count_roles_for_user(db, user_id):
+            summary[role_value(role)] = count
+        _role_summaries.set(user_id, summary)
+    return dict(summary)
+
+
+def invalidate_membership(db: Session, project_id: int, user_id: int):
+    db.info.get(_MEMO_KEY, {}).pop((project_id, user_id), None)
+    _roles.invalidate((project_id, user_id))
+    _role_summaries.invalidate(user_id)
+
+
+def invalidate_project(db: Session, project_id: int):
+    memo = db.info.get(_MEMO_KEY, {})
+    for key in [key for key in memo if key[0] == project_id]:
+        del memo[key]
+    _roles.invalidate_where(lambda key: key[0] == project_id)
+    # Members of the project are not known here, and project deletion is rare.
+    _role_summaries.clear()
+
+
+def membership_cache_stats() -> dict:
+    return _roles.stats()
+
+
+def role_summary_cache_stats() -> dict:
+    return _role_summaries.stats()
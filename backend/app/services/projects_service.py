@@ -3,8 +3,12 @@ from sqlalchemy.orm import Session
 from datetime import date
 from typing import cast
 
+from app.core import events
+from app.core.conditional import Version, make_version
 from app.dao import projects_dao
-from app.services.common import role_value
+from app.models.issue import IssueStatus
+from app.services import membership_service
+from app.services.common import fetch_limit, role_value, split_page
 
 
 def create_project(
@@ -30,6 +34,7 @@ def create_project(
     projects_dao.create_project_member(
         db, project_id=project_id, user_id=creator_user_id, role="maintainer"
     )
+    membership_service.invalidate_membership(db, project_id, creator_user_id)
 
     return {
         "id": project.id,
@@ -40,30 +45,69 @@ def create_project(
     }
 
 
-def list_projects(db: Session, user_id: int):
-    memberships = projects_dao.list_memberships_for_user(db, user_id)
-    project_ids = [cast(int, m.project_id) for m in memberships]
-    projects = projects_dao.list_projects_by_ids(db, project_ids)
-    role_by_project_id = {cast(int, m.project_id): role_value(m.role) for m in memberships}
-
-    return [
-        {
-            "id": p.id,
-            "name": p.name,
-            "key": p.key,
-            "description": p.description,
-            "start_date": p.start_date,
-            "my_role": role_by_project_id.get(cast(int, p.id))
-        }
-        for p in projects
-    ]
+def get_projects_version(
+    db: Session,
+    user_id: int,
+    sort: str = "name",
+    limit: int | None = None,
+    offset: int = 0
+) -> Version:
+    # Projects are immutable once created, so memberships plus issue counts determine the list.
+    counts = sorted(
+        (project_id, role_value(role), role_value(status) if status is not None else "", issue_count or 0)
+        for project_id, role, status, issue_count in projects_dao.list_issue_counts_for_user(db, user_id)
+    )
+    return make_version("projects", user_id, counts, sort, limit, offset)
+
+
+def list_projects(
+    db: Session,
+    user_id: int,
+    sort: str = "name",
+    limit: int | None = None,
+    offset: int = 0
+):
+    rows, has_more = split_page(
+        projects_dao.list_projects_for_user(db, user_id, sort=sort, limit=fetch_limit(limit), offset=offset),
+        limit,
+    )
+    return {
+        "data": [
+            {
+                "id": row.id,
+                "name": row.name,
+                "key": row.key,
+                "description": row.description,
+                "start_date": row.start_date,
+                "my_role": role_value(row.role),
+                "open_issues": row.open_issues,
+                "total_issues": row.total_issues,
+            }
+            for row in rows
+        ],
+        "next_offset": offset + limit if has_more else None,
+    }
+
+
+def list_project_issue_stats(db: Session, user_id: int):
+    stats_by_project: dict[int, dict] = {}
+    for project_id, _, status, issue_count in projects_dao.list_issue_counts_for_user(db, user_id):
+        stats = stats_by_project.setdefault(project_id, {
+            "project_id": project_id,
+            **{issue_status.value: 0 for issue_status in IssueStatus},
+            "total": 0,
+        })
+        if status is not None:
+            stats[role_value(status)] = issue_count
+            stats["total"] += issue_count
+    return list(stats_by_project.values())
 
 
 def add_member_to_project(db: Session, project_id: int, request_user_id: int, email: str, role: str):
-    membership = projects_dao.get_membership(db, project_id, request_user_id)
-    if not membership:
+    request_role = membership_service.get_role(db, project_id, request_user_id)
+    if request_role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
-    if role_value(membership.role) != "maintainer":
+    if request_role != "maintainer":
         raise HTTPException(status_code=403, detail="Only maintainer can invite members")
 
     user = projects_dao.get_user_by_email(db, email)
@@ -78,6 +122,7 @@ def add_member_to_project(db: Session, project_id: int, request_user_id: int, em
     projects_dao.create_project_member(
         db, project_id=project_id, user_id=user_id, role=role
     )
+    membership_service.invalidate_membership(db, project_id, user_id)
     return {
         "message": "Member added successfully",
         "user_id": user_id,
@@ -86,25 +131,64 @@ def add_member_to_project(db: Session, project_id: int, request_user_id: int, em
     }
 
 
-def list_project_members(db: Session, project_id: int, request_user_id: int):
-    membership = projects_dao.get_membership(db, project_id, request_user_id)
-    if not membership:
+def get_members_version(
+    db: Session,
+    project_id: int,
+    request_user_id: int,
+    q: str | None = None,
+    limit: int | None = None,
+    offset: int = 0
+) -> Version:
+    role = membership_service.get_role(db, project_id, request_user_id)
+    if role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
 
-    members = projects_dao.list_project_members(db, project_id)
-    result = []
-    for m in members:
-        member_user_id = cast(int, m.user_id)
-        user = projects_dao.get_user_by_id(db, member_user_id)
-        if not user:
-            continue
-        result.append({
-            "id": cast(int, user.id),
-            "name": cast(str, user.name),
-            "email": cast(str, user.email),
-            "role": role_value(m.role)
-        })
-    return result
+    member_roles = [
+        (user_id, role_value(member_role))
+        for user_id, member_role in projects_dao.list_member_roles(db, project_id)
+    ]
+    # User names and emails never change, so the membership set plus the page args pin the body.
+    return make_version("members", project_id, member_roles, q, limit, offset)
+
+
+def list_project_members(
+    db: Session,
+    project_id: int,
+    request_user_id: int,
+    q: str | None = None,
+    limit: int | None = None,
+    offset: int = 0
+):
+    role = membership_service.get_role(db, project_id, request_user_id)
+    if role is None:
+        raise HTTPException(status_code=403, detail="Not a member of this project")
+
+    return build_member_page(db, project_id, q=q, limit=limit, offset=offset)
+
+
+def build_member_page(db: Session, project_id: int, q: str | None = None, limit: int | None = None, offset: int = 0):
+    """One page of a project's members; callers have already checked access to the project."""
+    rows, has_more = split_page(
+        projects_dao.list_project_members(db, project_id, q=q, limit=fetch_limit(limit), offset=offset),
+        limit,
+    )
+    return {
+        "data": [
+            {"id": user_id, "name": name, "email": email, "role": role_value(member_role)}
+            for user_id, name, email, member_role in rows
+        ],
+        "next_offset": offset + limit if has_more else None,
+    }
+
+
+def authorize_project_stream(db: Session, project_id: int, request_user_id: int):
+    """Membership check for responses that keep streaming after the request's own DB work (events, exports)."""
+    role = membership_service.get_role(db, project_id, request_user_id)
+    if role is None:
+        raise HTTPException(status_code=403, detail="Not a member of this project")
+
+    # The stream outlives this check; hand the connection back to the pool now.
+    db.rollback()
 
 
 def delete_project(db: Session, project_id: int, request_user_id: int):
@@ -112,15 +196,13 @@ def delete_project(db: Session, project_id: int, request_user_id: int):
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    membership = projects_dao.get_membership(db, project_id, request_user_id)
-    if not membership:
+    role = membership_service.get_role(db, project_id, request_user_id)
+    if role is None:
         raise HTTPException(status_code=403, detail="Not a member of this project")
-    if role_value(membership.role) != "maintainer":
+    if role != "maintainer":
         raise HTTPException(status_code=403, detail="Only maintainer can delete project")
 
-    issue_ids = projects_dao.list_issue_ids_for_project(db, project_id)
-    projects_dao.delete_comments_by_issue_ids(db, issue_ids)
-    projects_dao.delete_issues_by_project(db, project_id)
-    projects_dao.delete_memberships_by_project(db, project_id)
-    projects_dao.delete_project(db, project)
+    projects_dao.delete_project(db, project_id)
+    membership_service.invalidate_project(db, project_id)
+    events.publish(project_id, "project.deleted", {"id": project_id})
     return {"message": "Project deleted successfully"}
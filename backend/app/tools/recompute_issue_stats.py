@@ -0,0 +1,45 @@
+"""Rebuild the project_issue_stats counters from the issues table.
+
+    python -m app.tools.recompute_issue_stats             # every project
+    python -m app.tools.recompute_issue_stats --project MMT CPORT
+
+Issue writes keep the counters up to date; run this once to backfill a database whose issues
+were written before the table existed or by anything that bypassed issues_dao.
+"""
+import argparse
+import sys
+
+from app.dao import issues_dao, projects_dao
+from app.db.session import SessionLocal
+from app.models.comment import Comment  # noqa: F401  (registers mappers)
+from app.models.issue import Issue  # noqa: F401
+from app.models.project import Project  # noqa: F401
+from app.models.project_member import ProjectMember  # noqa: F401
+from app.models.user import User  # noqa: F401
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--project", nargs="+", metavar="KEY", help="project keys (default: all projects)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        project_ids = None
+        if args.project:
+            project_ids = []
+            for key in args.project:
+                project = projects_dao.get_project_by_key(db, key)
+                if project is None:
+                    sys.exit(f"No project with key '{key}'")
+                project_ids.append(project.id)
+        rows = issues_dao.recompute_issue_counts(db, project_ids)
+    finally:
+        db.close()
+
+    scope = ", ".join(args.project) if args.project else "all projects"
+    print(f"Rebuilt project_issue_stats for {scope}: {rows} (project, status) rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Package marker for static analyzers and tooling.
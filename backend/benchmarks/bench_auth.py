@@ -0,0 +1,70 @@
+"""Per-request cost of bearer-token authentication, with and without the verified-claims cache.
+
+    python -m benchmarks.bench_auth --rounds 20000
+
+"decode" rows verify the signature on every call (what get_current_user did before the cache);
+"cached" rows are repeat requests with the same token. "get_current_user" adds the user
+lookup, which is served from the user cache here, so no database is touched.
+"""
+import argparse
+import asyncio
+import time
+
+from app.core import tokens
+from app.core.dependencies import _user_for_token
+from app.core.security import create_access_token
+from app.core.tokens import verify_token
+from app.core.user_cache import CurrentUser, cache_user
+
+
+def _per_call_us(fn, rounds: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds * 1_000_000
+
+
+def _decoders() -> dict:
+    decoders = {}
+    for name, backend in tokens.BACKENDS.items():
+        try:
+            decoders[name] = backend()[1]
+        except RuntimeError:
+            print(f"{name}: not installed, skipped")
+    return decoders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+
+    email = "bench-auth@bench.io"
+    token = create_access_token({"sub": email})
+    cache_user(CurrentUser(id=1, name="Bench", email=email))
+    loop = asyncio.new_event_loop()
+
+    print(f"{'step':<34}{'per call':>12}")
+    for name, decode in _decoders().items():
+        print(f"{'decode (' + name + ')':<34}{_per_call_us(lambda: decode(token), args.rounds):>9.1f} us")
+
+    def uncached():
+        tokens.clear_token_cache()
+        verify_token(token)
+
+    print(f"{'verify_token, cache miss':<34}{_per_call_us(uncached, args.rounds):>9.1f} us")
+    print(f"{'verify_token, cached':<34}{_per_call_us(lambda: verify_token(token), args.rounds):>9.1f} us")
+
+    def current_user():
+        loop.run_until_complete(_user_for_token(token, None))
+
+    print(f"{'get_current_user, cached':<34}{_per_call_us(current_user, args.rounds):>9.1f} us")
+    tokens.clear_token_cache()
+    print(f"{'get_current_user, decode each':<34}"
+          f"{_per_call_us(lambda: (tokens.clear_token_cache(), current_user()), args.rounds):>9.1f} us")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
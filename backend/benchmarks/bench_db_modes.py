@@ -0,0 +1,94 @@
+"""Concurrent-request throughput of the sync and async database stacks.
+
+Each mode runs in its own interpreter because DB_MODE is read at import time:
+
+    python -m benchmarks.bench_db_modes --requests 2000 --concurrency 64
+
+Requires a migrated database in DATABASE_URL (and asyncpg/aiosqlite for async mode).
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+
+ISSUES = 50
+
+
+async def _prepare(ac: AsyncClient) -> tuple[dict, int]:
+    email = f"bench_{uuid.uuid4().hex[:8]}@bench.io"
+    await ac.post("/api/auth/signup", json={"name": "Bench", "email": email, "password": "password123"})
+    login = await ac.post("/api/auth/login", data={"username": email, "password": "password123"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    project = await ac.post(
+        "/api/projects/",
+        headers=headers,
+        json={"name": "Bench", "key": f"BENCH_{uuid.uuid4().hex[:8]}", "description": "Benchmark"},
+    )
+    project_id = project.json()["id"]
+    for i in range(ISSUES):
+        await ac.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": f"Bench issue {i}"})
+    return headers, project_id
+
+
+async def _run_mode(total: int, concurrency: int) -> dict:
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as ac:
+        headers, project_id = await _prepare(ac)
+        url = f"/api/projects/{project_id}/issues?page_size=50"
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def one():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await ac.get(url, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests_per_second": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["sync", "async"], help="run a single mode in this process")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    if args.mode:
+        result = asyncio.run(_run_mode(args.requests, args.concurrency))
+        print(
+            f"{args.mode:>5}: {result['requests_per_second']:8.1f} req/s  "
+            f"p50 {result['p50_ms']:7.1f} ms  p99 {result['p99_ms']:7.1f} ms"
+        )
+        return
+
+    print(f"GET /api/projects/{{id}}/issues, {args.requests} requests, concurrency {args.concurrency}")
+    for mode in ("sync", "async"):
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_db_modes", "--mode", mode,
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency)],
+            env={**os.environ, "DB_MODE": mode},
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
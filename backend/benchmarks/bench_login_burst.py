@@ -0,0 +1,68 @@
+"""/api/me latency while a burst of logins is hashing passwords.
+
+    python -m benchmarks.bench_login_burst --logins 200 --probes 200
+
+bcrypt runs in the bounded password-hash pool, so /api/me latency should stay close to the
+idle baseline; logins beyond the queue limit are rejected with 503 instead of piling up.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+
+PASSWORD = "password123"
+
+
+def _summary(latencies: list[float]) -> str:
+    latencies = sorted(latencies)
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    return f"p50 {statistics.median(latencies) * 1000:7.1f} ms  p99 {p99 * 1000:7.1f} ms"
+
+
+async def _probe_me(ac: AsyncClient, headers: dict, count: int) -> list[float]:
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = await ac.get("/api/me", headers=headers)
+        latencies.append(time.perf_counter() - started)
+        response.raise_for_status()
+    return latencies
+
+
+async def _run(logins: int, probes: int):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as ac:
+        email = f"burst_{uuid.uuid4().hex[:8]}@bench.io"
+        await ac.post("/api/auth/signup", json={"name": "Burst", "email": email, "password": PASSWORD})
+        login = await ac.post("/api/auth/login", data={"username": email, "password": PASSWORD})
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        idle = await _probe_me(ac, headers, probes)
+
+        async def one_login():
+            response = await ac.post("/api/auth/login", data={"username": email, "password": PASSWORD})
+            return response.status_code
+
+        burst = asyncio.gather(*(one_login() for _ in range(logins)))
+        busy = await _probe_me(ac, headers, probes)
+        statuses = await burst
+
+    print(f"/api/me idle:          {_summary(idle)}")
+    print(f"/api/me during burst:  {_summary(busy)}")
+    print(f"logins: {statuses.count(200)} ok, {statuses.count(503)} rejected with 503")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--probes", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(_run(args.logins, args.probes))
+
+
+if __name__ == "__main__":
+    main()
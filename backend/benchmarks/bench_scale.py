@@ -0,0 +1,156 @@
+"""Latency and queries per request of the main read endpoints on generated datasets.
+
+    python -m benchmarks.generate_data --scale small
+    python -m benchmarks.bench_scale --tags tiny small --requests 100
+
+For each dataset tag (see benchmarks.generate_data) the largest and the median project are
+exercised as one of their maintainers: the issue list unfiltered, with each filter and each
+sort, cursor and deep-offset paging, issue detail, comments, the project list and members.
+Requests run one at a time through the ASGI app, so the query count per request is exact.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from contextlib import contextmanager
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, func
+
+from app.core.security import create_access_token
+from app.db.session import SessionLocal, async_engine, engine
+from app.main import app
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.project_issue_stats import ProjectIssueStats
+from app.models.project_member import ProjectMember, ProjectRole
+from app.models.user import User
+from benchmarks.generate_data import NOUNS
+
+SAMPLE_ISSUES = 50
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    active_engine = async_engine.sync_engine if async_engine is not None else engine
+    event.listen(active_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(active_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    return sorted_values[max(int(len(sorted_values) * fraction + 0.5) - 1, 0)]
+
+
+def _targets(tag: str) -> list[dict]:
+    """The largest and the median project of a dataset, each with a maintainer and some issue ids."""
+    db = SessionLocal()
+    try:
+        totals = (
+            db.query(Project.id, Project.key, func.coalesce(func.sum(ProjectIssueStats.issue_count), 0))
+            .outerjoin(ProjectIssueStats, ProjectIssueStats.project_id == Project.id)
+            .filter(Project.key.like(f"{tag.upper()}\\_%", escape="\\"))
+            .group_by(Project.id, Project.key)
+            .order_by(func.coalesce(func.sum(ProjectIssueStats.issue_count), 0).desc())
+            .all()
+        )
+        if not totals:
+            raise SystemExit(f"No generated projects for tag '{tag}'; run benchmarks.generate_data first")
+
+        targets = []
+        for label, (project_id, key, issue_count) in (("largest", totals[0]), ("median", totals[len(totals) // 2])):
+            email, user_id = (
+                db.query(User.email, User.id)
+                .join(ProjectMember, ProjectMember.user_id == User.id)
+                .filter(ProjectMember.project_id == project_id, ProjectMember.role == ProjectRole.maintainer)
+                .first()
+            )
+            issue_ids = [
+                issue_id for (issue_id,) in
+                db.query(Issue.id).filter(Issue.project_id == project_id).order_by(Issue.id).limit(SAMPLE_ISSUES)
+            ]
+            targets.append({
+                "label": f"{label} ({key}, {issue_count} issues)",
+                "project_id": project_id,
+                "user_id": user_id,
+                "issue_ids": issue_ids or [0],
+                "headers": {"Authorization": f"Bearer {create_access_token({'sub': email})}"},
+            })
+        return targets
+    finally:
+        db.close()
+
+
+def _endpoints(target: dict) -> dict[str, list[str]]:
+    project = f"/api/projects/{target['project_id']}"
+    issue_ids = target["issue_ids"]
+    return {
+        "issues": [f"{project}/issues?page_size=20"],
+        "issues status=open": [f"{project}/issues?page_size=20&status=open"],
+        "issues priority=high": [f"{project}/issues?page_size=20&priority=high"],
+        "issues assignee": [f"{project}/issues?page_size=20&assignee={target['user_id']}"],
+        "issues q=<word>": [f"{project}/issues?page_size=20&q={word}" for word in NOUNS],
+        "issues sort=created_at": [f"{project}/issues?page_size=20&sort=created_at"],
+        "issues sort=priority": [f"{project}/issues?page_size=20&sort=priority"],
+        "issues sort=status": [f"{project}/issues?page_size=20&sort=status"],
+        "issues page=100": [f"{project}/issues?page_size=20&page=100"],
+        "issues cursor": [f"{project}/issues?page_size=20&pagination=cursor"],
+        "issue detail": [f"/api/issues/{issue_id}" for issue_id in issue_ids],
+        "comments": [f"/api/issues/{issue_id}/comments" for issue_id in issue_ids],
+        "project list": ["/api/projects/"],
+        "members": [f"{project}/members"],
+    }
+
+
+async def _measure(ac: AsyncClient, headers: dict, urls: list[str], requests: int) -> dict:
+    await ac.get(urls[0], headers=headers)
+    latencies = []
+    queries = []
+    for i in range(requests):
+        with count_queries() as statements:
+            started = time.perf_counter()
+            response = await ac.get(urls[i % len(urls)], headers=headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        queries.append(len(statements))
+
+    latencies.sort()
+    return {
+        "p50": _percentile(latencies, 0.50),
+        "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99),
+        "queries": statistics.mean(queries),
+    }
+
+
+async def _run(tags: list[str], requests: int):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as ac:
+        for tag in tags:
+            for target in _targets(tag):
+                print(f"\n[{tag}] {target['label']}")
+                print(f"{'endpoint':<24}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}")
+                for name, urls in _endpoints(target).items():
+                    result = await _measure(ac, target["headers"], urls, requests)
+                    print(
+                        f"{name:<24}{result['p50']:>9.1f}{result['p95']:>9.1f}"
+                        f"{result['p99']:>9.1f}{result['queries']:>9.1f}"
+                    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tags", nargs="+", default=["tiny"])
+    parser.add_argument("--requests", type=int, default=100, help="requests per endpoint")
+    args = parser.parse_args()
+    asyncio.run(_run(args.tags, args.requests))
+
+
+if __name__ == "__main__":
+    main()
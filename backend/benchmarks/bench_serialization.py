@@ -0,0 +1,99 @@
+"""JSON encoding cost of issue and comment pages, old path vs response models + orjson.
+
+    python -m benchmarks.bench_serialization --sizes 10 100 500 --rounds 200
+
+"jsonable_encoder + json" is what FastAPI did for the untyped dict responses; "model + orjson"
+is what it does now that routes declare response models and the app uses ORJSONResponse.
+No database is needed: pages are built in memory with the same shape the services return.
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.models.issue import IssuePriority, IssueStatus
+from app.schemas.comment import CommentOut
+from app.schemas.issue import IssueListPage
+
+
+def _issue_page(size: int) -> dict:
+    statuses, priorities = list(IssueStatus), list(IssuePriority)
+    return {
+        "total": size * 10,
+        "page": 1,
+        "page_size": size,
+        "data": [
+            {
+                "id": i,
+                "title": f"Issue {i}: checkout fails when the cart holds more than {i} items",
+                "status": statuses[i % len(statuses)],
+                "priority": priorities[i % len(priorities)],
+                "reporter_id": i % 50,
+                "reporter_name": f"Reporter {i % 50}",
+                "assignee_id": i % 30 or None,
+                "assignee_name": f"Assignee {i % 30}" if i % 30 else None,
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def _comment_page(size: int) -> list[dict]:
+    start = datetime(2026, 1, 1)
+    return [
+        {
+            "id": i,
+            "body": f"Update {i}: still reproducible on build {i * 7}, attaching logs.",
+            "author_id": i % 20,
+            "created_at": start + timedelta(seconds=i * 37, microseconds=i),
+        }
+        for i in range(size)
+    ]
+
+
+def _old_path(content) -> bytes:
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _new_path(adapter: TypeAdapter):
+    def encode(content) -> bytes:
+        # FastAPI validates against the response model, dumps in JSON mode, then ORJSONResponse renders.
+        return orjson.dumps(adapter.dump_python(adapter.validate_python(content), mode="json"))
+
+    return encode
+
+
+def _per_call_us(encode, content, rounds: int) -> float:
+    encode(content)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        encode(content)
+    return (time.perf_counter() - started) / rounds * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 500])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = {
+        "issues": (_issue_page, TypeAdapter(IssueListPage)),
+        "comments": (_comment_page, TypeAdapter(list[CommentOut])),
+    }
+    print(f"{'payload':<10}{'items':>7}{'jsonable_encoder + json':>26}{'model + orjson':>17}{'speedup':>9}")
+    for name, (build, adapter) in payloads.items():
+        new_path = _new_path(adapter)
+        for size in args.sizes:
+            content = build(size)
+            old_us = _per_call_us(_old_path, content, args.rounds)
+            new_us = _per_call_us(new_path, content, args.rounds)
+            print(f"{name:<10}{size:>7}{old_us:>23.0f} us{new_us:>14.0f} us{old_us / new_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
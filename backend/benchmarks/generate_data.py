@@ -0,0 +1,247 @@
+"""Synthetic, skewed dataset for scale benchmarks.
+
+    python -m benchmarks.generate_data --scale small
+    python -m benchmarks.generate_data --scale large --tag big   # 10k users, 1k projects, 5M issues, 20M comments
+
+Rows are written straight into the tables with batched multi-row INSERTs (project_issue_stats
+is kept in step), and everything is tagged so several scales can live in one database:
+projects are keyed `<TAG>_<n>` and users are `user<n>@<tag>.scale.io` with password
+`password123`. The data is skewed the way real trackers are: issue volume per project follows
+a Zipf curve, big projects have more members, a few members report and own most issues, and
+comments per issue are exponentially distributed. The same --seed gives the same dataset.
+"""
+import argparse
+import itertools
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from app.core.security import get_password_hash
+from app.dao import issues_dao
+from app.db.session import SessionLocal
+from app.models.comment import Comment
+from app.models.issue import Issue, IssuePriority, IssueStatus
+from app.models.project import Project
+from app.models.project_member import ProjectMember, ProjectRole
+from app.models.user import User
+
+PASSWORD = "password123"
+
+SCALES = {
+    "tiny": {"users": 200, "projects": 20, "issues": 10_000, "comments": 40_000},
+    "small": {"users": 2_000, "projects": 200, "issues": 200_000, "comments": 800_000},
+    "medium": {"users": 10_000, "projects": 1_000, "issues": 1_000_000, "comments": 4_000_000},
+    "large": {"users": 10_000, "projects": 1_000, "issues": 5_000_000, "comments": 20_000_000},
+}
+
+# Share of issues per project ~ 1 / rank ** PROJECT_ZIPF.
+PROJECT_ZIPF = 1.1
+MAX_PROJECT_MEMBERS = 300
+STATUS_WEIGHTS = {
+    IssueStatus.open: 30, IssueStatus.in_progress: 10, IssueStatus.resolved: 20, IssueStatus.closed: 40,
+}
+PRIORITY_WEIGHTS = {
+    IssuePriority.low: 30, IssuePriority.medium: 45, IssuePriority.high: 20, IssuePriority.critical: 5,
+}
+UNASSIGNED_SHARE = 0.25
+HISTORY_DAYS = 730
+
+FIRST_NAMES = ["Ali", "Ayesha", "Rahul", "Mei", "Lucas", "Fatima", "Noah", "Sara", "Ivan", "Priya", "Omar", "Elena"]
+LAST_NAMES = ["Khan", "Sharma", "Chen", "Silva", "Novak", "Haddad", "Okafor", "Berg", "Tanaka", "Rossi"]
+VERBS = ["Fix", "Investigate", "Improve", "Refactor", "Add", "Remove", "Document", "Speed up"]
+NOUNS = [
+    "login", "checkout", "search", "export", "dashboard", "invoice", "upload", "timeout",
+    "cache", "webhook", "billing", "notification", "permissions", "report", "sync", "import",
+]
+COMMENT_PHRASES = [
+    "Reproduced on staging.", "Attaching logs.", "Fixed in the latest build.", "Can we get a test for this?",
+    "Still happening for some users.", "Duplicate of an older ticket.", "Deployed, please verify.",
+]
+
+
+def _skewed_pick(rng: random.Random, items: list):
+    # Squaring a uniform draw favours the front of the list: the first members do most of the work.
+    return items[int(len(items) * rng.random() ** 2)]
+
+
+def _insert_returning_ids(db, model, rows: list[dict]) -> list[int]:
+    result = db.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+    return [row_id for (row_id,) in result]
+
+
+def _chunks(rows: list, size: int):
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _create_users(db, tag: str, count: int, batch_size: int, rng: random.Random) -> list[int]:
+    password_hash = get_password_hash(PASSWORD)
+    user_ids = []
+    for chunk in _chunks(range(count), batch_size):
+        user_ids += _insert_returning_ids(db, User, [
+            {
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "email": f"user{i}@{tag}.scale.io",
+                "password_hash": password_hash,
+            }
+            for i in chunk
+        ])
+    db.commit()
+    return user_ids
+
+
+def _create_projects(db, tag: str, user_ids: list[int], count: int, batch_size: int, rng: random.Random):
+    project_ids = []
+    for chunk in _chunks(range(count), batch_size):
+        project_ids += _insert_returning_ids(db, Project, [
+            {
+                "name": f"{rng.choice(NOUNS).title()} {rng.choice(NOUNS).title()} {i}",
+                "key": f"{tag.upper()}_{i}",
+                "description": f"Generated project {i} ({tag})",
+            }
+            for i in chunk
+        ])
+
+    # Project i gets roughly 1 / (i + 1) ** PROJECT_ZIPF of the issues and a team to match.
+    members_by_project = {}
+    member_rows = []
+    for rank, project_id in enumerate(project_ids):
+        size = min(len(user_ids), max(3, int(MAX_PROJECT_MEMBERS / (rank + 1) ** 0.5)))
+        members = []
+        seen = set()
+        while len(members) < size:
+            user_id = _skewed_pick(rng, user_ids)
+            if user_id not in seen:
+                seen.add(user_id)
+                members.append(user_id)
+        members_by_project[project_id] = members
+        maintainers = max(1, size // 10)
+        member_rows += [
+            {
+                "project_id": project_id,
+                "user_id": user_id,
+                "role": ProjectRole.maintainer if position < maintainers else ProjectRole.member,
+            }
+            for position, user_id in enumerate(members)
+        ]
+
+    for chunk in _chunks(member_rows, batch_size):
+        db.execute(insert(ProjectMember), chunk)
+    db.commit()
+    return project_ids, members_by_project, len(member_rows)
+
+
+def _create_issues_and_comments(
+    db, project_ids: list[int], members_by_project: dict, issues: int, comments: int,
+    batch_size: int, rng: random.Random
+) -> int:
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) ** PROJECT_ZIPF for rank in range(len(project_ids))))
+    statuses, status_weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+    priorities, priority_weights = list(PRIORITY_WEIGHTS), list(PRIORITY_WEIGHTS.values())
+    mean_comments = comments / issues if issues else 0
+    history_start = datetime.utcnow() - timedelta(days=HISTORY_DAYS)
+    history_seconds = HISTORY_DAYS * 86400
+
+    comments_written = 0
+    pending_comments = []
+    created = 0
+    while created < issues:
+        size = min(batch_size, issues - created)
+        stats = Counter()
+        rows = []
+        for project_id in rng.choices(project_ids, cum_weights=cum_weights, k=size):
+            members = members_by_project[project_id]
+            status = rng.choices(statuses, status_weights)[0]
+            created_at = history_start + timedelta(seconds=rng.randrange(history_seconds))
+            stats[(project_id, status)] += 1
+            rows.append({
+                "project_id": project_id,
+                "title": f"{rng.choice(VERBS)} {rng.choice(NOUNS)} {rng.choice(NOUNS)} ({rng.randrange(10_000)})",
+                "description": f"Steps: open {rng.choice(NOUNS)}, then {rng.choice(NOUNS)}." if rng.random() < 0.6 else None,
+                "status": status,
+                "priority": rng.choices(priorities, priority_weights)[0],
+                "reporter_id": _skewed_pick(rng, members),
+                "assignee_id": None if rng.random() < UNASSIGNED_SHARE else _skewed_pick(rng, members),
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+
+        issue_ids = _insert_returning_ids(db, Issue, rows)
+        issues_dao.adjust_issue_counts(db, stats)
+
+        for issue_id, row in zip(issue_ids, rows):
+            if comments_written + len(pending_comments) >= comments:
+                break
+            count = int(rng.expovariate(1 / mean_comments)) if mean_comments else 0
+            members = members_by_project[row["project_id"]]
+            at = row["created_at"]
+            for _ in range(count):
+                at += timedelta(minutes=rng.randrange(1, 2880))
+                pending_comments.append({
+                    "issue_id": issue_id,
+                    "author_id": _skewed_pick(rng, members),
+                    "body": rng.choice(COMMENT_PHRASES),
+                    "created_at": at,
+                })
+
+        while len(pending_comments) >= batch_size:
+            db.execute(insert(Comment), pending_comments[:batch_size])
+            comments_written += batch_size
+            del pending_comments[:batch_size]
+        db.commit()
+
+        created += size
+        print(f"  issues {created}/{issues}, comments {comments_written}", file=sys.stderr, end="\r")
+
+    if pending_comments:
+        db.execute(insert(Comment), pending_comments)
+        comments_written += len(pending_comments)
+        db.commit()
+    print(file=sys.stderr)
+    return comments_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=list(SCALES), default="tiny")
+    parser.add_argument("--tag", help="dataset label used in keys and emails (default: the scale name)")
+    parser.add_argument("--users", type=int)
+    parser.add_argument("--projects", type=int)
+    parser.add_argument("--issues", type=int)
+    parser.add_argument("--comments", type=int)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    sizes = {name: getattr(args, name) or default for name, default in SCALES[args.scale].items()}
+    tag = (args.tag or args.scale).lower()
+    rng = random.Random(args.seed)
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        user_ids = _create_users(db, tag, sizes["users"], args.batch_size, rng)
+        project_ids, members_by_project, memberships = _create_projects(
+            db, tag, user_ids, sizes["projects"], args.batch_size, rng
+        )
+        comments = _create_issues_and_comments(
+            db, project_ids, members_by_project, sizes["issues"], sizes["comments"], args.batch_size, rng
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    rows = len(user_ids) + len(project_ids) + memberships + sizes["issues"] + comments
+    print(
+        f"{tag}: {len(user_ids)} users, {len(project_ids)} projects, {memberships} memberships, "
+        f"{sizes['issues']} issues, {comments} comments in {elapsed:.1f}s ({rows / elapsed:.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
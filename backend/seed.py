@@ -1,3 +1,4 @@
+from app.dao import issues_dao
 from app.db.session import SessionLocal
 from app.models.user import User
 from app.models.project import Project
@@ -234,6 +235,8 @@ def get_or_create_issue(db, issue_data, projects_by_key, users_by_email):
         assignee_id=assignee.id if assignee else None,
     )
     db.add(issue)
+    db.flush()
+    issues_dao.adjust_issue_counts(db, {(project.id, issue.status): 1})
     db.commit()
     db.refresh(issue)
     return issue
@@ -65,3 +65,107 @@ async def test_issue_access_denied_for_non_member():
         assert response.status_code == 403
 
 
+@pytest.mark.asyncio
+async def test_login_returns_503_when_password_hashing_queue_is_full(monkeypatch):
+    import threading
+    from app.core import security
+
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"busy_{uuid.uuid4().hex[:6]}@test.com"
+        await ac.post("/api/auth/signup", json={
+            "name": "Busy",
+            "email": email,
+            "password": "password123"
+        })
+
+        monkeypatch.setattr(security, "_password_slots", threading.BoundedSemaphore(1))
+        security._password_slots.acquire()
+
+        response = await ac.post("/api/auth/login", data={
+            "username": email,
+            "password": "password123"
+        })
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_me_returns_cached_role_summary_with_etag_and_paged_project_roles():
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        owner_email = f"meowner_{uuid.uuid4().hex[:6]}@test.com"
+        email = f"me_{uuid.uuid4().hex[:6]}@test.com"
+        tokens = {}
+        for address in (owner_email, email):
+            await ac.post("/api/auth/signup", json={"name": "Me", "email": address, "password": "password123"})
+            login = await ac.post("/api/auth/login", data={"username": address, "password": "password123"})
+            tokens[address] = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        headers = tokens[email]
+
+        own = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Mine", "key": f"ME_{uuid.uuid4().hex[:6]}", "description": "Test"},
+        )
+        me = await ac.get("/api/me", headers=headers)
+        assert me.status_code == 200
+        assert me.json()["project_count"] == 1
+        assert me.json()["role_counts"] == {"maintainer": 1, "member": 0}
+        assert "projects" not in me.json()
+
+        before = (await ac.get("/api/metrics", headers=headers)).json()["role_summary_cache"]
+        unchanged = await ac.get("/api/me", headers={**headers, "If-None-Match": me.headers["etag"]})
+        after = (await ac.get("/api/metrics", headers=headers)).json()["role_summary_cache"]
+        assert unchanged.status_code == 304
+        assert after["hits"] > before["hits"] and after["misses"] == before["misses"]
+
+        other_ids = []
+        for i in range(2):
+            project = await ac.post(
+                "/api/projects/",
+                headers=tokens[owner_email],
+                json={"name": f"Theirs {i}", "key": f"MO{i}_{uuid.uuid4().hex[:6]}", "description": "Test"},
+            )
+            other_ids.append(project.json()["id"])
+            await ac.post(
+                f"/api/projects/{other_ids[-1]}/members",
+                headers=tokens[owner_email],
+                json={"email": email, "role": "member"},
+            )
+
+        changed = await ac.get("/api/me", headers={**headers, "If-None-Match": me.headers["etag"]})
+        assert changed.status_code == 200
+        assert changed.json()["role_counts"] == {"maintainer": 1, "member": 2}
+
+        first = await ac.get("/api/me?projects=true&limit=2", headers=headers)
+        assert first.json()["projects"] == [
+            {"project_id": own.json()["id"], "role": "maintainer"},
+            {"project_id": other_ids[0], "role": "member"},
+        ]
+        assert first.headers["x-next-offset"] == "2"
+        rest = await ac.get("/api/me?projects=true&limit=2&offset=2", headers=headers)
+        assert rest.json()["projects"] == [{"project_id": other_ids[1], "role": "member"}]
+        assert "x-next-offset" not in rest.headers
+
+        await ac.delete(f"/api/projects/{other_ids[1]}", headers=tokens[owner_email])
+        after_delete = await ac.get("/api/me", headers=headers)
+        assert after_delete.json()["role_counts"] == {"maintainer": 1, "member": 1}
+
+
+@pytest.mark.asyncio
+async def test_metrics_require_authentication():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        anonymous = await ac.get("/api/metrics")
+        assert anonymous.status_code == 401
+
+        email = f"metrics_{uuid.uuid4().hex[:6]}@test.com"
+        await ac.post("/api/auth/signup", json={"name": "Metrics", "email": email, "password": "password123"})
+        login = await ac.post("/api/auth/login", data={"username": email, "password": "password123"})
+        response = await ac.get("/api/metrics", headers={"Authorization": f"Bearer {login.json()['access_token']}"})
+        assert response.status_code == 200
+        assert "db_pool" in response.json()
@@ -0,0 +1,40 @@
+from app.core import cache
+from app.core.cache import MISSING, TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    ttl_cache = TTLCache(max_size=10, ttl=5)
+
+    ttl_cache.set("a", 1)
+    assert ttl_cache.get("a") == 1
+
+    now[0] += 5
+    assert ttl_cache.get("a") is MISSING
+    assert ttl_cache.stats()["hits"] == 1
+    assert ttl_cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    ttl_cache = TTLCache(max_size=2, ttl=60)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("b") is MISSING
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_invalidate_where():
+    ttl_cache = TTLCache(max_size=10, ttl=60)
+    ttl_cache.set((1, 10), "member")
+    ttl_cache.set((1, 11), "maintainer")
+    ttl_cache.set((2, 10), "member")
+
+    ttl_cache.invalidate_where(lambda key: key[0] == 1)
+
+    assert ttl_cache.get((1, 10)) is MISSING
+    assert ttl_cache.get((2, 10)) == "member"
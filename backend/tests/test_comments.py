@@ -0,0 +1,184 @@
+import importlib.util
+import os
+import pytest
+import uuid
+from datetime import datetime
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import create_engine, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.dao import comments_dao
+from app.db.base import Base
+from app.db.session import SessionLocal
+from app.main import app
+from app.models.comment import Comment
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.user import User
+
+MIGRATION = os.path.join(
+    os.path.dirname(__file__), "..", "alembic", "versions", "a3c5e7f9b1d2_comment_created_at_not_null.py"
+)
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_comment_thread_pages_in_order_and_fetches_only_new_comments():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"thread_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"THR_{uuid.uuid4().hex[:6]}"
+
+        token = await signup_and_login(ac, "Thread", email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Thread Project", "key": key, "description": "Test"},
+        )
+        issue = await ac.post(
+            f"/api/projects/{project.json()['id']}/issues",
+            headers=headers,
+            json={"title": "Long running incident"},
+        )
+        issue_id = issue.json()["id"]
+
+        posted = []
+        for i in range(5):
+            comment = await ac.post(
+                f"/api/issues/{issue_id}/comments",
+                headers=headers,
+                json={"body": f"Update {i}"},
+            )
+            posted.append(comment.json()["id"])
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            response = await ac.get(f"/api/issues/{issue_id}/comments", headers=headers, params=params)
+            assert response.status_code == 200
+            assert len(response.json()) <= 2
+            seen.extend(c["id"] for c in response.json())
+            next_after_id = response.headers.get("x-next-after-id")
+            if next_after_id is None:
+                break
+            params["after_id"] = next_after_id
+
+        assert seen == posted
+
+        newer = await ac.get(
+            f"/api/issues/{issue_id}/comments",
+            headers=headers,
+            params={"after_id": posted[-1]},
+        )
+        assert newer.json() == []
+        assert "x-next-after-id" not in newer.headers
+
+        latest = await ac.post(
+            f"/api/issues/{issue_id}/comments",
+            headers=headers,
+            json={"body": "Resolved"},
+        )
+        newer = await ac.get(
+            f"/api/issues/{issue_id}/comments",
+            headers=headers,
+            params={"after_id": posted[-1]},
+        )
+        assert [c["id"] for c in newer.json()] == [latest.json()["id"]]
+
+        foreign = await ac.get(
+            f"/api/issues/{issue_id}/comments",
+            headers=headers,
+            params={"after_id": 10**9},
+        )
+        assert foreign.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_comments_since_accepts_timestamps_with_an_offset():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"since_{uuid.uuid4().hex[:6]}@test.com"
+        token = await signup_and_login(ac, "Since", email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Since Project", "key": f"SIN_{uuid.uuid4().hex[:6]}", "description": "Test"},
+        )
+        issue = await ac.post(
+            f"/api/projects/{project.json()['id']}/issues",
+            headers=headers,
+            json={"title": "Timeline"},
+        )
+        issue_id = issue.json()["id"]
+        author_id = issue.json()["reporter_id"]
+
+        with SessionLocal() as db:
+            db.add_all([
+                Comment(issue_id=issue_id, author_id=author_id, body="Morning", created_at=datetime(2026, 1, 1, 10, 0)),
+                Comment(issue_id=issue_id, author_id=author_id, body="Noon", created_at=datetime(2026, 1, 1, 12, 0)),
+            ])
+            db.commit()
+
+        # 13:00 at UTC+02:00 is 11:00 UTC, between the two comments.
+        response = await ac.get(
+            f"/api/issues/{issue_id}/comments",
+            headers=headers,
+            params={"since": "2026-01-01T13:00:00+02:00"},
+        )
+        assert response.status_code == 200
+        assert [c["body"] for c in response.json()] == ["Noon"]
+
+
+def test_comment_thread_pages_past_comments_backfilled_by_the_not_null_migration(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'backfill.db'}")
+    Base.metadata.create_all(engine)
+    spec = importlib.util.spec_from_file_location("comment_created_at_not_null", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    with engine.begin() as conn, Operations.context(MigrationContext.configure(conn)):
+        # Back to the pre-migration schema, where comments could lack a timestamp.
+        migration.downgrade()
+        conn.execute(insert(User), [{"id": 1, "name": "Old", "email": "old@test.com", "password_hash": "x"}])
+        conn.execute(insert(Project), [{"id": 1, "name": "Old Project", "key": "OLD"}])
+        conn.execute(insert(Issue), [
+            {"id": 1, "project_id": 1, "title": "Legacy", "reporter_id": 1, "created_at": datetime(2025, 1, 1)},
+        ])
+        conn.execute(insert(Comment.__table__), [
+            {"id": 1, "issue_id": 1, "author_id": 1, "body": "Untimed A", "created_at": None},
+            {"id": 2, "issue_id": 1, "author_id": 1, "body": "Untimed B", "created_at": None},
+            {"id": 3, "issue_id": 1, "author_id": 1, "body": "Dated", "created_at": datetime(2025, 6, 1)},
+        ])
+        migration.upgrade()
+
+    with Session(engine) as db:
+        assert db.get(Comment, 1).created_at == datetime(2025, 1, 1)
+        seen, after = [], None
+        while True:
+            page = comments_dao.list_comments_by_issue(db, 1, after=after, limit=1)
+            if not page:
+                break
+            seen.append(page[0].body)
+            after = page[0]
+        assert seen == ["Untimed A", "Untimed B", "Dated"]
+
+    with pytest.raises(IntegrityError), engine.begin() as conn:
+        conn.execute(insert(Comment.__table__).values(issue_id=1, author_id=1, body="Raw", created_at=None))
+    engine.dispose()
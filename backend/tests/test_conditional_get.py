@@ -0,0 +1,119 @@
+import pytest
+import uuid
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+async def assert_revalidates(ac: AsyncClient, url: str, headers: dict):
+    """Fetch `url`, check a conditional re-fetch is a bodiless 304, and return the ETag."""
+    first = await ac.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    again = await ac.get(url, headers={**headers, "If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+    return etag
+
+
+@pytest.mark.asyncio
+async def test_reads_answer_304_until_the_resource_changes():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        owner_email = f"etag_{uuid.uuid4().hex[:6]}@test.com"
+        member_email = f"etagm_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"ETAG_{uuid.uuid4().hex[:6]}"
+
+        owner_token = await signup_and_login(ac, "Owner", owner_email, "password123")
+        await signup_and_login(ac, "Member", member_email, "password123")
+        headers = {"Authorization": f"Bearer {owner_token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "ETag Project", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+        issue = await ac.post(
+            f"/api/projects/{project_id}/issues",
+            headers=headers,
+            json={"title": "Cached issue"},
+        )
+        issue_id = issue.json()["id"]
+
+        issue_url = f"/api/issues/{issue_id}"
+        etag = await assert_revalidates(ac, issue_url, headers)
+        last_modified = (await ac.get(issue_url, headers=headers)).headers["last-modified"]
+        since = await ac.get(issue_url, headers={**headers, "If-Modified-Since": last_modified})
+        assert since.status_code == 304
+        await ac.patch(issue_url, headers=headers, json={"title": "Renamed"})
+        changed = await ac.get(issue_url, headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["title"] == "Renamed"
+
+        comments_url = f"/api/issues/{issue_id}/comments"
+        etag = await assert_revalidates(ac, comments_url, headers)
+        await ac.post(comments_url, headers=headers, json={"body": "New"})
+        changed = await ac.get(comments_url, headers={**headers, "If-None-Match": etag})
+        assert [c["body"] for c in changed.json()] == ["New"]
+
+        members_url = f"/api/projects/{project_id}/members"
+        etag = await assert_revalidates(ac, members_url, headers)
+        await ac.post(members_url, headers=headers, json={"email": member_email, "role": "member"})
+        changed = await ac.get(members_url, headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert len(changed.json()) == 2
+
+        etag = await assert_revalidates(ac, "/api/projects/", headers)
+        await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Another", "key": f"{key}_2", "description": "Test"},
+        )
+        changed = await ac.get("/api/projects/", headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_does_not_bypass_permission_checks():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        owner_email = f"etago_{uuid.uuid4().hex[:6]}@test.com"
+        outsider_email = f"etagx_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"ETGX_{uuid.uuid4().hex[:6]}"
+
+        owner_token = await signup_and_login(ac, "Owner", owner_email, "password123")
+        outsider_token = await signup_and_login(ac, "Outsider", outsider_email, "password123")
+        headers = {"Authorization": f"Bearer {owner_token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Private", "key": key, "description": "Test"},
+        )
+        issue = await ac.post(
+            f"/api/projects/{project.json()['id']}/issues",
+            headers=headers,
+            json={"title": "Secret"},
+        )
+        issue_url = f"/api/issues/{issue.json()['id']}"
+        etag = (await ac.get(issue_url, headers=headers)).headers["etag"]
+
+        denied = await ac.get(
+            issue_url,
+            headers={"Authorization": f"Bearer {outsider_token}", "If-None-Match": etag},
+        )
+        assert denied.status_code == 403
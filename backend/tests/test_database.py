@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.dao import issues_dao
+from app.db.base import Base
+from app.db.session import AsyncDatabase, Database, enforce_sqlite_foreign_keys
+from app.models.comment import Comment  # noqa: F401  (registers mappers)
+from app.models.issue import IssueStatus
+from app.models.project import Project
+from app.models.project_issue_stats import ProjectIssueStats
+from app.models.project_member import ProjectMember  # noqa: F401
+from app.models.user import User
+
+
+def test_database_requires_run():
+    with pytest.raises(TypeError):
+        Database()
+
+
+def test_unknown_db_mode_is_rejected():
+    env = {**os.environ, "DB_MODE": "asynch"}
+    result = subprocess.run(
+        [sys.executable, "-c", "import app.core.config"],
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert "Unknown DB_MODE 'asynch'" in result.stderr
+
+
+@pytest.mark.asyncio
+async def test_async_database_runs_sync_dao_code_on_an_async_session(tmp_path):
+    # Exercised here whatever DB_MODE the suite runs under.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    enforce_sqlite_foreign_keys(engine.sync_engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    def seed(db):
+        user = User(name="Async", email="async@test.com", password_hash="x")
+        project = Project(name="Async Project", key="ASYNC")
+        db.add_all([user, project])
+        db.commit()
+        return project.id, user.id
+
+    try:
+        async with async_sessionmaker(engine)() as session:
+            db = AsyncDatabase(session)
+            project_id, user_id = await db.run(seed)
+            kept, dropped = [
+                await db.run(issues_dao.create_issue, project_id, title, None, "high", user_id, None)
+                for title in ("Kept", "Dropped")
+            ]
+            kept.status = IssueStatus.closed
+            await db.run(issues_dao.commit_issue, kept)
+            await db.run(issues_dao.delete_issue, dropped)
+            counts = await db.run(
+                lambda s: s.query(ProjectIssueStats.status, ProjectIssueStats.issue_count)
+                .filter(ProjectIssueStats.project_id == project_id)
+                .all()
+            )
+        assert dict(counts) == {IssueStatus.open: 0, IssueStatus.closed: 1}
+    finally:
+        await engine.dispose()
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import orjson
+import pytest
+import uuid
+from httpx import AsyncClient, ASGITransport
+
+from app.core.events import InProcessBroker, format_sse, get_broker
+from app.main import app
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_broker_delivers_events_published_from_other_threads():
+    broker = InProcessBroker(queue_size=2)
+    with broker.subscribe(7) as subscription, broker.subscribe(8) as other:
+        thread = threading.Thread(target=broker.publish, args=(7, "issue.created", {"id": 1}))
+        thread.start()
+        thread.join()
+
+        event = await subscription.get(timeout=1)
+        assert (event.type, event.data) == ("issue.created", {"id": 1})
+        assert format_sse(event) == f'id: {event.id}\nevent: issue.created\ndata: {{"id":1}}\n\n'.encode()
+        assert await other.get(timeout=0.01) is None
+
+        for i in range(3):
+            broker.publish(7, "issue.updated", {"id": i})
+        await asyncio.sleep(0)
+        assert subscription.overflowed
+
+    assert broker.stats()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_services_publish_issue_and_comment_changes_after_commit():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"events_{uuid.uuid4().hex[:6]}@test.com"
+        outsider_email = f"eventsx_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"EVT_{uuid.uuid4().hex[:6]}"
+
+        token = await signup_and_login(ac, "Watcher", email, "password123")
+        outsider_token = await signup_and_login(ac, "Outsider", outsider_email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Events Project", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+
+        denied = await ac.post(
+            f"/api/projects/{project_id}/events/ticket",
+            headers={"Authorization": f"Bearer {outsider_token}"},
+        )
+        assert denied.status_code == 403
+
+        with get_broker().subscribe(project_id) as subscription:
+            issue = await ac.post(
+                f"/api/projects/{project_id}/issues",
+                headers=headers,
+                json={"title": "Live"},
+            )
+            issue_id = issue.json()["id"]
+            await ac.patch(f"/api/issues/{issue_id}", headers=headers, json={"status": "closed"})
+            await ac.post(f"/api/issues/{issue_id}/comments", headers=headers, json={"body": "Done"})
+            await ac.delete(f"/api/issues/{issue_id}", headers=headers)
+
+            received = []
+            while (event := await subscription.get(timeout=1)) is not None:
+                received.append(event)
+                if event.type == "issue.deleted":
+                    break
+
+        assert [event.type for event in received] == [
+            "issue.created", "issue.updated", "comment.created", "issue.deleted",
+        ]
+        assert received[1].data["status"] == "closed"
+        assert received[2].data["comment"]["body"] == "Done"
+        assert received[3].data == {"id": issue_id}
+
+
+async def read_stream_until(messages: asyncio.Queue, marker: bytes) -> bytes:
+    body = b""
+    while marker not in body:
+        message = await asyncio.wait_for(messages.get(), timeout=5)
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+        body += message.get("body", b"")
+    return body
+
+
+@pytest.mark.asyncio
+async def test_event_stream_route_delivers_changes_to_ticket_holders():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"stream_{uuid.uuid4().hex[:6]}@test.com"
+        token = await signup_and_login(ac, "Streamer", email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project_ids = []
+        for _ in range(2):
+            project = await ac.post(
+                "/api/projects/",
+                headers=headers,
+                json={"name": "Stream Project", "key": f"STR_{uuid.uuid4().hex[:6]}", "description": "Test"},
+            )
+            project_ids.append(project.json()["id"])
+        project_id, other_project_id = project_ids
+
+        issued = await ac.post(f"/api/projects/{project_id}/events/ticket", headers=headers)
+        assert issued.status_code == 200
+        ticket = issued.json()["ticket"]
+
+        # Tickets are single-purpose: not a bearer token, not valid for another project's stream,
+        # and access tokens do not open streams.
+        as_bearer = await ac.get("/api/projects/", headers={"Authorization": f"Bearer {ticket}"})
+        assert as_bearer.status_code == 401
+        wrong_project = await ac.get(f"/api/projects/{other_project_id}/events", params={"ticket": ticket})
+        assert wrong_project.status_code == 401
+        with_token = await ac.get(f"/api/projects/{project_id}/events", params={"ticket": token})
+        assert with_token.status_code == 401
+
+        # httpx's ASGI transport buffers whole responses, so the open stream is driven directly.
+        messages = asyncio.Queue()
+        disconnected = asyncio.Event()
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        path = f"/api/projects/{project_id}/events"
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": f"ticket={ticket}".encode(),
+            "headers": [(b"host", b"test")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("test", 80),
+        }
+        stream = asyncio.create_task(app(scope, receive, messages.put))
+        try:
+            # The retry hint is sent once the subscription exists.
+            await read_stream_until(messages, b"retry: 3000")
+            issue = await ac.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": "Streamed"})
+            body = await read_stream_until(messages, b"event: issue.created")
+        finally:
+            disconnected.set()
+            await asyncio.wait_for(stream, timeout=5)
+
+        data = body.split(b"event: issue.created\ndata: ", 1)[1].split(b"\n\n", 1)[0]
+        assert orjson.loads(data)["id"] == issue.json()["id"]
+        assert get_broker().stats()["subscribers"] == 0
@@ -0,0 +1,133 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+
+from app.dao import auth_dao, comments_dao, issues_dao
+from app.db.base import Base
+from app.models.comment import Comment
+from app.models.issue import Issue, IssuePriority, IssueStatus
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+
+PROJECTS = 40
+USERS = 200
+ISSUES = 20000
+COMMENTS = 20000
+
+
+@pytest.fixture(scope="module")
+def seeded_engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    rng = random.Random(3)
+    start = datetime(2025, 1, 1)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"id": i, "name": f"User {i}", "email": f"user{i}@load.test", "password_hash": "x"}
+            for i in range(1, USERS + 1)
+        ])
+        conn.execute(insert(Project), [
+            {"id": i, "name": f"Project {i}", "key": f"LOAD{i}"}
+            for i in range(1, PROJECTS + 1)
+        ])
+        conn.execute(insert(ProjectMember), [
+            {"project_id": p, "user_id": u, "role": "member"}
+            for p in range(1, PROJECTS + 1)
+            for u in rng.sample(range(1, USERS + 1), 25)
+        ])
+        conn.execute(insert(Issue), [
+            {
+                "project_id": rng.randint(1, PROJECTS),
+                "title": f"Issue {i}",
+                "status": rng.choice(list(IssueStatus)),
+                "priority": rng.choice(list(IssuePriority)),
+                "reporter_id": rng.randint(1, USERS),
+                "assignee_id": rng.randint(1, USERS),
+                "created_at": start + timedelta(minutes=i),
+            }
+            for i in range(ISSUES)
+        ])
+        conn.execute(insert(Comment), [
+            {
+                "issue_id": rng.randint(1, ISSUES),
+                "author_id": rng.randint(1, USERS),
+                "body": f"Comment {i}",
+                "created_at": start + timedelta(minutes=i),
+            }
+            for i in range(COMMENTS)
+        ])
+        conn.exec_driver_sql("ANALYZE")
+
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine, call) -> str:
+    """Run `call(session)` and return the planner output for the last SELECT it issued."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with Session(engine) as session:
+            call(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    statement, parameters = statements[-1]
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+def test_issue_list_by_status_and_created_at_uses_composite_index(seeded_engine):
+    plan = query_plan(seeded_engine, lambda db: issues_dao.list_issues(
+        db, project_id=7, page=3, page_size=20, status="open", priority=None,
+        assignee_id=None, q=None, sort="created_at",
+    ))
+    assert "ix_issues_project_id_status_created_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_issue_list_sorted_by_created_at_uses_project_index(seeded_engine):
+    plan = query_plan(seeded_engine, lambda db: issues_dao.list_issues(
+        db, project_id=7, page=1, page_size=20, status=None, priority=None,
+        assignee_id=None, q=None, sort="created_at",
+    ))
+    assert "ix_issues_project_id_created_at" in plan
+
+
+def test_issue_list_by_priority_uses_composite_index(seeded_engine):
+    plan = query_plan(seeded_engine, lambda db: issues_dao.list_issues(
+        db, project_id=7, page=1, page_size=20, status=None, priority="high",
+        assignee_id=None, q=None, sort=None,
+    ))
+    assert "ix_issues_project_id_priority" in plan
+
+
+def test_comment_thread_uses_issue_index(seeded_engine):
+    plan = query_plan(seeded_engine, lambda db: comments_dao.list_comments_by_issue(db, 42, limit=100))
+    assert "ix_comments_issue_id_created_at_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_comment_thread_page_after_anchor_uses_issue_index(seeded_engine):
+    def call(db):
+        anchor = db.get(Comment, 1)
+        comments_dao.list_comments_by_issue(db, anchor.issue_id, after=anchor, limit=100)
+
+    plan = query_plan(seeded_engine, call)
+    assert "ix_comments_issue_id_created_at_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_memberships_for_user_use_user_index(seeded_engine):
+    plan = query_plan(seeded_engine, lambda db: auth_dao.list_project_roles_for_user(db, 11, limit=100))
+    assert "ix_project_members_user_id" in plan
@@ -0,0 +1,122 @@
+import pytest
+import uuid
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_batch_create_update_delete_report_per_item_results():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        owner_email = f"batch_{uuid.uuid4().hex[:6]}@test.com"
+        member_email = f"batchm_{uuid.uuid4().hex[:6]}@test.com"
+        outsider_email = f"batcho_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"BAT_{uuid.uuid4().hex[:6]}"
+
+        owner_token = await signup_and_login(ac, "Owner", owner_email, "password123")
+        member_token = await signup_and_login(ac, "Member", member_email, "password123")
+        await signup_and_login(ac, "Outsider", outsider_email, "password123")
+        owner_headers = {"Authorization": f"Bearer {owner_token}"}
+        member_headers = {"Authorization": f"Bearer {member_token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=owner_headers,
+            json={"name": "Batch Project", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+        await ac.post(
+            f"/api/projects/{project_id}/members",
+            headers=owner_headers,
+            json={"email": member_email, "role": "member"},
+        )
+        members = await ac.get(f"/api/projects/{project_id}/members", headers=owner_headers)
+        member_id = next(m["id"] for m in members.json() if m["email"] == member_email)
+
+        created = await ac.post(
+            f"/api/projects/{project_id}/issues:batch",
+            headers=member_headers,
+            json={"items": [
+                {"title": "First", "assignee_id": member_id},
+                {"title": "Bad assignee", "assignee_id": 10**9},
+                {"title": "Second", "priority": "high"},
+                {"title": "Third"},
+            ]},
+        )
+        assert created.status_code == 200
+        body = created.json()
+        assert (body["succeeded"], body["failed"]) == (3, 1)
+        assert [r["ok"] for r in body["results"]] == [True, False, True, True]
+        assert body["results"][1]["error"]["code"] == "HTTP_400"
+        assert body["results"][2]["issue"]["priority"] == "high"
+        first_id, second_id, third_id = (body["results"][i]["issue"]["id"] for i in (0, 2, 3))
+
+        listed = await ac.get(f"/api/projects/{project_id}/issues", headers=owner_headers)
+        assert listed.json()["total"] == 3
+
+        updated = await ac.patch(
+            "/api/issues:batch",
+            headers=member_headers,
+            json={"items": [
+                {"id": first_id, "title": "First, renamed"},
+                {"id": second_id, "status": "closed"},
+                {"id": first_id, "title": "Twice"},
+                {"id": 10**9, "title": "Missing"},
+            ]},
+        )
+        body = updated.json()
+        assert [r["ok"] for r in body["results"]] == [True, False, False, False]
+        assert body["results"][1]["error"]["message"] == "Only maintainer can change status"
+        assert [r["error"]["code"] for r in body["results"][2:]] == ["HTTP_400", "HTTP_404"]
+
+        updated = await ac.patch(
+            "/api/issues:batch",
+            headers=owner_headers,
+            json={"items": [
+                {"id": second_id, "status": "closed"},
+                {"id": third_id, "status": "in_progress", "assignee_id": member_id},
+            ]},
+        )
+        assert updated.json()["succeeded"] == 2
+        detail = await ac.get(f"/api/issues/{first_id}", headers=owner_headers)
+        assert detail.json()["title"] == "First, renamed"
+        detail = await ac.get(f"/api/issues/{third_id}", headers=owner_headers)
+        assert (detail.json()["status"], detail.json()["assignee_id"]) == ("in_progress", member_id)
+
+        deleted = await ac.post(
+            "/api/issues:batchDelete",
+            headers=owner_headers,
+            json={"ids": [second_id, 10**9]},
+        )
+        assert [r["ok"] for r in deleted.json()["results"]] == [True, False]
+
+        stats = await ac.get("/api/projects/stats", headers=owner_headers)
+        row = next(s for s in stats.json() if s["project_id"] == project_id)
+        assert row == {
+            "project_id": project_id,
+            "open": 1,
+            "in_progress": 1,
+            "resolved": 0,
+            "closed": 0,
+            "total": 2,
+        }
+
+        outsider_token = await signup_and_login(ac, "Outsider", outsider_email, "password123")
+        denied = await ac.post(
+            f"/api/projects/{project_id}/issues:batch",
+            headers={"Authorization": f"Bearer {outsider_token}"},
+            json={"items": [{"title": "Nope"}]},
+        )
+        assert denied.status_code == 403
@@ -0,0 +1,75 @@
+import csv
+import io
+import json
+import pytest
+import uuid
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_export_streams_every_issue_with_user_names():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"export_{uuid.uuid4().hex[:6]}@test.com"
+        outsider_email = f"exportx_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"EXP_{uuid.uuid4().hex[:6]}"
+
+        token = await signup_and_login(ac, "Exporter", email, "password123")
+        outsider_token = await signup_and_login(ac, "Outsider", outsider_email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Export Project", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+        me = await ac.get("/api/me", headers=headers)
+
+        items = [
+            {"title": f"Issue {i}", "description": 'Quote " and, comma' if i == 0 else None}
+            for i in range(4)
+        ]
+        items[1]["assignee_id"] = me.json()["id"]
+        await ac.post(f"/api/projects/{project_id}/issues:batch", headers=headers, json={"items": items})
+
+        response = await ac.get(f"/api/projects/{project_id}/issues/export", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["title"] for row in rows] == [f"Issue {i}" for i in range(4)]
+        assert rows[0]["description"] == 'Quote " and, comma'
+        assert rows[1]["assignee_name"] == "Exporter"
+        assert rows[2]["assignee_name"] == ""
+        assert {row["reporter_name"] for row in rows} == {"Exporter"}
+        assert rows[0]["status"] == "open"
+
+        response = await ac.get(
+            f"/api/projects/{project_id}/issues/export",
+            headers=headers,
+            params={"format": "ndjson"},
+        )
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 4
+        assert lines[1]["assignee_name"] == "Exporter"
+        assert lines[2]["assignee_id"] is None
+
+        denied = await ac.get(
+            f"/api/projects/{project_id}/issues/export",
+            headers={"Authorization": f"Bearer {outsider_token}"},
+        )
+        assert denied.status_code == 403
@@ -0,0 +1,140 @@
+import json
+import threading
+import pytest
+import uuid
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.services import import_service
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_import_loads_issues_and_comments_and_reports_bad_rows():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        owner_email = f"import_{uuid.uuid4().hex[:6]}@test.com"
+        dev_email = f"importdev_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"IMP_{uuid.uuid4().hex[:6]}"
+
+        owner_token = await signup_and_login(ac, "Importer", owner_email, "password123")
+        dev_token = await signup_and_login(ac, "Dev", dev_email, "password123")
+        owner_headers = {"Authorization": f"Bearer {owner_token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=owner_headers,
+            json={"name": "Import Project", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+
+        issues_csv = (
+            "external_id,title,description,status,priority,reporter_email,assignee_email,created_at\n"
+            f"A-1,Login broken,\"Crash, on submit\",open,high,{owner_email},{dev_email},2026-01-02T10:00:00\n"
+            f"A-2,Slow search,,resolved,low,{dev_email},,2026-01-03T10:00:00+02:00\n"
+            f"A-3,Bad status,,sleeping,low,{owner_email},,\n"
+            "A-4,Unknown reporter,,open,low,nobody@test.com,,\n"
+        )
+        comments_csv = (
+            "issue_external_id,author_email,body,created_at\n"
+            f"A-1,{dev_email},Looking into it,2026-01-02T11:00:00\n"
+            f"A-2,{owner_email},Thanks,\n"
+            f"A-3,{owner_email},Orphan,\n"
+        )
+        response = await ac.post(
+            f"/api/projects/{project_id}/import",
+            headers=owner_headers,
+            files={
+                "issues": ("issues.csv", issues_csv.encode(), "text/csv"),
+                "comments": ("comments.csv", comments_csv.encode(), "text/csv"),
+            },
+        )
+        assert response.status_code == 200
+        report = response.json()
+        assert report["issues"] == 2
+        assert report["comments"] == 2
+        assert report["members_added"] == 1
+        assert report["skipped"] == 3
+        assert [(e["file"], e["line"]) for e in report["errors"]] == [
+            ("issues", 4), ("issues", 5), ("comments", 4),
+        ]
+        assert report["rows_per_second"] >= 0
+
+        page = await ac.get(f"/api/projects/{project_id}/issues?sort=created_at", headers=owner_headers)
+        issues = page.json()["data"]
+        assert [issue["title"] for issue in issues] == ["Slow search", "Login broken"]
+        issues.reverse()
+        assert issues[0]["assignee_name"] == "Dev"
+
+        stats = await ac.get("/api/projects/stats", headers=owner_headers)
+        imported = next(s for s in stats.json() if s["project_id"] == project_id)
+        assert (imported["open"], imported["resolved"], imported["total"]) == (1, 1, 2)
+
+        # The reporter was added as a member, so they can read the imported issue and its comments.
+        dev_headers = {"Authorization": f"Bearer {dev_token}"}
+        comments = await ac.get(f"/api/issues/{issues[0]['id']}/comments", headers=dev_headers)
+        assert comments.status_code == 200
+        assert [c["body"] for c in comments.json()] == ["Looking into it"]
+
+        ndjson = "\n".join([
+            json.dumps({"title": "From NDJSON", "reporter_email": dev_email}),
+            "{not json",
+        ])
+        denied = await ac.post(
+            f"/api/projects/{project_id}/import?format=ndjson",
+            headers=dev_headers,
+            files={"issues": ("issues.ndjson", ndjson.encode(), "application/x-ndjson")},
+        )
+        assert denied.status_code == 403
+
+        response = await ac.post(
+            f"/api/projects/{project_id}/import?format=ndjson",
+            headers=owner_headers,
+            files={"issues": ("issues.ndjson", ndjson.encode(), "application/x-ndjson")},
+        )
+        assert response.json()["issues"] == 1
+        assert response.json()["errors"] == [{"file": "issues", "line": 2, "error": "Record is not an object"}]
+
+
+@pytest.mark.asyncio
+async def test_import_parses_uploads_off_the_event_loop(monkeypatch):
+    parse_threads = set()
+    parse_issue = import_service._parse_issue
+
+    def recording_parse_issue(*args):
+        parse_threads.add(threading.get_ident())
+        return parse_issue(*args)
+
+    monkeypatch.setattr(import_service, "_parse_issue", recording_parse_issue)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"importloop_{uuid.uuid4().hex[:6]}@test.com"
+        token = await signup_and_login(ac, "Importer", email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Import Loop", "key": f"IML_{uuid.uuid4().hex[:6]}", "description": "Test"},
+        )
+
+        issues_csv = "title,reporter_email\n" + "".join(f"Issue {i},{email}\n" for i in range(5))
+        response = await ac.post(
+            f"/api/projects/{project.json()['id']}/import",
+            headers=headers,
+            files={"issues": ("issues.csv", issues_csv.encode(), "text/csv")},
+        )
+        assert response.json()["issues"] == 5
+
+    assert parse_threads
+    assert threading.get_ident() not in parse_threads
@@ -0,0 +1,104 @@
+import pytest
+import uuid
+from contextlib import contextmanager
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+
+from app.db.session import async_engine, engine
+from app.main import app
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    active_engine = async_engine.sync_engine if async_engine is not None else engine
+    event.listen(active_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(active_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_issue_detail_includes_comments_members_and_viewer_in_fixed_queries():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        owner_email = f"incl_{uuid.uuid4().hex[:6]}@test.com"
+        member_email = f"inclm_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"INC_{uuid.uuid4().hex[:6]}"
+
+        owner_token = await signup_and_login(ac, "Owner", owner_email, "password123")
+        member_token = await signup_and_login(ac, "Member", member_email, "password123")
+        owner_headers = {"Authorization": f"Bearer {owner_token}"}
+        member_headers = {"Authorization": f"Bearer {member_token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=owner_headers,
+            json={"name": "Include Project", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+        await ac.post(
+            f"/api/projects/{project_id}/members",
+            headers=owner_headers,
+            json={"email": member_email, "role": "member"},
+        )
+
+        issue = await ac.post(f"/api/projects/{project_id}/issues", headers=owner_headers, json={"title": "Bundle"})
+        issue_id = issue.json()["id"]
+        url = f"/api/issues/{issue_id}?include=comments,members,viewer"
+
+        await ac.post(f"/api/issues/{issue_id}/comments", headers=owner_headers, json={"body": "First"})
+        await ac.get(url, headers=member_headers)
+        with count_queries() as few_comments:
+            response = await ac.get(url, headers=member_headers)
+
+        for i in range(5):
+            await ac.post(f"/api/issues/{issue_id}/comments", headers=member_headers, json={"body": f"More {i}"})
+        await ac.get(url, headers=member_headers)
+        with count_queries() as many_comments:
+            larger = await ac.get(url, headers=member_headers)
+
+        assert response.status_code == 200
+        bundle = response.json()
+        assert bundle["title"] == "Bundle"
+        assert [c["body"] for c in bundle["comments"]] == ["First"]
+        assert bundle["comments_next_after_id"] is None
+        assert sorted(m["name"] for m in bundle["members"]) == ["Member", "Owner"]
+        assert bundle["viewer"]["email"] == member_email
+        assert bundle["viewer"]["role"] == "member"
+        assert len(larger.json()["comments"]) == 6
+        assert len(many_comments) == len(few_comments)
+
+        plain = await ac.get(f"/api/issues/{issue_id}", headers=member_headers)
+        assert not {"comments", "members", "viewer"} & plain.json().keys()
+        assert plain.json()["description"] is None
+
+        only_viewer = await ac.get(f"/api/issues/{issue_id}?include=viewer", headers=owner_headers)
+        assert only_viewer.json()["viewer"]["role"] == "maintainer"
+        assert "comments" not in only_viewer.json()
+
+        cached = await ac.get(url, headers={**member_headers, "If-None-Match": larger.headers["etag"]})
+        assert cached.status_code == 304
+        await ac.post(f"/api/issues/{issue_id}/comments", headers=owner_headers, json={"body": "Newer"})
+        stale = await ac.get(url, headers={**member_headers, "If-None-Match": larger.headers["etag"]})
+        assert stale.status_code == 200
+
+        unknown = await ac.get(f"/api/issues/{issue_id}?include=attachments", headers=member_headers)
+        assert unknown.status_code == 400
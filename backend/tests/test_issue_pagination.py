@@ -0,0 +1,119 @@
+import pytest
+import uuid
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+
+PRIORITY_ORDER = ["low", "medium", "high", "critical"]
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_every_issue_once_per_sort():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"cursor_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"CUR_{uuid.uuid4().hex[:6]}"
+
+        token = await signup_and_login(ac, "Cursor", email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Cursor Project", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+
+        created_ids = []
+        for i in range(7):
+            issue = await ac.post(
+                f"/api/projects/{project_id}/issues",
+                headers=headers,
+                json={"title": f"Issue {i}", "priority": PRIORITY_ORDER[i % 4]},
+            )
+            created_ids.append(issue.json()["id"])
+
+        for sort in (None, "created_at", "priority", "status"):
+            seen = []
+            cursor = ""
+            while cursor is not None:
+                params = {"pagination": "cursor", "page_size": 3, "cursor": cursor}
+                if sort:
+                    params["sort"] = sort
+                response = await ac.get(
+                    f"/api/projects/{project_id}/issues",
+                    headers=headers,
+                    params=params,
+                )
+                assert response.status_code == 200
+                body = response.json()
+                assert "total" not in body
+                seen.extend(body["data"])
+                cursor = body["next_cursor"]
+
+            assert sorted(issue["id"] for issue in seen) == sorted(created_ids)
+            if sort in ("priority", "status"):
+                offset_page = await ac.get(
+                    f"/api/projects/{project_id}/issues",
+                    headers=headers,
+                    params={"page_size": 100, "sort": sort},
+                )
+                expected = [issue[sort] for issue in offset_page.json()["data"]]
+                assert [issue[sort] for issue in seen] == expected
+
+
+@pytest.mark.asyncio
+async def test_cursor_from_another_sort_is_rejected():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"cursor2_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"CUR2_{uuid.uuid4().hex[:6]}"
+
+        token = await signup_and_login(ac, "Cursor2", email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Cursor Project 2", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+        for i in range(2):
+            await ac.post(
+                f"/api/projects/{project_id}/issues",
+                headers=headers,
+                json={"title": f"Issue {i}"},
+            )
+
+        first = await ac.get(
+            f"/api/projects/{project_id}/issues",
+            headers=headers,
+            params={"pagination": "cursor", "page_size": 1, "sort": "created_at"},
+        )
+        next_cursor = first.json()["next_cursor"]
+        assert next_cursor
+
+        mismatched = await ac.get(
+            f"/api/projects/{project_id}/issues",
+            headers=headers,
+            params={"cursor": next_cursor, "page_size": 1, "sort": "priority"},
+        )
+        assert mismatched.status_code == 400
+
+        garbage = await ac.get(
+            f"/api/projects/{project_id}/issues",
+            headers=headers,
+            params={"cursor": "not-a-cursor", "page_size": 1},
+        )
+        assert garbage.status_code == 400
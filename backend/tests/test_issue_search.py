@@ -0,0 +1,62 @@
+import pytest
+import uuid
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_search_matches_title_and_description_and_ranks_title_hits_first():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"search_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"SRCH_{uuid.uuid4().hex[:6]}"
+
+        token = await signup_and_login(ac, "Searcher", email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Search Project", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+
+        issues = [
+            ("Checkout crashes", "Timeout talking to payment gateway"),
+            ("Payment gateway timeout", "Seen in checkout"),
+            ("Profile avatar upload", "Large images fail"),
+        ]
+        for title, description in issues:
+            await ac.post(
+                f"/api/projects/{project_id}/issues",
+                headers=headers,
+                json={"title": title, "description": description},
+            )
+
+        response = await ac.get(
+            f"/api/projects/{project_id}/issues",
+            headers=headers,
+            params={"q": "gateway timeout"},
+        )
+        assert response.status_code == 200
+        titles = [issue["title"] for issue in response.json()["data"]]
+        assert titles == ["Payment gateway timeout", "Checkout crashes"]
+
+        no_match = await ac.get(
+            f"/api/projects/{project_id}/issues",
+            headers=headers,
+            params={"q": "avatar gateway"},
+        )
+        assert no_match.json()["total"] == 0
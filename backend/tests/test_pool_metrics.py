@@ -0,0 +1,37 @@
+import pytest
+from sqlalchemy import create_engine, exc
+
+from app.db.pool_metrics import TimedQueuePool
+
+
+def test_pool_metrics_track_checkouts_overflow_and_timeouts(tmp_path):
+    metrics = TimedQueuePool.metrics
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    metrics.attach(engine)
+    before = metrics.snapshot(engine.pool)
+
+    first = engine.connect()
+    second = engine.connect()
+    busy = metrics.snapshot(engine.pool)
+    assert busy["checked_out"] == 2
+    assert busy["overflow"] == 1
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    first.close()
+    second.close()
+    after = metrics.snapshot(engine.pool)
+    engine.dispose()
+
+    assert after["checkouts"] - before["checkouts"] == 2
+    assert after["checkins"] - before["checkins"] == 2
+    assert after["timeouts"] - before["timeouts"] == 1
+    assert after["wait_ms_max"] >= 50
+    assert after["checked_out"] == 0
@@ -2,7 +2,13 @@ import pytest
 import uuid
 from datetime import date, timedelta
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+from app.dao import issues_dao
+from app.db.session import SessionLocal, async_engine, engine
 from app.main import app
+from app.models.comment import Comment
+from app.models.issue import Issue, IssueStatus
+from app.models.project_issue_stats import ProjectIssueStats
 
 
 @pytest.mark.asyncio
@@ -230,3 +236,344 @@ async def test_delete_project_forbidden_for_member():
         assert delete_response.status_code == 403
 
 
+@pytest.mark.asyncio
+async def test_project_issue_stats_follow_issue_writes():
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"stats_{uuid.uuid4().hex[:6]}@test.com"
+        await ac.post(
+            "/api/auth/signup",
+            json={"name": "Stats User", "email": email, "password": "password123"},
+        )
+        login = await ac.post(
+            "/api/auth/login",
+            data={"username": email, "password": "password123"},
+        )
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Stats Project", "key": f"ST_{uuid.uuid4().hex[:6]}"},
+        )
+        project_id = project.json()["id"]
+
+        empty_project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Empty Project", "key": f"ST_{uuid.uuid4().hex[:6]}"},
+        )
+        empty_project_id = empty_project.json()["id"]
+
+        issue_ids = []
+        for i in range(3):
+            issue = await ac.post(
+                f"/api/projects/{project_id}/issues",
+                headers=headers,
+                json={"title": f"Issue {i}"},
+            )
+            issue_ids.append(issue.json()["id"])
+
+        await ac.patch(f"/api/issues/{issue_ids[0]}", headers=headers, json={"status": "resolved"})
+        await ac.patch(f"/api/issues/{issue_ids[1]}", headers=headers, json={"status": "in_progress"})
+        await ac.patch(f"/api/issues/{issue_ids[1]}", headers=headers, json={"status": "in_progress"})
+        await ac.delete(f"/api/issues/{issue_ids[2]}", headers=headers)
+
+        response = await ac.get("/api/projects/stats", headers=headers)
+        assert response.status_code == 200
+        stats = {s["project_id"]: s for s in response.json()}
+
+        assert stats[project_id] == {
+            "project_id": project_id,
+            "open": 0,
+            "in_progress": 1,
+            "resolved": 1,
+            "closed": 0,
+            "total": 2,
+        }
+        assert stats[empty_project_id]["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_recompute_issue_counts_rebuilds_stats_from_issues():
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"recount_{uuid.uuid4().hex[:6]}@test.com"
+        await ac.post(
+            "/api/auth/signup",
+            json={"name": "Recount User", "email": email, "password": "password123"},
+        )
+        login = await ac.post(
+            "/api/auth/login",
+            data={"username": email, "password": "password123"},
+        )
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Recount Project", "key": f"RC_{uuid.uuid4().hex[:6]}"},
+        )
+        project_id = project.json()["id"]
+        for i in range(3):
+            await ac.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": f"Issue {i}"})
+
+        with SessionLocal() as db:
+            # Simulate a database whose counters drifted or were never filled in.
+            db.query(ProjectIssueStats).filter(ProjectIssueStats.project_id == project_id).delete()
+            db.add(ProjectIssueStats(project_id=project_id, status=IssueStatus.closed, issue_count=7))
+            db.commit()
+            assert issues_dao.recompute_issue_counts(db, [project_id]) == 1
+
+        response = await ac.get("/api/projects/stats", headers=headers)
+        stats = {s["project_id"]: s for s in response.json()}
+        assert stats[project_id]["open"] == 3
+        assert stats[project_id]["closed"] == 0
+        assert stats[project_id]["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_issue_counters_count_each_write_once_under_stale_reads():
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"race_{uuid.uuid4().hex[:6]}@test.com"
+        await ac.post(
+            "/api/auth/signup",
+            json={"name": "Race User", "email": email, "password": "password123"},
+        )
+        login = await ac.post(
+            "/api/auth/login",
+            data={"username": email, "password": "password123"},
+        )
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Race Project", "key": f"RA_{uuid.uuid4().hex[:6]}"},
+        )
+        project_id = project.json()["id"]
+        issue_ids = []
+        for i in range(3):
+            issue = await ac.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": f"Issue {i}"})
+            issue_ids.append(issue.json()["id"])
+
+        # Two requests that both read the issues while they were open, then write one after the other.
+        first, second = SessionLocal(), SessionLocal()
+        try:
+            closed_first, closed_second = (db.get(Issue, issue_ids[0]) for db in (first, second))
+            closed_first.status = IssueStatus.closed
+            issues_dao.commit_issue(first, closed_first)
+            closed_second.status = IssueStatus.closed
+            issues_dao.commit_issue(second, closed_second)
+
+            moved_first, moved_second = (db.get(Issue, issue_ids[1]) for db in (first, second))
+            moved_first.status = IssueStatus.closed
+            issues_dao.commit_issue(first, moved_first)
+            moved_second.status = IssueStatus.resolved
+            issues_dao.commit_issue(second, moved_second)
+
+            deleted_first, deleted_second = (db.get(Issue, issue_ids[2]) for db in (first, second))
+            issues_dao.delete_issue(first, deleted_first)
+            issues_dao.delete_issue(second, deleted_second)
+        finally:
+            first.close()
+            second.close()
+
+        response = await ac.get("/api/projects/stats", headers=headers)
+        stats = {s["project_id"]: s for s in response.json()}
+        assert stats[project_id] == {
+            "project_id": project_id,
+            "open": 0,
+            "in_progress": 0,
+            "resolved": 1,
+            "closed": 1,
+            "total": 2,
+        }
+
+
+@pytest.mark.asyncio
+async def test_delete_project_cascades_in_one_statement():
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"cascade_{uuid.uuid4().hex[:6]}@test.com"
+        await ac.post(
+            "/api/auth/signup",
+            json={"name": "Cascade User", "email": email, "password": "password123"},
+        )
+        login = await ac.post(
+            "/api/auth/login",
+            data={"username": email, "password": "password123"},
+        )
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Cascade Project", "key": f"CAS_{uuid.uuid4().hex[:6]}", "description": "Test"},
+        )
+        project_id = project.json()["id"]
+
+        issue_ids = []
+        for i in range(3):
+            issue = await ac.post(
+                f"/api/projects/{project_id}/issues",
+                headers=headers,
+                json={"title": f"Issue {i}"},
+            )
+            issue_ids.append(issue.json()["id"])
+            await ac.post(f"/api/issues/{issue_ids[-1]}/comments", headers=headers, json={"body": "Note"})
+
+        deletes = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("DELETE"):
+                deletes.append(statement)
+
+        active_engine = async_engine.sync_engine if async_engine is not None else engine
+        event.listen(active_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            delete_response = await ac.delete(f"/api/projects/{project_id}", headers=headers)
+        finally:
+            event.remove(active_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert delete_response.status_code == 200
+        assert len(deletes) == 1 and "projects" in deletes[0]
+
+        with SessionLocal() as db:
+            assert db.query(Comment).filter(Comment.issue_id.in_(issue_ids)).count() == 0
+
+        gone = await ac.get(f"/api/issues/{issue_ids[0]}", headers=headers)
+        assert gone.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_members_list_is_one_query_with_prefix_filter_and_pagination():
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        suffix = uuid.uuid4().hex[:6]
+        emails = [f"{name.lower()}_{suffix}@test.com" for name in ("Owner", "Alice", "Albert", "Bob", "Carol")]
+        tokens = []
+        for email in emails:
+            name = email.split("_")[0].title()
+            await ac.post(
+                "/api/auth/signup",
+                json={"name": name, "email": email, "password": "password123"},
+            )
+            login = await ac.post(
+                "/api/auth/login",
+                data={"username": email, "password": "password123"},
+            )
+            tokens.append(login.json()["access_token"])
+        headers = {"Authorization": f"Bearer {tokens[0]}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Members Project", "key": f"MEM_{suffix}", "description": "Test"},
+        )
+        project_id = project.json()["id"]
+        url = f"/api/projects/{project_id}/members"
+
+        for email in emails[1:]:
+            await ac.post(url, headers=headers, json={"email": email, "role": "member"})
+
+        user_reads = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if "users.email" in statement:
+                user_reads.append(statement)
+
+        active_engine = async_engine.sync_engine if async_engine is not None else engine
+        event.listen(active_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            members = await ac.get(url, headers=headers)
+        finally:
+            event.remove(active_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert members.status_code == 200
+        assert [m["name"] for m in members.json()] == ["Albert", "Alice", "Bob", "Carol", "Owner"]
+        assert members.json()[-1]["role"] == "maintainer"
+        assert "x-next-offset" not in members.headers
+        assert len(user_reads) == 1 and "JOIN" in user_reads[0]
+
+        first = await ac.get(f"{url}?limit=2", headers=headers)
+        assert [m["name"] for m in first.json()] == ["Albert", "Alice"]
+        assert first.headers["x-next-offset"] == "2"
+        last = await ac.get(f"{url}?limit=2&offset=4", headers=headers)
+        assert [m["name"] for m in last.json()] == ["Owner"]
+        assert "x-next-offset" not in last.headers
+
+        by_name = await ac.get(f"{url}?q=al", headers=headers)
+        assert [m["name"] for m in by_name.json()] == ["Albert", "Alice"]
+        by_email = await ac.get(f"{url}?q=bob_{suffix}", headers=headers)
+        assert [m["email"] for m in by_email.json()] == [emails[3]]
+        wildcard = await ac.get(f"{url}?q=%25", headers=headers)
+        assert wildcard.json() == []
+
+        cached = await ac.get(f"{url}?q=al", headers={**headers, "If-None-Match": by_name.headers["etag"]})
+        assert cached.status_code == 304
+        other_page = await ac.get(f"{url}?q=bo", headers={**headers, "If-None-Match": by_name.headers["etag"]})
+        assert other_page.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_project_list_has_issue_counts_sort_and_pagination():
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        suffix = uuid.uuid4().hex[:6]
+        email = f"plist_{suffix}@test.com"
+        await ac.post(
+            "/api/auth/signup",
+            json={"name": "Lister", "email": email, "password": "password123"},
+        )
+        login = await ac.post(
+            "/api/auth/login",
+            data={"username": email, "password": "password123"},
+        )
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        project_ids = []
+        for name, issue_count in (("Bravo", 1), ("Alpha", 3), ("Charlie", 0)):
+            project = await ac.post(
+                "/api/projects/",
+                headers=headers,
+                json={"name": name, "key": f"{name[:3].upper()}_{suffix}", "description": "Test"},
+            )
+            project_ids.append(project.json()["id"])
+            for i in range(issue_count):
+                issue = await ac.post(
+                    f"/api/projects/{project_ids[-1]}/issues",
+                    headers=headers,
+                    json={"title": f"Issue {i}"},
+                )
+                if i == 0 and name == "Alpha":
+                    await ac.patch(f"/api/issues/{issue.json()['id']}", headers=headers, json={"status": "closed"})
+
+        projects = await ac.get("/api/projects/", headers=headers)
+        assert [(p["name"], p["my_role"], p["open_issues"], p["total_issues"]) for p in projects.json()] == [
+            ("Alpha", "maintainer", 2, 3),
+            ("Bravo", "maintainer", 1, 1),
+            ("Charlie", "maintainer", 0, 0),
+        ]
+
+        by_total = await ac.get("/api/projects/?sort=total_issues&limit=2", headers=headers)
+        assert [p["name"] for p in by_total.json()] == ["Alpha", "Bravo"]
+        assert by_total.headers["x-next-offset"] == "2"
+        rest = await ac.get("/api/projects/?sort=total_issues&limit=2&offset=2", headers=headers)
+        assert [p["name"] for p in rest.json()] == ["Charlie"]
+        assert "x-next-offset" not in rest.headers
+
+        etag = projects.headers["etag"]
+        unchanged = await ac.get("/api/projects/", headers={**headers, "If-None-Match": etag})
+        assert unchanged.status_code == 304
+        await ac.post(f"/api/projects/{project_ids[2]}/issues", headers=headers, json={"title": "New"})
+        changed = await ac.get("/api/projects/", headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()[2]["open_issues"] == 1
@@ -0,0 +1,151 @@
+import pytest
+import uuid
+from contextlib import contextmanager
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+
+from app.db.session import async_engine, engine
+from app.main import app
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    active_engine = async_engine.sync_engine if async_engine is not None else engine
+    event.listen(active_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(active_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_list_issues_query_count_does_not_grow_with_page_size():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        owner_email = f"owner_{uuid.uuid4().hex[:6]}@test.com"
+        member_email = f"member_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"QC_{uuid.uuid4().hex[:6]}"
+
+        owner_token = await signup_and_login(ac, "Owner", owner_email, "password123")
+        member_token = await signup_and_login(ac, "Member", member_email, "password123")
+        owner_headers = {"Authorization": f"Bearer {owner_token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=owner_headers,
+            json={"name": "Query Counts", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+
+        await ac.post(
+            f"/api/projects/{project_id}/members",
+            headers=owner_headers,
+            json={"email": member_email, "role": "member"},
+        )
+        members = await ac.get(f"/api/projects/{project_id}/members", headers=owner_headers)
+        member_id = next(m["id"] for m in members.json() if m["email"] == member_email)
+
+        for i in range(12):
+            token = owner_token if i % 2 else member_token
+            await ac.post(
+                f"/api/projects/{project_id}/issues",
+                headers={"Authorization": f"Bearer {token}"},
+                json={"title": f"Issue {i}", "assignee_id": member_id if i % 3 else None},
+            )
+
+        with count_queries() as small_page:
+            small = await ac.get(
+                f"/api/projects/{project_id}/issues?page_size=2",
+                headers=owner_headers,
+            )
+        with count_queries() as large_page:
+            large = await ac.get(
+                f"/api/projects/{project_id}/issues?page_size=12",
+                headers=owner_headers,
+            )
+
+        assert small.status_code == 200
+        assert large.status_code == 200
+        assert len(large.json()["data"]) == 12
+        assert all(issue["reporter_name"] in ("Owner", "Member") for issue in large.json()["data"])
+        assert len(large_page) == len(small_page)
+
+
+@pytest.mark.asyncio
+async def test_authenticated_user_is_served_from_cache_after_first_request():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"cached_{uuid.uuid4().hex[:6]}@test.com"
+        token = await signup_and_login(ac, "Cached", email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        await ac.post("/api/auth/logout", headers=headers)
+        before = (await ac.get("/api/metrics", headers=headers)).json()["user_cache"]
+
+        with count_queries() as statements:
+            response = await ac.post("/api/auth/logout", headers=headers)
+
+        after = (await ac.get("/api/metrics", headers=headers)).json()["user_cache"]
+        assert response.status_code == 200
+        assert statements == []
+        # The logout, plus authenticating the second metrics request itself.
+        assert after["hits"] == before["hits"] + 2
+
+
+@pytest.mark.asyncio
+async def test_membership_checks_are_cached_and_invalidated_on_member_changes():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        owner_email = f"owner_{uuid.uuid4().hex[:6]}@test.com"
+        guest_email = f"guest_{uuid.uuid4().hex[:6]}@test.com"
+        key = f"MC_{uuid.uuid4().hex[:6]}"
+
+        owner_token = await signup_and_login(ac, "Owner", owner_email, "password123")
+        guest_token = await signup_and_login(ac, "Guest", guest_email, "password123")
+        owner_headers = {"Authorization": f"Bearer {owner_token}"}
+        guest_headers = {"Authorization": f"Bearer {guest_token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=owner_headers,
+            json={"name": "Membership Cache", "key": key, "description": "Test"},
+        )
+        project_id = project.json()["id"]
+
+        await ac.get(f"/api/projects/{project_id}/issues", headers=owner_headers)
+        with count_queries() as statements:
+            cached = await ac.get(f"/api/projects/{project_id}/issues", headers=owner_headers)
+        assert cached.status_code == 200
+        assert not any("project_members" in statement for statement in statements)
+
+        denied = await ac.get(f"/api/projects/{project_id}/issues", headers=guest_headers)
+        assert denied.status_code == 403
+
+        await ac.post(
+            f"/api/projects/{project_id}/members",
+            headers=owner_headers,
+            json={"email": guest_email, "role": "member"},
+        )
+        allowed = await ac.get(f"/api/projects/{project_id}/issues", headers=guest_headers)
+        assert allowed.status_code == 200
+
+        await ac.delete(f"/api/projects/{project_id}", headers=owner_headers)
+        gone = await ac.get(f"/api/projects/{project_id}/issues", headers=guest_headers)
+        assert gone.status_code == 403
@@ -0,0 +1,79 @@
+import json
+import logging
+import pytest
+import uuid
+from httpx import AsyncClient, ASGITransport
+
+from app.core import request_timing
+from app.main import app
+
+
+async def signup_and_login(ac: AsyncClient, name: str, email: str, password: str):
+    await ac.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": password},
+    )
+    login = await ac.post(
+        "/api/auth/login",
+        data={"username": email, "password": password},
+    )
+    return login.json()["access_token"]
+
+
+def parse_server_timing(header: str) -> dict:
+    metrics = {}
+    for metric in header.split(","):
+        name, *params = [part.strip() for part in metric.split(";")]
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+@pytest.mark.asyncio
+async def test_responses_carry_query_count_and_timings(caplog):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"timing_{uuid.uuid4().hex[:6]}@test.com"
+        token = await signup_and_login(ac, "Timing", email, "password123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project = await ac.post(
+            "/api/projects/",
+            headers=headers,
+            json={"name": "Timing", "key": f"TM_{uuid.uuid4().hex[:6]}", "description": "Test"},
+        )
+        project_id = project.json()["id"]
+
+        with caplog.at_level(logging.INFO, logger="app.requests"):
+            response = await ac.get(f"/api/projects/{project_id}/members", headers=headers)
+
+        metrics = parse_server_timing(response.headers["server-timing"])
+        queries = int(metrics["db"]["desc"].strip('"').split()[0])
+        assert queries >= 1
+        assert float(metrics["total"]["dur"]) >= float(metrics["db"]["dur"])
+
+        entry = json.loads(caplog.records[-1].getMessage().split(" ", 1)[1])
+        assert entry["path"] == f"/api/projects/{project_id}/members"
+        assert entry["status"] == 200
+        assert entry["queries"] == queries
+
+        root = await ac.get("/")
+        assert parse_server_timing(root.headers["server-timing"])["db"]["desc"] == '"0 queries"'
+
+
+@pytest.mark.asyncio
+async def test_slow_requests_are_logged_with_their_sql(caplog, monkeypatch):
+    monkeypatch.setattr(request_timing, "SLOW_REQUEST_MS", 0.001)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        email = f"slow_{uuid.uuid4().hex[:6]}@test.com"
+        with caplog.at_level(logging.WARNING, logger="app.requests"):
+            await ac.post(
+                "/api/auth/signup",
+                json={"name": "Slow", "email": email, "password": "password123"},
+            )
+
+    slow = [record for record in caplog.records if record.getMessage().startswith("slow request")]
+    assert slow
+    entry = json.loads(slow[-1].getMessage().split(" ", 2)[2])
+    assert entry["path"] == "/api/auth/signup"
+    assert any("INSERT INTO users" in sql["statement"] for sql in entry["sql"])
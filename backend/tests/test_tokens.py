@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from app.core import cache, tokens
+from app.core.security import create_access_token
+from app.core.tokens import InvalidToken, verify_token
+
+
+def test_verified_claims_are_cached_per_token(monkeypatch):
+    tokens.clear_token_cache()
+    decoded = []
+    real_decode = tokens.decode_token
+    monkeypatch.setattr(tokens, "decode_token", lambda token: decoded.append(token) or real_decode(token))
+
+    token = create_access_token({"sub": "cached@test.com"})
+    assert verify_token(token)["sub"] == "cached@test.com"
+    assert verify_token(token)["sub"] == "cached@test.com"
+    assert decoded == [token]
+
+    other = create_access_token({"sub": "other@test.com"})
+    assert verify_token(other)["sub"] == "other@test.com"
+    assert decoded == [token, other]
+
+
+def test_cached_claims_expire_with_the_token(monkeypatch):
+    tokens.clear_token_cache()
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    decoded = []
+    real_decode = tokens.decode_token
+    monkeypatch.setattr(tokens, "decode_token", lambda token: decoded.append(token) or real_decode(token))
+
+    # Expires well before the cache TTL, so the token's exp bounds the entry.
+    token = tokens.encode_token({"sub": "short@test.com", "exp": int(time.time()) + 30})
+    verify_token(token)
+    now[0] += 20
+    verify_token(token)
+    assert len(decoded) == 1
+
+    now[0] += 15
+    verify_token(token)
+    assert len(decoded) == 2
+
+
+def test_invalid_and_expired_tokens_are_rejected_and_not_cached():
+    tokens.clear_token_cache()
+    token = create_access_token({"sub": "tampered@test.com"})
+
+    with pytest.raises(InvalidToken):
+        verify_token(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+    with pytest.raises(InvalidToken):
+        verify_token(tokens.encode_token({"sub": "old@test.com", "exp": int(time.time()) - 5}))
+    assert tokens.token_cache_stats()["size"] == 0
@@ -190,6 +190,9 @@ export default function Dashboard() {
                 onClick={() => navigate(`/projects/${project.id}`)}
               >
                 <strong>{project.name}</strong> ({project.key})
+                <div style={{ fontSize: "12px", color: "#888" }}>
+                  {project.open_issues} open / {project.total_issues} issues
+                </div>
                 {project.description && (
                   <div style={{ fontSize: "13px", color: "#666" }}>
                     {project.description}
@@ -1,4 +1,4 @@
-import { useCallback, useEffect, useState } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
 import { useParams, useNavigate } from "react-router-dom";
 import api from "../api/axios";
 import StatusBadge from "../components/StatusBadge";
@@ -37,55 +37,163 @@ export default function IssueDetail() {
     showToast(err.response?.data?.error?.message || fallbackMessage, "error");
   }, [navigate, showToast]);
 
+  const applyIssue = useCallback((data) => {
+    setIssue(data);
+    setEditForm({
+      title: data.title || "",
+      description: data.description || "",
+      priority: data.priority || "medium"
+    });
+    setInitialLoadFailed(false);
+  }, []);
+
   const fetchIssue = useCallback(async () => {
     try {
       const res = await api.get(`/issues/${issueId}`);
-      setIssue(res.data);
-      setEditForm({
-        title: res.data.title || "",
-        description: res.data.description || "",
-        priority: res.data.priority || "medium"
-      });
-      setInitialLoadFailed(false);
+      applyIssue(res.data);
     } catch (err) {
       setInitialLoadFailed(true);
       handleApiError(err, "Failed to load issue");
     }
-  }, [handleApiError, issueId]);
+  }, [applyIssue, handleApiError, issueId]);
+
+  const loadCommentsAfter = useCallback(async (afterId) => {
+    // The thread is served in pages; follow X-Next-After-Id until it runs out.
+    const loaded = [];
+    let cursor = afterId;
+    for (;;) {
+      const params = cursor ? { after_id: cursor } : {};
+      const res = await api.get(`/issues/${issueId}/comments`, { params });
+      loaded.push(...res.data);
+      cursor = res.headers["x-next-after-id"];
+      if (!cursor) return loaded;
+    }
+  }, [issueId]);
 
   const fetchComments = useCallback(async () => {
     try {
-      const res = await api.get(`/issues/${issueId}/comments`);
-      setComments(res.data);
+      setComments(await loadCommentsAfter());
     } catch (err) {
       handleApiError(err, "Failed to load comments");
     }
-  }, [handleApiError, issueId]);
+  }, [handleApiError, loadCommentsAfter]);
 
-  const fetchMembers = useCallback(async () => {
+  const fetchNewComments = async () => {
+    const lastId = comments.length ? comments[comments.length - 1].id : undefined;
     try {
-      const res = await api.get(`/projects/${projectId}/members`);
-      setMembers(res.data);
+      const newer = await loadCommentsAfter(lastId);
+      setComments((prev) => {
+        const known = new Set(prev.map((c) => c.id));
+        return lastId ? [...prev, ...newer.filter((c) => !known.has(c.id))] : newer;
+      });
     } catch (err) {
-      handleApiError(err, "Failed to load members");
+      handleApiError(err, "Failed to load comments");
     }
-  }, [handleApiError, projectId]);
+  };
 
-  const fetchMe = useCallback(async () => {
+  // Issue, first comment page, members and our own role arrive in one request on load.
+  const fetchIssuePage = useCallback(async () => {
     try {
-      const res = await api.get("/me");
-      setCurrentUser(res.data);
+      const res = await api.get(`/issues/${issueId}`, {
+        params: { include: "comments,members,viewer" }
+      });
+      const { comments: firstComments, comments_next_after_id: nextAfterId, members: projectMembers, viewer, ...issueData } = res.data;
+      applyIssue(issueData);
+      setMembers(projectMembers);
+      setCurrentUser(viewer);
+      setComments(nextAfterId ? [...firstComments, ...(await loadCommentsAfter(nextAfterId))] : firstComments);
     } catch (err) {
-      handleApiError(err, "Failed to load current user");
+      setInitialLoadFailed(true);
+      handleApiError(err, "Failed to load issue");
     }
-  }, [handleApiError]);
+  }, [applyIssue, handleApiError, issueId, loadCommentsAfter]);
 
   useEffect(() => {
-    fetchIssue();
-    fetchComments();
-    fetchMembers();
-    fetchMe();
-  }, [fetchComments, fetchIssue, fetchMe, fetchMembers]);
+    fetchIssuePage();
+  }, [fetchIssuePage]);
+
+  const membersRef = useRef(members);
+  membersRef.current = members;
+
+  // Apply other viewers' changes as they happen instead of polling.
+  useEffect(() => {
+    if (!localStorage.getItem("token") || typeof EventSource === "undefined") return undefined;
+
+    let source = null;
+    let retryTimer = null;
+    let stopped = false;
+    let opened = false;
+    const isThisIssue = (id) => String(id) === String(issueId);
+
+    const listen = (stream) => {
+      stream.addEventListener("issue.updated", (message) => {
+        const changed = JSON.parse(message.data);
+        if (!isThisIssue(changed.id)) return;
+        setIssue((prev) => {
+          if (!prev) return prev;
+          const assigneeName = changed.assignee_id === prev.assignee_id
+            ? prev.assignee_name
+            : membersRef.current.find((m) => m.id === changed.assignee_id)?.name ?? null;
+          return { ...prev, ...changed, assignee_name: assigneeName };
+        });
+      });
+      stream.addEventListener("issue.deleted", (message) => {
+        if (!isThisIssue(JSON.parse(message.data).id)) return;
+        showToast("This issue was deleted", "error");
+        navigate(`/projects/${projectId}`);
+      });
+      stream.addEventListener("comment.created", (message) => {
+        const { issue_id: changedIssueId, comment } = JSON.parse(message.data);
+        if (!isThisIssue(changedIssueId)) return;
+        setComments((prev) => (prev.some((c) => c.id === comment.id) ? prev : [...prev, comment]));
+      });
+      stream.addEventListener("resync", () => {
+        fetchIssue();
+        fetchComments();
+      });
+    };
+
+    const reconnectLater = () => {
+      if (!stopped) retryTimer = setTimeout(connect, 3000);
+    };
+
+    // The stream is opened with a short-lived ticket, so every reconnect asks for a new one
+    // instead of letting EventSource retry with an expired URL.
+    const connect = async () => {
+      let ticket;
+      try {
+        ticket = (await api.post(`/projects/${projectId}/events/ticket`)).data.ticket;
+      } catch {
+        reconnectLater();
+        return;
+      }
+      if (stopped) return;
+
+      source = new EventSource(
+        `${api.defaults.baseURL}/projects/${projectId}/events?ticket=${encodeURIComponent(ticket)}`
+      );
+      listen(source);
+      source.onopen = () => {
+        // Events published while we were disconnected are gone; reload what they could have changed.
+        if (opened) {
+          fetchIssue();
+          fetchComments();
+        }
+        opened = true;
+      };
+      source.onerror = () => {
+        source.close();
+        reconnectLater();
+      };
+    };
+    connect();
+
+    return () => {
+      stopped = true;
+      clearTimeout(retryTimer);
+      source?.close();
+    };
+  }, [fetchComments, fetchIssue, issueId, navigate, projectId, showToast]);
 
   const normalizeRole = (role) => {
     if (!role) return "";
@@ -146,7 +254,7 @@ export default function IssueDetail() {
       });
 
       setNewComment("");
-      fetchComments();
+      fetchNewComments();
       showToast("Comment added", "success");
     } catch (err) {
       showToast(